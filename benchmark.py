@@ -0,0 +1,185 @@
+"""
+Mediciones de rendimiento de las operaciones del juego Sixteen
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+import sixteen
+
+TAMANIOS = ((2, 2), (3, 3), (4, 4), (6, 6), (9, 9), (10, 30), (30, 10))
+REPETICIONES = 5
+TOLERANCIA = 0.10
+PRESUPUESTO_ARRANQUE = 0.05
+
+
+def _casos(n_filas: int, n_columnas: int) -> dict[str, tuple[str, dict]]:
+    """Devuelve, para cada operación, el código a medir y su contexto."""
+    contexto = {
+        "sixteen": sixteen,
+        "n_filas": n_filas,
+        "n_columnas": n_columnas,
+        "tablero": sixteen.crear_tablero(n_filas, n_columnas),
+    }
+    return {
+        "crear_tablero": ("sixteen.crear_tablero(n_filas, n_columnas)", contexto),
+        "rotar_izquierda": ("sixteen.rotar_izquierda(tablero, 0)", contexto),
+        "rotar_derecha": ("sixteen.rotar_derecha(tablero, 0)", contexto),
+        "rotar_arriba": ("sixteen.rotar_arriba(tablero, 0)", contexto),
+        "rotar_abajo": ("sixteen.rotar_abajo(tablero, 0)", contexto),
+        "esta_ordenado": (
+            "sixteen.esta_ordenado(ordenado)",
+            {**contexto, "ordenado": sixteen.crear_tablero(n_filas, n_columnas)},
+        ),
+        "mezclar_tablero": ("sixteen.mezclar_tablero(tablero)", contexto),
+    }
+
+
+def medir(
+    tamanios: tuple[tuple[int, int], ...] = TAMANIOS,
+    repeticiones: int = REPETICIONES,
+) -> dict[str, float]:
+    """
+    Mide cada operación de `sixteen` en cada tamaño de tablero.
+
+    Para cada caso se elige con `timeit` una cantidad de llamadas que tarde
+    al menos 0.2 segundos, se repite la medición `repeticiones` veces y se
+    conserva la más rápida, que es la menos afectada por el resto del
+    sistema.
+
+    POSTCONDICIONES:
+        - Devuelve un diccionario de `"operacion[filasxcolumnas]"` a
+        nanosegundos por llamada.
+    """
+    resultados = {}
+    for n_filas, n_columnas in tamanios:
+        for operacion, (codigo, contexto) in _casos(n_filas, n_columnas).items():
+            temporizador = timeit.Timer(codigo, globals=contexto)
+            llamadas, _ = temporizador.autorange()
+            mejor = min(temporizador.repeat(repeticiones, llamadas))
+            resultados[f"{operacion}[{n_filas}x{n_columnas}]"] = mejor / llamadas * 1e9
+    return resultados
+
+
+def comparar(
+    actuales: dict[str, float], base: dict[str, float], tolerancia: float = TOLERANCIA
+) -> list[tuple[str, float, float]]:
+    """
+    Compara mediciones contra una línea de base.
+
+    POSTCONDICIONES:
+        - Devuelve una lista de `(caso, base, actual)` con los casos presentes
+        en ambas mediciones que son más lentos que la base en más de
+        `tolerancia` (una fracción, 0.10 es un 10%).
+    """
+    regresiones = []
+    for caso, actual in actuales.items():
+        if caso in base and actual > base[caso] * (1 + tolerancia):
+            regresiones.append((caso, base[caso], actual))
+    return regresiones
+
+
+def medir_arranque(
+    modulo: str = "main", repeticiones: int = REPETICIONES
+) -> tuple[float, dict[str, float]]:
+    """
+    Mide cuánto tarda en importarse `modulo` en un proceso nuevo, usando
+    `python -X importtime`.
+
+    Se repite la medición `repeticiones` veces y se conserva la corrida más
+    rápida, como en `medir`.
+
+    POSTCONDICIONES:
+        - Devuelve el tiempo de importación de `modulo`, en segundos, y un
+        diccionario con el tiempo acumulado de cada módulo importado en esa
+        corrida (incluidos los que importa a su vez).
+    """
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    mejor = None
+    for _ in range(repeticiones):
+        proceso = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=directorio,
+        )
+        modulos = {}
+        for linea in proceso.stderr.splitlines():
+            partes = linea.removeprefix("import time:").split("|")
+            if len(partes) == 3 and partes[1].strip().isdigit():
+                modulos[partes[2].strip()] = int(partes[1]) / 1e6
+        if mejor is None or modulos[modulo] < mejor[0]:
+            mejor = (modulos[modulo], modulos)
+    return mejor
+
+
+def main() -> None:
+    """Mide las operaciones de `sixteen`, guarda el resultado como JSON y,
+    si se indica una línea de base, informa las regresiones. Con --arranque
+    mide en cambio el tiempo de importación de main.py."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--base", help="archivo JSON de una corrida anterior")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA)
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES)
+    parser.add_argument(
+        "--arranque",
+        action="store_true",
+        help="mide en cambio cuánto tarda en importarse main.py y falla si "
+        "supera el presupuesto",
+    )
+    parser.add_argument(
+        "--presupuesto",
+        type=float,
+        default=PRESUPUESTO_ARRANQUE,
+        help="segundos que puede tardar el arranque con --arranque",
+    )
+    args = parser.parse_args()
+
+    if args.arranque:
+        total, modulos = medir_arranque(repeticiones=args.repeticiones)
+        mas_lentos = sorted(modulos.items(), key=lambda item: item[1], reverse=True)
+        for modulo, segundos in mas_lentos[:10]:
+            print(f"{modulo:<32}{segundos * 1000:>10.1f} ms")
+        if total > args.presupuesto:
+            print(
+                f"REGRESIÓN arranque: {total * 1000:.1f} ms, "
+                f"presupuesto {args.presupuesto * 1000:.1f} ms"
+            )
+            sys.exit(1)
+        return
+
+    resultados = medir(repeticiones=args.repeticiones)
+    for caso, nanosegundos in resultados.items():
+        print(f"{caso:<32}{nanosegundos:>14.1f} ns")
+
+    if args.salida:
+        with open(args.salida, "w") as archivo:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "plataforma": platform.platform(),
+                    "resultados": resultados,
+                },
+                archivo,
+                indent=2,
+            )
+
+    if args.base:
+        with open(args.base) as archivo:
+            base = json.load(archivo)["resultados"]
+        regresiones = comparar(resultados, base, args.tolerancia)
+        for caso, anterior, actual in regresiones:
+            print(f"REGRESIÓN {caso}: {anterior:.1f} ns -> {actual:.1f} ns")
+        if regresiones:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
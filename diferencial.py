@@ -0,0 +1,368 @@
+"""
+Pruebas diferenciales de las implementaciones alternativas del tablero contra
+las funciones de referencia de sixteen
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import sixteen
+
+CASOS = 200
+LARGO = 500
+MAX_LADO = 12
+
+_ROTACIONES = {
+    "w": "rotar_arriba",
+    "a": "rotar_izquierda",
+    "s": "rotar_abajo",
+    "d": "rotar_derecha",
+}
+
+Movimiento = tuple[str, int]
+
+
+class Candidato:
+    """Adaptador de una implementación del tablero para compararla con
+    `sixteen`.
+
+    - `crear(n_filas, n_columnas)` devuelve un tablero ordenado.
+    - `mover(tablero, direccion, indice)` aplica un movimiento y devuelve el
+    tablero resultante (el mismo, si la implementación es mutable) y si el
+    movimiento era válido.
+    - `a_lista(tablero)` devuelve el tablero como lista de listas.
+    - `esta_ordenado(tablero)` es el equivalente de `sixteen.esta_ordenado`.
+    """
+
+    __slots__ = ("nombre", "crear", "mover", "a_lista", "esta_ordenado")
+
+    def __init__(
+        self,
+        nombre: str,
+        crear: Callable[[int, int], Any],
+        mover: Callable[[Any, str, int], tuple[Any, bool]],
+        a_lista: Callable[[Any], list[list[int]]],
+        esta_ordenado: Callable[[Any], bool],
+    ):
+        self.nombre = nombre
+        self.crear = crear
+        self.mover = mover
+        self.a_lista = a_lista
+        self.esta_ordenado = esta_ordenado
+
+
+def _referencia() -> Candidato:
+    def mover(tablero, direccion, indice):
+        return tablero, sixteen.mover(tablero, direccion, indice)
+
+    return Candidato(
+        "sixteen",
+        sixteen.crear_tablero,
+        mover,
+        lambda tablero: tablero,
+        sixteen.esta_ordenado,
+    )
+
+
+def _inmutable(nombre: str, clase: type) -> Candidato:
+    """Candidato para las clases cuyo `aplicar` devuelve un tablero nuevo o
+    `None`."""
+
+    def mover(tablero, direccion, indice):
+        nuevo = tablero.aplicar(direccion, indice)
+        if nuevo is None:
+            return tablero, False
+        return nuevo, True
+
+    return Candidato(
+        nombre,
+        clase.ordenado,
+        mover,
+        lambda tablero: tablero.a_lista(),
+        lambda tablero: tablero.esta_ordenado(),
+    )
+
+
+def _permutaciones() -> Candidato:
+    import permutaciones
+
+    def crear(n_filas, n_columnas):
+        return (
+            n_filas,
+            n_columnas,
+            list(range(1, n_filas * n_columnas + 1)),
+        )
+
+    def mover(tablero, direccion, indice):
+        n_filas, n_columnas, valores = tablero
+        tabla = permutaciones.tabla_movimientos(n_filas, n_columnas)
+        permutacion = tabla.get((direccion, indice))
+        if permutacion is None:
+            return tablero, False
+        return (n_filas, n_columnas, [valores[k] for k in permutacion]), True
+
+    def a_lista(tablero):
+        _, n_columnas, valores = tablero
+        return [valores[i : i + n_columnas] for i in range(0, len(valores), n_columnas)]
+
+    def esta_ordenado(tablero):
+        return tablero[2] == list(range(1, len(tablero[2]) + 1))
+
+    return Candidato("permutaciones", crear, mover, a_lista, esta_ordenado)
+
+
+def _tablero_grande() -> Candidato:
+    import tablero_grande
+
+    def mover(tablero, direccion, indice):
+        rotacion = _ROTACIONES.get(direccion)
+        if rotacion is None:
+            return tablero, False
+        return tablero, getattr(tablero, rotacion)(indice)
+
+    return Candidato(
+        "tablero_grande",
+        tablero_grande.TableroGrande,
+        mover,
+        lambda tablero: tablero.a_lista(),
+        lambda tablero: tablero.esta_ordenado(),
+    )
+
+
+def _lote() -> Candidato:
+    import lote
+
+    def mover(tablero, direccion, indice):
+        rotacion = _ROTACIONES.get(direccion)
+        if rotacion is None:
+            return tablero, False
+        return tablero, getattr(lote, rotacion)(tablero, indice)
+
+    return Candidato(
+        "lote",
+        lambda n_filas, n_columnas: lote.crear_lote(1, n_filas, n_columnas),
+        mover,
+        lambda tablero: lote.a_tableros(tablero)[0],
+        lambda tablero: bool(lote.esta_ordenado(tablero)[0]),
+    )
+
+
+def candidatos() -> list[Candidato]:
+    """Devuelve los adaptadores de todas las implementaciones alternativas
+    del tablero que hay en el proyecto."""
+    import tablero_compacto
+    import tablero_persistente
+
+    return [
+        _inmutable("tablero_compacto", tablero_compacto.TableroCompacto),
+        _permutaciones(),
+        _tablero_grande(),
+        _inmutable("tablero_persistente", tablero_persistente.TableroPersistente),
+        _lote(),
+    ]
+
+
+def generar_caso(
+    generador: random.Random, max_lado: int = MAX_LADO, largo: int = LARGO
+) -> tuple[int, int, list[Movimiento]]:
+    """
+    Genera una forma de tablero y una secuencia de `largo` movimientos al
+    azar. Algunos movimientos usan índices fuera del tablero, para comparar
+    también cómo se rechazan.
+
+    POSTCONDICIONES:
+        - Devuelve `(n_filas, n_columnas, movimientos)`, con ambos lados
+        entre 1 y `max_lado`.
+    """
+    n_filas = generador.randint(1, max_lado)
+    n_columnas = generador.randint(1, max_lado)
+    limite = max(n_filas, n_columnas)
+    movimientos = [
+        (generador.choice("wasd"), generador.randint(0, limite)) for _ in range(largo)
+    ]
+    return n_filas, n_columnas, movimientos
+
+
+def diverge(
+    candidato: Candidato, n_filas: int, n_columnas: int, movimientos: list[Movimiento]
+) -> bool:
+    """Aplica `movimientos` con `candidato` y con `sixteen` a la vez e indica
+    si en algún paso difieren la validez del movimiento, el tablero o
+    `esta_ordenado`."""
+    referencia = sixteen.crear_tablero(n_filas, n_columnas)
+    tablero = candidato.crear(n_filas, n_columnas)
+    if candidato.a_lista(tablero) != referencia:
+        return True
+    for direccion, indice in movimientos:
+        valido = sixteen.mover(referencia, direccion, indice)
+        tablero, valido_candidato = candidato.mover(tablero, direccion, indice)
+        if (
+            valido != valido_candidato
+            or candidato.a_lista(tablero) != referencia
+            or candidato.esta_ordenado(tablero) != sixteen.esta_ordenado(referencia)
+        ):
+            return True
+    return False
+
+
+def reducir(
+    candidato: Candidato, n_filas: int, n_columnas: int, movimientos: list[Movimiento]
+) -> tuple[int, int, list[Movimiento]]:
+    """
+    Achica un caso en el que `candidato` diverge de `sixteen` hasta uno
+    mínimo que siga divergiendo.
+
+    Primero se quitan tramos de movimientos, empezando por la mitad de la
+    secuencia y siguiendo con tramos cada vez más cortos hasta quitar de a
+    uno; después se bajan los índices de los movimientos y se achica el
+    tablero de a una fila o columna. Se repite mientras siga fallando.
+
+    PRECONDICIONES:
+        - `diverge(candidato, n_filas, n_columnas, movimientos)` es verdadero.
+
+    POSTCONDICIONES:
+        - Devuelve un caso `(n_filas, n_columnas, movimientos)` que diverge y
+        del que no se puede quitar ningún movimiento, bajar ningún índice ni
+        sacar ninguna fila o columna sin que deje de hacerlo.
+    """
+    achicado = True
+    while achicado:
+        achicado = False
+        tramo = max(1, len(movimientos) // 2)
+        while tramo >= 1:
+            inicio = 0
+            while inicio < len(movimientos):
+                prueba = movimientos[:inicio] + movimientos[inicio + tramo :]
+                if diverge(candidato, n_filas, n_columnas, prueba):
+                    movimientos = prueba
+                    achicado = True
+                else:
+                    inicio += tramo
+            tramo //= 2
+
+        for i, (direccion, indice) in enumerate(movimientos):
+            while indice > 0:
+                prueba = (
+                    movimientos[:i] + [(direccion, indice - 1)] + movimientos[i + 1 :]
+                )
+                if not diverge(candidato, n_filas, n_columnas, prueba):
+                    break
+                movimientos = prueba
+                indice -= 1
+                achicado = True
+
+        if n_filas > 1 and diverge(candidato, n_filas - 1, n_columnas, movimientos):
+            n_filas -= 1
+            achicado = True
+        if n_columnas > 1 and diverge(candidato, n_filas, n_columnas - 1, movimientos):
+            n_columnas -= 1
+            achicado = True
+    return n_filas, n_columnas, movimientos
+
+
+def _cronometrar(
+    candidato: Candidato, n_filas: int, n_columnas: int, movimientos: list[Movimiento]
+) -> tuple[float, list[bool], list[list[int]], bool]:
+    """Aplica los movimientos con `candidato` midiendo sólo el tiempo de los
+    movimientos. Devuelve ese tiempo, la validez de cada movimiento, el
+    tablero final y si quedó ordenado."""
+    tablero = candidato.crear(n_filas, n_columnas)
+    mover = candidato.mover
+    validos = []
+    inicio = time.perf_counter()
+    for direccion, indice in movimientos:
+        tablero, valido = mover(tablero, direccion, indice)
+        validos.append(valido)
+    segundos = time.perf_counter() - inicio
+    return (
+        segundos,
+        validos,
+        candidato.a_lista(tablero),
+        candidato.esta_ordenado(tablero),
+    )
+
+
+def comparar(
+    candidatos: list[Candidato],
+    casos: int = CASOS,
+    largo: int = LARGO,
+    max_lado: int = MAX_LADO,
+    semilla: int | None = None,
+) -> dict[str, dict]:
+    """
+    Corre `casos` casos generados con `generar_caso` en la referencia y en
+    cada candidato.
+
+    Para cada caso se comparan la validez de cada movimiento, el tablero
+    final y `esta_ordenado`; si algo difiere, se confirma paso a paso con
+    `diverge` y se guarda el primer contraejemplo, reducido con `reducir`.
+    Un candidato que ya tiene contraejemplo no se sigue probando.
+
+    POSTCONDICIONES:
+        - Devuelve, para la referencia y para cada candidato, un diccionario
+        con la cantidad de 'movimientos' aplicados, los 'segundos' que
+        tardaron y el 'contraejemplo' `(n_filas, n_columnas, movimientos)`
+        o `None`.
+    """
+    generador = random.Random(semilla)
+    referencia = _referencia()
+    resultados = {
+        candidato.nombre: {"movimientos": 0, "segundos": 0.0, "contraejemplo": None}
+        for candidato in [referencia, *candidatos]
+    }
+
+    for _ in range(casos):
+        n_filas, n_columnas, movimientos = generar_caso(generador, max_lado, largo)
+        segundos, *esperado = _cronometrar(referencia, n_filas, n_columnas, movimientos)
+        resultados[referencia.nombre]["movimientos"] += len(movimientos)
+        resultados[referencia.nombre]["segundos"] += segundos
+
+        for candidato in candidatos:
+            resultado = resultados[candidato.nombre]
+            if resultado["contraejemplo"] is not None:
+                continue
+            segundos, *obtenido = _cronometrar(
+                candidato, n_filas, n_columnas, movimientos
+            )
+            resultado["movimientos"] += len(movimientos)
+            resultado["segundos"] += segundos
+            if obtenido != esperado and diverge(
+                candidato, n_filas, n_columnas, movimientos
+            ):
+                resultado["contraejemplo"] = reducir(
+                    candidato, n_filas, n_columnas, movimientos
+                )
+    return resultados
+
+
+def main() -> None:
+    """Compara todas las implementaciones con `sixteen`, informa el
+    rendimiento de cada una y termina con error si alguna diverge."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--casos", type=int, default=CASOS)
+    parser.add_argument("--largo", type=int, default=LARGO)
+    parser.add_argument("--max-lado", type=int, default=MAX_LADO)
+    parser.add_argument("--semilla", type=int)
+    args = parser.parse_args()
+
+    resultados = comparar(
+        candidatos(), args.casos, args.largo, args.max_lado, args.semilla
+    )
+    hay_divergencias = False
+    for nombre, resultado in resultados.items():
+        por_segundo = resultado["movimientos"] / max(resultado["segundos"], 1e-9)
+        print(f"{nombre:<24}{por_segundo:>14,.0f} movimientos/s")
+        if resultado["contraejemplo"] is not None:
+            hay_divergencias = True
+            n_filas, n_columnas, movimientos = resultado["contraejemplo"]
+            print(f"  DIVERGE en {n_filas}x{n_columnas} con {movimientos}")
+    if hay_divergencias:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
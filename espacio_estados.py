@@ -0,0 +1,228 @@
+"""
+Enumeración completa de los tableros alcanzables en formas chicas de Sixteen
+"""
+
+import argparse
+import os
+import struct
+import tempfile
+from functools import lru_cache
+from math import factorial
+from typing import TYPE_CHECKING
+
+import patrones
+import permutaciones
+
+# numpy se importa recién al construir una tabla: leer una tabla ya
+# guardada con `obtener` y consultarla con `rango` no lo necesita.
+if TYPE_CHECKING:
+    import numpy as np
+
+MAX_CASILLEROS = 10
+SIN_VISITAR = 255
+MAGIA = b"SXED"
+VERSION = 1
+
+_ENCABEZADO = struct.Struct("<4sBBB")
+
+
+def rango(permutacion: list[int] | bytes) -> int:
+    """
+    Devuelve la posición de `permutacion` en el orden lexicográfico de todas
+    las permutaciones de sus valores (su código de Lehmer leído en base
+    factorial).
+
+    PRECONDICIONES:
+        - Los valores de `permutacion` son distintos entre sí.
+
+    POSTCONDICIONES:
+        - Devuelve un entero entre 0 y `factorial(len(permutacion)) - 1`. El
+        tablero ordenado tiene rango 0.
+
+    EJEMPLO:
+        >>> rango([1, 3, 2])
+        1
+    """
+    n = len(permutacion)
+    resultado = 0
+    for i in range(n):
+        actual = permutacion[i]
+        menores = 0
+        for j in range(i + 1, n):
+            menores += permutacion[j] < actual
+        resultado = resultado * (n - i) + menores
+    return resultado
+
+
+def desrango(numero: int, n: int) -> list[int]:
+    """Inversa de `rango`: devuelve la permutación de los números del 1 al
+    `n` que ocupa la posición `numero`."""
+    digitos = []
+    for base in range(1, n + 1):
+        numero, digito = divmod(numero, base)
+        digitos.append(digito)
+
+    disponibles = list(range(1, n + 1))
+    return [disponibles.pop(digito) for digito in reversed(digitos)]
+
+
+def _rangos(estados: "np.ndarray") -> "np.ndarray":
+    """Igual que `rango`, para cada fila de `estados` a la vez."""
+    import numpy as np
+
+    n = estados.shape[1]
+    resultado = np.zeros(len(estados), dtype=np.int64)
+    for i in range(n - 1):
+        menores = (estados[:, i + 1 :] < estados[:, i : i + 1]).sum(axis=1)
+        resultado = resultado * (n - i) + menores
+    return resultado
+
+
+@lru_cache(maxsize=None)
+def distancias(n_filas: int, n_columnas: int) -> bytearray:
+    """
+    Calcula la distancia al orden de todos los tableros de `n_filas` por
+    `n_columnas`, con una búsqueda en anchura desde el tablero ordenado.
+
+    La tabla tiene un byte por permutación, indexado por su `rango`, así que
+    ocupa `factorial(n_filas * n_columnas)` bytes. La frontera de la búsqueda
+    se guarda como un arreglo de numpy y se expande de a un movimiento por
+    vez para todos sus tableros juntos. Se calcula una sola vez por proceso.
+
+    PRECONDICIONES:
+        - `n_filas * n_columnas` es a lo sumo MAX_CASILLEROS.
+
+    POSTCONDICIONES:
+        - Los tableros que no se pueden alcanzar desde el ordenado quedan
+        con SIN_VISITAR.
+    """
+    casilleros = n_filas * n_columnas
+    if casilleros > MAX_CASILLEROS:
+        raise ValueError(
+            f"Un tablero de {casilleros} casilleros tiene demasiados estados"
+        )
+
+    import numpy as np
+
+    tabla = bytearray([SIN_VISITAR]) * factorial(casilleros)
+    vista = np.frombuffer(tabla, dtype=np.uint8)
+    movimientos = [
+        np.array(permutacion, dtype=np.intp)
+        for permutacion in permutaciones.tabla_movimientos(n_filas, n_columnas).values()
+    ]
+
+    vista[0] = 0
+    frontera = np.arange(casilleros, dtype=np.uint8)[np.newaxis]
+    distancia = 0
+    while len(frontera):
+        distancia += 1
+        nuevos = []
+        for permutacion in movimientos:
+            vecinos = frontera[:, permutacion]
+            rangos = _rangos(vecinos)
+            sin_visitar = vista[rangos] == SIN_VISITAR
+            rangos, primeros = np.unique(rangos[sin_visitar], return_index=True)
+            vista[rangos] = distancia
+            nuevos.append(vecinos[sin_visitar][primeros])
+        frontera = np.concatenate(nuevos)
+    return tabla
+
+
+def ruta_por_defecto(n_filas: int, n_columnas: int, directorio: str) -> str:
+    """Ruta del archivo de distancias de una forma de tablero en `directorio`."""
+    return os.path.join(directorio, f"distancias_{n_filas}x{n_columnas}.bin")
+
+
+def guardar(ruta: str, n_filas: int, n_columnas: int, tabla: bytearray) -> None:
+    """Guarda `tabla` en `ruta`. Igual que en `patrones.guardar`, el archivo
+    se escribe con otro nombre y después se renombra."""
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    os.makedirs(directorio, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=directorio)
+    with os.fdopen(descriptor, "wb") as archivo:
+        archivo.write(_ENCABEZADO.pack(MAGIA, VERSION, n_filas, n_columnas))
+        archivo.write(tabla)
+    os.replace(temporal, ruta)
+
+
+def cargar(ruta: str, n_filas: int, n_columnas: int) -> bytearray | None:
+    """Lee la tabla guardada en `ruta`, o devuelve `None` si el archivo no
+    existe o no es una tabla de `n_filas` por `n_columnas`."""
+    try:
+        with open(ruta, "rb") as archivo:
+            datos = bytearray(archivo.read())
+    except FileNotFoundError:
+        return None
+    if len(datos) != _ENCABEZADO.size + factorial(n_filas * n_columnas):
+        return None
+    if _ENCABEZADO.unpack_from(datos) != (MAGIA, VERSION, n_filas, n_columnas):
+        return None
+    del datos[: _ENCABEZADO.size]
+    return datos
+
+
+@lru_cache(maxsize=None)
+def obtener(
+    n_filas: int, n_columnas: int, directorio: str = patrones.DIRECTORIO_PATRONES
+) -> bytearray:
+    """
+    Devuelve la tabla de `distancias` de un tablero de `n_filas` por
+    `n_columnas`, como `patrones.obtener`: se lee del archivo guardado en
+    `directorio` y, si no existe, se construye y se guarda para los
+    siguientes procesos.
+
+    PRECONDICIONES:
+        - `n_filas * n_columnas` es a lo sumo MAX_CASILLEROS.
+    """
+    ruta = ruta_por_defecto(n_filas, n_columnas, directorio)
+    tabla = cargar(ruta, n_filas, n_columnas)
+    if tabla is None:
+        tabla = distancias(n_filas, n_columnas)
+        guardar(ruta, n_filas, n_columnas, tabla)
+    return tabla
+
+
+def distancia(tablero: list[list[int]]) -> int:
+    """Devuelve la mínima cantidad de movimientos para ordenar `tablero`, o
+    SIN_VISITAR si no se puede ordenar.
+
+    PRECONDICIONES:
+        - El tablero tiene a lo sumo MAX_CASILLEROS casilleros.
+    """
+    tabla = distancias(len(tablero), len(tablero[0]))
+    return tabla[rango([valor for fila in tablero for valor in fila])]
+
+
+def numero_de_dios(tabla: bytearray) -> int:
+    """Devuelve la mayor distancia al orden entre los tableros alcanzables."""
+    return max(valor for valor in set(tabla) if valor != SIN_VISITAR)
+
+
+def histograma(tabla: bytearray) -> list[int]:
+    """Devuelve cuántos tableros alcanzables hay a cada distancia del orden,
+    empezando por la distancia 0."""
+    import numpy as np
+
+    cuentas = np.bincount(np.frombuffer(tabla, dtype=np.uint8), minlength=256)
+    return cuentas[: numero_de_dios(tabla) + 1].tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Distribución de distancias de todos los tableros de una forma"
+    )
+    parser.add_argument("filas", type=int)
+    parser.add_argument("columnas", type=int)
+    argumentos = parser.parse_args()
+
+    tabla = distancias(argumentos.filas, argumentos.columnas)
+    cuentas = histograma(tabla)
+    print(f"Tablero de {argumentos.filas}x{argumentos.columnas}")
+    print(f"Tableros alcanzables: {sum(cuentas)} de {len(tabla)}")
+    print(f"Número de Dios: {len(cuentas) - 1}")
+    for distancia_al_orden, cantidad in enumerate(cuentas):
+        print(f"{distancia_al_orden:>3} {cantidad:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Historial de movimientos para deshacer y rehacer en el juego Sixteen
+"""
+
+from array import array
+
+import sixteen
+
+_DIRECCIONES = "wasd"
+_CODIGOS = {direccion: codigo for codigo, direccion in enumerate(_DIRECCIONES)}
+
+INTERVALO_INSTANTANEAS = 256
+MAX_INSTANTANEAS = 32
+MAX_MOVIMIENTOS = 1 << 20
+
+
+def _codificar(direccion: str, indice: int) -> int:
+    """Empaqueta un movimiento en un entero: el índice en los bits altos y
+    la dirección en los dos bits bajos."""
+    return indice << 2 | _CODIGOS[direccion]
+
+
+def _decodificar(codigo: int) -> tuple[str, int]:
+    """Inversa de `_codificar`."""
+    return _DIRECCIONES[codigo & 3], codigo >> 2
+
+
+class Historial:
+    """Movimientos hechos en una partida, para deshacerlos y rehacerlos.
+
+    Cada movimiento se guarda empaquetado en un entero de 4 bytes; deshacerlo
+    es aplicar su inverso, así que no hace falta copiar el tablero en cada
+    paso. Para saltar a un movimiento lejano se guarda además una copia del
+    tablero cada `intervalo` movimientos. Cuando hay más de MAX_INSTANTANEAS
+    copias se descarta una de cada dos y se duplica el intervalo, y cuando
+    hay más de MAX_MOVIMIENTOS movimientos se olvida la mitad más vieja, así
+    que la memoria queda acotada aunque la partida tenga millones de
+    movimientos.
+    """
+
+    __slots__ = ("intervalo", "_movimientos", "_posicion", "_instantaneas")
+
+    def __init__(self, tablero: list[list[int]]):
+        """Crea un historial vacío que empieza en `tablero`. No modifica el
+        tablero."""
+        self.intervalo = INTERVALO_INSTANTANEAS
+        self._movimientos = array("I")
+        self._posicion = 0
+        self._instantaneas = {0: [fila[:] for fila in tablero]}
+
+    def __len__(self) -> int:
+        """Cantidad de movimientos recordados, incluidos los deshechos."""
+        return len(self._movimientos)
+
+    @property
+    def posicion(self) -> int:
+        """Cantidad de movimientos aplicados al tablero actual desde el
+        inicio del historial."""
+        return self._posicion
+
+    @property
+    def ultimo(self) -> tuple[str, int] | None:
+        """Movimiento con el que se llegó al tablero actual desde el anterior
+        del historial, o `None` si se está en el inicio."""
+        if self._posicion == 0:
+            return None
+        return _decodificar(self._movimientos[self._posicion - 1])
+
+    def registrar(self, tablero: list[list[int]], direccion: str, indice: int) -> None:
+        """
+        Agrega al historial un movimiento que se acaba de aplicar sobre
+        `tablero`. Los movimientos deshechos que quedaban para rehacer se
+        descartan.
+
+        PRECONDICIONES:
+            - El movimiento es válido y `tablero` ya lo tiene aplicado.
+        """
+        if self._posicion < len(self._movimientos):
+            del self._movimientos[self._posicion :]
+            for posicion in [p for p in self._instantaneas if p > self._posicion]:
+                del self._instantaneas[posicion]
+
+        self._movimientos.append(_codificar(direccion, indice))
+        self._posicion += 1
+        if self._posicion % self.intervalo == 0:
+            self._instantaneas[self._posicion] = [fila[:] for fila in tablero]
+            if len(self._instantaneas) > MAX_INSTANTANEAS:
+                self._espaciar_instantaneas()
+        if len(self._movimientos) > MAX_MOVIMIENTOS:
+            self._olvidar_principio()
+
+    def _espaciar_instantaneas(self) -> None:
+        """Duplica el intervalo y conserva sólo las copias que caen en
+        múltiplos del nuevo intervalo (y la más vieja)."""
+        self.intervalo *= 2
+        primera = min(self._instantaneas)
+        self._instantaneas = {
+            posicion: tablero
+            for posicion, tablero in self._instantaneas.items()
+            if posicion == primera or posicion % self.intervalo == 0
+        }
+
+    def _olvidar_principio(self) -> None:
+        """Descarta los movimientos anteriores a la primera copia del tablero
+        que esté más allá de la mitad del historial."""
+        mitad = len(self._movimientos) // 2
+        nuevo_inicio = min(p for p in self._instantaneas if p >= mitad)
+        del self._movimientos[:nuevo_inicio]
+        self._posicion -= nuevo_inicio
+        self._instantaneas = {
+            posicion - nuevo_inicio: tablero
+            for posicion, tablero in self._instantaneas.items()
+            if posicion >= nuevo_inicio
+        }
+
+    def deshacer(self) -> tuple[str, int] | None:
+        """Devuelve el movimiento que hay que aplicar para deshacer el último
+        movimiento, o `None` si no queda nada para deshacer. El movimiento
+        deshecho queda disponible para `rehacer`."""
+        if self._posicion == 0:
+            return None
+        self._posicion -= 1
+        direccion, indice = _decodificar(self._movimientos[self._posicion])
+        return sixteen.INVERSOS[direccion], indice
+
+    def rehacer(self) -> tuple[str, int] | None:
+        """Devuelve el último movimiento deshecho, que hay que volver a
+        aplicar, o `None` si no hay nada para rehacer."""
+        if self._posicion == len(self._movimientos):
+            return None
+        self._posicion += 1
+        return _decodificar(self._movimientos[self._posicion - 1])
+
+    def ir_a(self, tablero: list[list[int]], posicion: int) -> None:
+        """
+        Deja `tablero` como estaba luego de los primeros `posicion`
+        movimientos del historial.
+
+        Si la copia guardada más cercana está más cerca que el tablero
+        actual, se parte de ella; así el costo queda acotado por el
+        intervalo entre copias, sin importar cuán lejos esté el destino.
+
+        PRECONDICIONES:
+            - `tablero` es el tablero actual de la partida.
+            - `posicion` está entre 0 y `len(self)`.
+        """
+        desde = max(p for p in self._instantaneas if p <= posicion)
+        if posicion - desde < abs(posicion - self._posicion):
+            for fila, copia in zip(tablero, self._instantaneas[desde]):
+                fila[:] = copia
+            self._posicion = desde
+
+        while self._posicion > posicion:
+            sixteen.mover(tablero, *self.deshacer())
+        while self._posicion < posicion:
+            sixteen.mover(tablero, *self.rehacer())
@@ -0,0 +1,155 @@
+"""
+Contadores y latencias opcionales de las operaciones del módulo sixteen
+"""
+
+import bisect
+import functools
+import time
+from collections.abc import Callable
+
+import sixteen
+
+FUNCIONES = (
+    "rotar_izquierda",
+    "rotar_derecha",
+    "rotar_arriba",
+    "rotar_abajo",
+    "esta_ordenado",
+    "mezclar_tablero",
+)
+# Límites superiores, en segundos, de las cubetas del histograma de
+# latencias. La última cubeta junta todo lo que supere el penúltimo límite.
+LIMITES = (1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 1e-3, 1e-2, float("inf"))
+
+_originales = {}
+
+
+class Metrica:
+    """Cantidad de llamadas, tiempo total e histograma de latencias de una
+    función."""
+
+    __slots__ = ("llamadas", "segundos", "cubetas")
+
+    def __init__(self):
+        self.llamadas = 0
+        self.segundos = 0.0
+        self.cubetas = [0] * len(LIMITES)
+
+    def registrar(self, segundos: float) -> None:
+        """Suma una llamada que tardó `segundos`."""
+        self.llamadas += 1
+        self.segundos += segundos
+        self.cubetas[bisect.bisect_left(LIMITES, segundos)] += 1
+
+
+_metricas = {nombre: Metrica() for nombre in FUNCIONES}
+
+
+def _envolver(funcion: Callable, metrica: Metrica) -> Callable:
+    """Devuelve una versión de `funcion` que registra cada llamada en
+    `metrica`."""
+    reloj = time.perf_counter
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        inicio = reloj()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            metrica.registrar(reloj() - inicio)
+
+    return envoltura
+
+
+def activar() -> None:
+    """
+    Reemplaza las FUNCIONES del módulo `sixteen` por versiones que cuentan
+    sus llamadas y miden cuánto tardan.
+
+    Mientras está desactivada, el módulo `sixteen` tiene sus funciones
+    originales y la instrumentación no cuesta nada. Como las funciones de
+    `sixteen` se llaman entre sí a través del módulo (por ejemplo `mover` o
+    `mezclar_tablero` llaman a las rotaciones), esas llamadas internas
+    también se cuentan.
+
+    POSTCONDICIONES:
+        - Activar una instrumentación ya activa no hace nada.
+    """
+    if _originales:
+        return
+    for nombre in FUNCIONES:
+        original = getattr(sixteen, nombre)
+        _originales[nombre] = original
+        setattr(sixteen, nombre, _envolver(original, _metricas[nombre]))
+
+
+def desactivar() -> None:
+    """Restaura las funciones originales de `sixteen`. Las métricas
+    acumuladas se conservan hasta llamar a `reiniciar`."""
+    for nombre, original in _originales.items():
+        setattr(sixteen, nombre, original)
+    _originales.clear()
+
+
+def esta_activa() -> bool:
+    """Indica si las funciones de `sixteen` están instrumentadas."""
+    return bool(_originales)
+
+
+def reiniciar() -> None:
+    """Pone en cero todas las métricas."""
+    for nombre in FUNCIONES:
+        metrica = _metricas[nombre]
+        metrica.llamadas = 0
+        metrica.segundos = 0.0
+        metrica.cubetas = [0] * len(LIMITES)
+
+
+def instantanea() -> dict[str, dict]:
+    """
+    Devuelve una copia de las métricas de cada función.
+
+    POSTCONDICIONES:
+        - Para cada nombre de FUNCIONES hay un diccionario con 'llamadas',
+        'segundos' (el tiempo total) y 'cubetas', una lista de pares
+        `(limite, cantidad)` con la cantidad de llamadas que tardaron a lo
+        sumo `limite` segundos, acumulada como en Prometheus.
+    """
+    resultado = {}
+    for nombre, metrica in _metricas.items():
+        acumuladas = []
+        total = 0
+        for limite, cantidad in zip(LIMITES, metrica.cubetas):
+            total += cantidad
+            acumuladas.append((limite, total))
+        resultado[nombre] = {
+            "llamadas": metrica.llamadas,
+            "segundos": metrica.segundos,
+            "cubetas": acumuladas,
+        }
+    return resultado
+
+
+def texto_prometheus() -> str:
+    """Devuelve las métricas en el formato de texto de Prometheus, como un
+    histograma `sixteen_operacion_segundos` etiquetado por operación."""
+    lineas = [
+        "# HELP sixteen_operacion_segundos Duración de las operaciones de sixteen.",
+        "# TYPE sixteen_operacion_segundos histogram",
+    ]
+    for nombre, datos in instantanea().items():
+        for limite, cantidad in datos["cubetas"]:
+            le = "+Inf" if limite == float("inf") else repr(limite)
+            lineas.append(
+                f'sixteen_operacion_segundos_bucket{{operacion="{nombre}",le="{le}"}} '
+                f"{cantidad}"
+            )
+        lineas.append(
+            f'sixteen_operacion_segundos_sum{{operacion="{nombre}"}} '
+            f"{datos['segundos']!r}"
+        )
+        lineas.append(
+            f'sixteen_operacion_segundos_count{{operacion="{nombre}"}} '
+            f"{datos['llamadas']}"
+        )
+    return "\n".join(lineas) + "\n"
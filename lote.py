@@ -0,0 +1,145 @@
+"""
+Operaciones vectorizadas del juego Sixteen sobre lotes de tableros
+"""
+
+import numpy as np
+
+import sixteen
+
+
+def crear_lote(n_tableros: int, n_filas: int, n_columnas: int) -> np.ndarray:
+    """
+    Crea un lote de `n_tableros` tableros ordenados, como un arreglo de forma
+    `(n_tableros, n_filas, n_columnas)`. Cada tablero es igual al que devuelve
+    `sixteen.crear_tablero(n_filas, n_columnas)`.
+
+    PRECONDICIONES:
+        - `n_tableros`, `n_filas` y `n_columnas` son enteros positivos.
+    """
+    ordenado = np.arange(1, n_filas * n_columnas + 1, dtype=np.int32)
+    ordenado = ordenado.reshape(n_filas, n_columnas)
+    return np.repeat(ordenado[np.newaxis], n_tableros, axis=0)
+
+
+def desde_tableros(tableros: list[list[list[int]]]) -> np.ndarray:
+    """Arma un lote a partir de tableros del módulo `sixteen`, todos de las
+    mismas dimensiones. No modifica los tableros originales."""
+    return np.array(tableros, dtype=np.int32)
+
+
+def a_tableros(lote: np.ndarray) -> list[list[list[int]]]:
+    """Devuelve los tableros del lote como listas de listas de enteros."""
+    return lote.tolist()
+
+
+def rotar_izquierda(lote: np.ndarray, fila: int) -> bool:
+    """Equivalente a `sixteen.rotar_izquierda` aplicado a todos los tableros
+    del lote. Devuelve `False` sin modificar el lote si `fila` es inválida."""
+    if not 0 <= fila < lote.shape[1]:
+        return False
+    lote[:, fila, :] = np.roll(lote[:, fila, :], -1, axis=1)
+    return True
+
+
+def rotar_derecha(lote: np.ndarray, fila: int) -> bool:
+    """Equivalente a `sixteen.rotar_derecha` aplicado a todos los tableros
+    del lote. Devuelve `False` sin modificar el lote si `fila` es inválida."""
+    if not 0 <= fila < lote.shape[1]:
+        return False
+    lote[:, fila, :] = np.roll(lote[:, fila, :], 1, axis=1)
+    return True
+
+
+def rotar_arriba(lote: np.ndarray, columna: int) -> bool:
+    """Equivalente a `sixteen.rotar_arriba` aplicado a todos los tableros
+    del lote. Devuelve `False` sin modificar el lote si `columna` es
+    inválida."""
+    if not 0 <= columna < lote.shape[2]:
+        return False
+    lote[:, :, columna] = np.roll(lote[:, :, columna], -1, axis=1)
+    return True
+
+
+def rotar_abajo(lote: np.ndarray, columna: int) -> bool:
+    """Equivalente a `sixteen.rotar_abajo` aplicado a todos los tableros
+    del lote. Devuelve `False` sin modificar el lote si `columna` es
+    inválida."""
+    if not 0 <= columna < lote.shape[2]:
+        return False
+    lote[:, :, columna] = np.roll(lote[:, :, columna], 1, axis=1)
+    return True
+
+
+def aplicar_movimientos(
+    lote: np.ndarray, direcciones: np.ndarray, indices: np.ndarray
+) -> None:
+    """Aplica un movimiento distinto a cada tablero del lote en un solo paso.
+
+    PRECONDICIONES:
+        - `direcciones` es un arreglo de largo `len(lote)` con las letras
+        'w', 'a', 's' o 'd' de la interfaz.
+        - `indices` es un arreglo de enteros de largo `len(lote)`, cada uno
+        válido para la dirección correspondiente.
+
+    POSTCONDICIONES:
+        - El tablero `i` del lote queda rotado según `direcciones[i]` e
+        `indices[i]`. El lote se modifica in-place.
+    """
+    n_filas, n_columnas = lote.shape[1], lote.shape[2]
+    filas = np.arange(n_filas)
+    columnas = np.arange(n_columnas)
+
+    for direccion, desplazamiento in (("a", 1), ("d", -1)):
+        elegidos = np.flatnonzero(direcciones == direccion)
+        if elegidos.size:
+            fila = indices[elegidos]
+            origen = (columnas + desplazamiento) % n_columnas
+            lote[elegidos, fila, :] = lote[elegidos, fila][:, origen]
+
+    for direccion, desplazamiento in (("w", 1), ("s", -1)):
+        elegidos = np.flatnonzero(direcciones == direccion)
+        if elegidos.size:
+            columna = indices[elegidos]
+            origen = (filas + desplazamiento) % n_filas
+            lote[elegidos, :, columna] = lote[elegidos, :, columna][:, origen]
+
+
+def esta_ordenado(lote: np.ndarray) -> np.ndarray:
+    """Equivalente a `sixteen.esta_ordenado` para cada tablero del lote.
+    Devuelve un arreglo de booleanos de largo `len(lote)`."""
+    n_filas, n_columnas = lote.shape[1], lote.shape[2]
+    ordenado = np.arange(1, n_filas * n_columnas + 1).reshape(n_filas, n_columnas)
+    return (lote == ordenado).all(axis=(1, 2))
+
+
+def mezclar_lote(
+    lote: np.ndarray,
+    iteraciones: int = sixteen.ITERACIONES_RANDOM,
+    generador: np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    Equivalente a `sixteen.mezclar_tablero` para cada tablero del lote: en
+    cada iteración elige una fila y una columna al azar, distintas para cada
+    tablero, y aplica las mismas cuatro rotaciones que la versión escalar.
+
+    PRECONDICIONES:
+        - `generador` es `None` o un `np.random.Generator`; pasar uno con
+        semilla fija hace la mezcla reproducible.
+
+    POSTCONDICIONES:
+        - El lote se modifica in-place y además se devuelve.
+    """
+    if generador is None:
+        generador = np.random.default_rng()
+    n_tableros, n_filas, n_columnas = lote.shape
+    for _ in range(iteraciones):
+        filas = generador.integers(0, n_filas, n_tableros)
+        columnas = generador.integers(0, n_columnas, n_tableros)
+        for direccion, indices in (
+            ("a", filas),
+            ("w", columnas),
+            ("d", filas),
+            ("s", columnas),
+        ):
+            aplicar_movimientos(lote, np.full(n_tableros, direccion), indices)
+    return lote
@@ -2,9 +2,24 @@
 Interfaz e interacción con el usuario para el juego Sixteen
 """
 
+import argparse
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from typing import TextIO
+
+import pantalla
 import sixteen
 
+# El resto de los módulos (`random`, `historial`, `pistas`, `registro`) se
+# importan dentro de las funciones que los necesitan: así reproducir una
+# partida o validar movimientos no paga la carga del juego interactivo, y
+# las pistas sólo cargan sus tablas si se piden.
+
 PAD = 3
+PISTA = "h"
+DESHACER = "u"
+REHACER = "r"
+COMANDOS = (PISTA, DESHACER, REHACER)
 
 
 def pedir_entero(mensaje: str) -> int:
@@ -21,17 +36,26 @@ def pedir_entero(mensaje: str) -> int:
         - La función no retorna hasta que se ingrese un valor válido.
     """
     op = input(mensaje)
-    while not op.isdigit() or int(op) <= 0:
+    while not (op.isascii() and op.isdigit()) or int(op) <= 0:
         op = input("Entrada erronea, vuelva a ingresar un numero: ")
     return int(op)
 
 
-def pedir_movimiento(mensaje: str) -> tuple[str, int] | None:
+def pedir_movimiento(
+    mensaje: str,
+    leer: Callable[[str], str] = input,
+    interpretar: Callable[[str], tuple[str, int] | str] | None = None,
+) -> tuple[str, int] | str | None:
     """Solicita al usuario un movimiento en formato 'n,direccion' y valida la entrada.
 
     Formato esperado: 'n,direccion' donde n es un índice y direccion es w/a/s/d.
     Las direcciones válidas son: w (arriba), a (izquierda), s (abajo), d (derecha).
-    El índice debe ser un entero no negativo. Ingresar 'q' permite salir.
+    El índice debe ser un entero no negativo. Ingresar 'q' permite salir,
+    'h' pide una pista, 'u' deshace el último movimiento y 'r' lo rehace.
+
+    La línea se lee con `leer` y se interpreta con `interpretar` (por
+    defecto, `interpretar_movimiento`); se pueden reemplazar, por ejemplo,
+    para medir cada paso por separado.
 
     PRECONDICIONES:
         - `mensaje` es una cadena de texto que se muestra al usuario.
@@ -39,28 +63,63 @@ def pedir_movimiento(mensaje: str) -> tuple[str, int] | None:
     POSTCONDICIONES:
         - Si la entrada es válida, devuelve una tupla (direccion, n).
         - Si se ingresa 'q', devuelve None.
+        - Si se ingresa uno de los COMANDOS ('h', 'u' o 'r'), lo devuelve.
         - La función no retorna hasta que se ingrese un valor válido o 'q'.
     """
+    interpretar = interpretar or interpretar_movimiento
     while True:
-        op = input(mensaje)
+        op = leer(mensaje)
         if op == "q":
             return
+        if op in COMANDOS:
+            return op
 
-        entrada = op.split(",")
-        if len(entrada) != 2:
-            print("Cantidad de argumentos erronea, se esperaban dos")
+        movimiento = interpretar(op)
+        if isinstance(movimiento, str):
+            print(movimiento)
             continue
 
-        n, direccion = entrada
-        if not n.isdigit() or not int(n) >= 0:
-            print("El índice especificado no es un entero positivo")
-            continue
+        return movimiento
 
-        if direccion not in "wasd":
-            print("Dirección desconocida")
-            continue
 
-        return direccion, int(n)
+def mostrar_pista(
+    tablero: list[list[int]], anterior: tuple[str, int] | None = None
+) -> None:
+    """Muestra el próximo movimiento sugerido para ordenar el tablero, en el
+    mismo formato 'n,direccion' en que se ingresan los movimientos. Si se
+    indica el último movimiento, `anterior`, la pista evita deshacerlo (ver
+    `pistas.sugerir`)."""
+    import pistas
+
+    movimiento = pistas.sugerir(tablero, anterior)
+    if movimiento is not None:
+        direccion, n = movimiento
+        print(f"Pista: {n},{direccion}")
+
+
+def interpretar_movimiento(op: str) -> tuple[str, int] | str:
+    """Interpreta un movimiento en formato 'n,direccion'.
+
+    PRECONDICIONES:
+        - `op` es una cadena de texto, sin el salto de línea final.
+
+    POSTCONDICIONES:
+        - Si el movimiento es válido, devuelve una tupla (direccion, n).
+        - Caso contrario, devuelve el mensaje de error para el usuario.
+    """
+    entrada = op.split(",")
+    if len(entrada) != 2:
+        return "Cantidad de argumentos erronea, se esperaban dos"
+
+    n, direccion = entrada
+    # `isdigit` también acepta dígitos como '²' que `int` no sabe leer.
+    if not (n.isascii() and n.isdigit()):
+        return "El índice especificado no es un entero positivo"
+
+    if direccion not in ("w", "a", "s", "d"):
+        return "Dirección desconocida"
+
+    return direccion, int(n)
 
 
 def mostrar_tablero(tablero: list[list[int]]) -> None:
@@ -69,7 +128,7 @@ def mostrar_tablero(tablero: list[list[int]]) -> None:
     El tablero se muestra con índices de columnas en la parte superior,
     índices de filas en el lado izquierdo, y cada celda centrada con
     un ancho de PAD caracteres. Usa separadores visuales para mejorar
-    la legibilidad.
+    la legibilidad. Todo el tablero se imprime con una única llamada.
 
     PRECONDICIONES:
         - `tablero` es una lista de listas de enteros de cualquier dimensión.
@@ -78,20 +137,12 @@ def mostrar_tablero(tablero: list[list[int]]) -> None:
         - La función imprime el tablero en la consola.
         - No modifica el tablero original.
     """
-    indice = []
-    for col in range(len(tablero[0])):
-        indice.append(str(col).center(PAD))
-    print(" " * PAD + "|" + "|".join(indice))
-    print(" " * PAD + "=" * len(tablero[0]) * (PAD + 1))
+    print("\n".join(pantalla.formatear_tablero(tablero, PAD)))
 
-    for fil in range(len(tablero)):
-        fila = []
-        for col in range(len(tablero[fil])):
-            fila.append(str(tablero[fil][col]).center(PAD))
-        print(str(fil).center(PAD) + "‖" + "|".join(fila))
 
-
-def aplicar_movimiento(tablero: list[list[int]], direccion: str, n: int) -> None:
+def aplicar_movimiento(
+    tablero: list[list[int]], direccion: str, n: int, desordenados: int | None = None
+) -> int | None:
     """Aplica un movimiento de rotación al tablero según la dirección e índice especificados.
 
     Las direcciones de rotación son:
@@ -104,23 +155,157 @@ def aplicar_movimiento(tablero: list[list[int]], direccion: str, n: int) -> None
         - `tablero` es una lista de listas de enteros de cualquier dimensión.
         - `direccion` es una de las letras: 'w', 'a', 's', 'd'.
         - `n` es un entero que representa el índice de fila o columna.
+        - `desordenados`, si se indica, es la cantidad de casilleros
+        desordenados del tablero.
 
     POSTCONDICIONES:
         - Si el índice es válido, se aplica la rotación al tablero.
         - Si el índice es inválido, se muestra un mensaje de error.
         - El tablero se modifica in-place si la operación es exitosa.
+        - Si se indicó `desordenados`, devuelve la cantidad de casilleros
+        desordenados luego del movimiento; si no, devuelve `None`.
     """
-    aplicado = True
-    if direccion == "w":
-        aplicado = sixteen.rotar_arriba(tablero, n)
-    if direccion == "s":
-        aplicado = sixteen.rotar_abajo(tablero, n)
-    if direccion == "a":
-        aplicado = sixteen.rotar_izquierda(tablero, n)
-    if direccion == "d":
-        aplicado = sixteen.rotar_derecha(tablero, n)
-    if not aplicado:
+    if desordenados is None:
+        if not sixteen.mover(tablero, direccion, n):
+            print("Indice invalido")
+        return None
+
+    nuevos_desordenados = sixteen.mover_contando(tablero, direccion, n, desordenados)
+    if nuevos_desordenados is None:
         print("Indice invalido")
+        return desordenados
+    return nuevos_desordenados
+
+
+def leer_movimientos(
+    archivo: TextIO, tablero: list[list[int]] | None = None
+) -> Iterator[tuple[str, int]]:
+    """Lee movimientos en formato 'n,direccion', uno por línea, a medida que
+    se van consumiendo.
+
+    Las líneas vacías se ignoran y una línea 'q' termina la lectura. Las
+    líneas inválidas se informan por la salida de errores y se saltean. Si
+    se indica `tablero`, también se saltean (e informan) los movimientos con
+    un índice fuera de él; como cada línea se valida recién al pedirla, el
+    tablero puede ir cambiando mientras se leen los movimientos.
+
+    POSTCONDICIONES:
+        - Devuelve un iterador de tuplas (direccion, n).
+    """
+    for numero, linea in enumerate(archivo, 1):
+        linea = linea.strip()
+        if not linea:
+            continue
+        if linea == "q":
+            return
+
+        movimiento = interpretar_movimiento(linea)
+        if isinstance(movimiento, str):
+            print(f"Línea {numero}: {movimiento}", file=sys.stderr)
+            continue
+        if tablero is not None and not sixteen.es_movimiento_valido(
+            tablero, *movimiento
+        ):
+            print(f"Línea {numero}: Indice invalido", file=sys.stderr)
+            continue
+
+        yield movimiento
+
+
+def reproducir(
+    tablero: list[list[int]], movimientos: Iterable[tuple[str, int]]
+) -> tuple[int, int]:
+    """Aplica los movimientos sobre el tablero con `aplicar_movimiento`, sin
+    mostrar el tablero entre movimiento y movimiento.
+
+    POSTCONDICIONES:
+        - El tablero se modifica in-place.
+        - Devuelve la cantidad de movimientos aplicados (los de índice
+        inválido no cuentan) y la cantidad de casilleros desordenados que
+        quedaron.
+    """
+    desordenados = sixteen.contar_desordenados(tablero)
+    cantidad = 0
+    for direccion, n in movimientos:
+        if not sixteen.es_movimiento_valido(tablero, direccion, n):
+            continue
+        desordenados = aplicar_movimiento(tablero, direccion, n, desordenados)
+        cantidad += 1
+    return cantidad, desordenados
+
+
+def modo_reproduccion(argumentos: argparse.Namespace) -> None:
+    """Reproduce una partida sin interacción, leyendo los movimientos del
+    archivo indicado en `--reproducir` (o de la entrada estándar si es '-'),
+    y muestra sólo el estado final."""
+    tablero = sixteen.crear_tablero(argumentos.filas, argumentos.columnas)
+    if argumentos.semilla is not None:
+        import random
+
+        sixteen.mezclar_tablero(tablero, random.Random(argumentos.semilla))
+
+    if argumentos.reproducir == "-":
+        cantidad, desordenados = reproducir(
+            tablero, leer_movimientos(sys.stdin, tablero)
+        )
+    else:
+        with open(argumentos.reproducir) as archivo:
+            cantidad, desordenados = reproducir(
+                tablero, leer_movimientos(archivo, tablero)
+            )
+
+    mostrar_tablero(tablero)
+    print(f"Movimientos: {cantidad}")
+    print(f"Ordenado: {'si' if desordenados == 0 else 'no'}")
+
+
+def leer_argumentos() -> argparse.Namespace:
+    """Interpreta las opciones de línea de comandos del juego."""
+    parser = argparse.ArgumentParser(description="Juego Sixteen")
+    parser.add_argument(
+        "--plano",
+        action="store_true",
+        help="imprime el tablero completo en cada movimiento, sin secuencias ANSI",
+    )
+    parser.add_argument(
+        "--reproducir",
+        metavar="ARCHIVO",
+        help="aplica sin interacción los movimientos del archivo ('-' para la "
+        "entrada estándar) y muestra sólo el resultado final",
+    )
+    parser.add_argument("--filas", type=int, default=4, help="alto del tablero")
+    parser.add_argument("--columnas", type=int, default=4, help="ancho del tablero")
+    parser.add_argument(
+        "--semilla",
+        type=int,
+        help="semilla de la mezcla inicial; al reproducir, sin ella se parte del "
+        "tablero ordenado",
+    )
+    parser.add_argument(
+        "--registrar",
+        metavar="ARCHIVO",
+        help="guarda la semilla y los movimientos de la partida en un registro "
+        "binario (ver el módulo `registro`)",
+    )
+    parser.add_argument(
+        "--perfil",
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="ARCHIVO",
+        help="al salir, muestra cuánto tardó cada fase de la partida; si se "
+        "indica ARCHIVO, guarda además en él los datos de cProfile",
+    )
+    argumentos = parser.parse_args()
+    if argumentos.registrar is not None and argumentos.semilla is not None:
+        import registro
+
+        if not registro.MIN_SEMILLA <= argumentos.semilla <= registro.MAX_SEMILLA:
+            parser.error(
+                f"--semilla debe estar entre {registro.MIN_SEMILLA} y "
+                f"{registro.MAX_SEMILLA} para usar --registrar"
+            )
+    return argumentos
 
 
 def main() -> None:
@@ -131,6 +316,11 @@ def main() -> None:
     jugador realizar movimientos hasta ordenar el tablero. Muestra mensaje
     de victoria al completar el juego.
 
+    Si la salida es una terminal y no se usa la opción `--plano`, después de
+    cada movimiento sólo se redibujan los casilleros que cambiaron. Con la
+    opción `--reproducir` no hay interacción: ver `modo_reproduccion`. Con
+    `--registrar`, la partida se guarda en un registro binario.
+
     PRECONDICIONES:
         - No requiere parámetros de entrada.
 
@@ -139,21 +329,99 @@ def main() -> None:
         - Al finalizar, el tablero estará ordenado o el usuario habrá salido.
         - Se valida que todas las entradas del usuario sean correctas.
     """
+    argumentos = leer_argumentos()
+    if argumentos.reproducir is not None:
+        modo_reproduccion(argumentos)
+        return
+
+    import historial
+    import random
+
+    plano = argumentos.plano or not sys.stdout.isatty()
+    if plano:
+        mostrar = mostrar_tablero
+    else:
+        mostrar = pantalla.Pantalla(PAD, "=== Sixteen ===").dibujar
+
+    pedir, aplicar, pista = pedir_movimiento, aplicar_movimiento, mostrar_pista
+    perfil = None
+    if argumentos.perfil is not None:
+        import perfilado
+
+        perfil = perfilado.Perfil(argumentos.perfil or None)
+        # La espera de la entrada es el tiempo que piensa el jugador: se
+        # mide aparte para que no tape al resto de las fases.
+        esperar = perfil.envolver("esperar_entrada", input)
+        interpretar = perfil.envolver("interpretar_movimiento", interpretar_movimiento)
+
+        def pedir(mensaje):
+            return pedir_movimiento(mensaje, esperar, interpretar)
+
+        aplicar = perfil.envolver("aplicar_movimiento", aplicar)
+        mostrar = perfil.envolver("mostrar", mostrar)
+        pista = perfil.envolver("mostrar_pista", pista)
+
     ancho = pedir_entero("Ingrese el ancho del juego: ")
     alto = pedir_entero("Ingrese el alto del juego: ")
     tablero = sixteen.crear_tablero(alto, ancho)
 
-    print("=== Sixteen ===")
-    sixteen.mezclar_tablero(tablero)
-    mostrar_tablero(tablero)
-    while not sixteen.esta_ordenado(tablero):
-        print(f"Direcciones: w (arriba), a (abajo), s (izquierda), d (derecha)")
-        entrada = pedir_movimiento("Ingrese el movimiento <n, dir> o 'q' para salir: ")
-        if not entrada:
-            return
-        direccion, n = entrada
-        aplicar_movimiento(tablero, direccion, n)
-        mostrar_tablero(tablero)
+    semilla = argumentos.semilla
+    escritor = None
+    if argumentos.registrar is not None:
+        import registro
+
+        if max(alto, ancho) > registro.MAX_INDICE + 1:
+            print("El tablero es demasiado grande para registrar la partida")
+        else:
+            if semilla is None:
+                semilla = random.randrange(2**62)
+            escritor = registro.EscritorRegistro(
+                argumentos.registrar, alto, ancho, semilla
+            )
+
+    if plano:
+        print("=== Sixteen ===")
+    generador = None if semilla is None else random.Random(semilla)
+    sixteen.mezclar_tablero(tablero, generador)
+    mostrar(tablero)
+    desordenados = sixteen.contar_desordenados(tablero)
+    historia = historial.Historial(tablero)
+    try:
+        while desordenados:
+            print(f"Direcciones: w (arriba), a (abajo), s (izquierda), d (derecha)")
+            entrada = pedir(
+                "Ingrese el movimiento <n, dir>, 'h' para una pista, "
+                "'u'/'r' para deshacer/rehacer o 'q' para salir: "
+            )
+            if not entrada:
+                return
+            if entrada == PISTA:
+                pista(tablero, historia.ultimo)
+                continue
+            if entrada == DESHACER:
+                movimiento = historia.deshacer()
+            elif entrada == REHACER:
+                movimiento = historia.rehacer()
+            else:
+                movimiento = entrada
+            if movimiento is None:
+                print("No hay movimientos para deshacer o rehacer")
+                continue
+
+            direccion, n = movimiento
+            valido = sixteen.es_movimiento_valido(tablero, direccion, n)
+            if escritor is not None and valido:
+                escritor.registrar(direccion, n)
+            desordenados = aplicar(tablero, direccion, n, desordenados)
+            if valido and entrada not in COMANDOS:
+                historia.registrar(tablero, direccion, n)
+            mostrar(tablero)
+    finally:
+        if escritor is not None:
+            escritor.cerrar()
+        if perfil is not None:
+            perfil.cerrar()
+            print("\n".join(perfil.resumen()), file=sys.stderr)
 
     print("Ganaste! :)")
 
@@ -0,0 +1,179 @@
+"""
+Tableros de Sixteen en memoria compartida entre procesos
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import lote as operaciones_lote
+
+
+def _tipo(n_filas: int, n_columnas: int) -> np.dtype:
+    """Tipo de numpy más chico en el que entran los valores del tablero."""
+    casilleros = n_filas * n_columnas
+    if casilleros <= np.iinfo(np.uint8).max:
+        return np.dtype(np.uint8)
+    if casilleros <= np.iinfo(np.uint16).max:
+        return np.dtype(np.uint16)
+    return np.dtype(np.int32)
+
+
+class AlmacenCompartido:
+    """Conjunto de tableros de iguales dimensiones guardado en un bloque de
+    `multiprocessing.shared_memory`.
+
+    Los tableros ocupan un arreglo de forma `(n_tableros, n_filas,
+    n_columnas)`, con el tipo entero más chico que alcance, igual que los
+    lotes del módulo `lote`. `lote()` devuelve vistas de ese arreglo sin
+    copiarlo, así que `lote.rotar_izquierda`, `lote.aplicar_movimientos`,
+    `lote.esta_ordenado` y las demás operan directamente sobre la memoria
+    compartida. Al enviar el almacén a otro proceso (por ejemplo como
+    argumento de un `ProcessPoolExecutor`) sólo viaja el nombre del bloque:
+    el proceso que lo recibe se conecta al mismo bloque, y la memoria total
+    no crece con la cantidad de procesos.
+
+    Quien crea el almacén con `crear` es responsable de llamar a `liberar`
+    (o de usarlo con `with`); los procesos conectados sólo lo cierran.
+    """
+
+    __slots__ = (
+        "n_tableros",
+        "n_filas",
+        "n_columnas",
+        "tableros",
+        "_memoria",
+        "_dueno",
+    )
+
+    def __init__(
+        self,
+        memoria: shared_memory.SharedMemory,
+        n_tableros: int,
+        n_filas: int,
+        n_columnas: int,
+        dueno: bool,
+    ):
+        """Envuelve un bloque ya creado. Para obtener un almacén usar `crear`
+        o `conectar`."""
+        self.n_tableros = n_tableros
+        self.n_filas = n_filas
+        self.n_columnas = n_columnas
+        self.tableros = np.ndarray(
+            (n_tableros, n_filas, n_columnas),
+            dtype=_tipo(n_filas, n_columnas),
+            buffer=memoria.buf,
+        )
+        self._memoria = memoria
+        self._dueno = dueno
+
+    @classmethod
+    def crear(
+        cls,
+        n_tableros: int,
+        n_filas: int,
+        n_columnas: int,
+        tableros: list[list[list[int]]] | None = None,
+    ) -> "AlmacenCompartido":
+        """
+        Crea un bloque de memoria compartida con `n_tableros` tableros.
+
+        PRECONDICIONES:
+            - `tableros`, si se indica, tiene `n_tableros` tableros del módulo
+            `sixteen` de `n_filas` por `n_columnas`.
+
+        POSTCONDICIONES:
+            - Los tableros quedan iguales a `tableros`, o ordenados como los
+            de `sixteen.crear_tablero` si no se indica.
+        """
+        tamanio = (
+            n_tableros * n_filas * n_columnas * _tipo(n_filas, n_columnas).itemsize
+        )
+        memoria = shared_memory.SharedMemory(create=True, size=max(1, tamanio))
+        almacen = cls(memoria, n_tableros, n_filas, n_columnas, dueno=True)
+        if tableros is None:
+            almacen.tableros[:] = operaciones_lote.crear_lote(
+                n_tableros, n_filas, n_columnas
+            )
+        else:
+            almacen.tableros[:] = tableros
+        return almacen
+
+    @classmethod
+    def conectar(
+        cls, nombre: str, n_tableros: int, n_filas: int, n_columnas: int
+    ) -> "AlmacenCompartido":
+        """Se conecta a un bloque creado por `crear` en otro proceso."""
+        memoria = shared_memory.SharedMemory(name=nombre)
+        return cls(memoria, n_tableros, n_filas, n_columnas, dueno=False)
+
+    @property
+    def nombre(self) -> str:
+        """Nombre del bloque de memoria compartida."""
+        return self._memoria.name
+
+    def __reduce__(self):
+        return (
+            AlmacenCompartido.conectar,
+            (self.nombre, self.n_tableros, self.n_filas, self.n_columnas),
+        )
+
+    def __len__(self) -> int:
+        return self.n_tableros
+
+    def lote(self, desde: int = 0, hasta: int | None = None) -> np.ndarray:
+        """Devuelve, sin copiarlos, los tableros de `desde` a `hasta` (sin
+        incluirlo) como un lote del módulo `lote`. Modificar el lote modifica
+        la memoria compartida."""
+        return self.tableros[desde:hasta]
+
+    def a_lista(self, indice: int) -> list[list[int]]:
+        """Devuelve una copia del tablero `indice` como lista de listas."""
+        return self.tableros[indice].tolist()
+
+    def cerrar(self) -> None:
+        """Deja de usar el bloque en este proceso. Las vistas obtenidas con
+        `lote` no deben usarse después."""
+        self.tableros = None
+        self._memoria.close()
+
+    def liberar(self) -> None:
+        """Cierra el bloque y, si este proceso lo creó, lo elimina."""
+        self.cerrar()
+        if self._dueno:
+            self._memoria.unlink()
+
+    def __enter__(self) -> "AlmacenCompartido":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.liberar()
+
+
+def _contar_ordenados(almacen: AlmacenCompartido, desde: int, hasta: int) -> int:
+    """Tarea de cada proceso: cuántos tableros del tramo están ordenados."""
+    try:
+        return int(operaciones_lote.esta_ordenado(almacen.lote(desde, hasta)).sum())
+    finally:
+        almacen.cerrar()
+
+
+def contar_ordenados(almacen: AlmacenCompartido, procesos: int | None = None) -> int:
+    """
+    Cuenta los tableros ordenados del almacén repartiendo el trabajo en
+    `procesos` procesos (por defecto, uno por CPU), que leen los tableros
+    directamente de la memoria compartida.
+
+    POSTCONDICIONES:
+        - Devuelve lo mismo que `lote.esta_ordenado(almacen.lote()).sum()`.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    tramo = max(1, -(-len(almacen) // procesos))
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        tareas = [
+            ejecutor.submit(_contar_ordenados, almacen, desde, desde + tramo)
+            for desde in range(0, len(almacen), tramo)
+        ]
+        return sum(tarea.result() for tarea in tareas)
@@ -0,0 +1,139 @@
+"""
+Generación reproducible de mezclas para el juego Sixteen
+"""
+
+import random
+from collections.abc import Iterator
+
+import permutaciones
+import sixteen
+
+PROFUNDIDAD_MEZCLA = 20
+
+
+def generar_movimientos(
+    n_filas: int, n_columnas: int, profundidad: int, generador: random.Random
+) -> list[tuple[str, int]]:
+    """
+    Genera `profundidad` movimientos al azar para un tablero de `n_filas` por
+    `n_columnas`, sin movimientos que se cancelen con los inmediatamente
+    anteriores.
+
+    Se descartan el inverso del movimiento anterior, las repeticiones de un
+    mismo movimiento que completarían una vuelta entera de su línea, y las
+    rotaciones de líneas de largo uno, que no cambian el tablero.
+
+    PRECONDICIONES:
+        - `n_filas` o `n_columnas` es mayor a uno.
+
+    POSTCONDICIONES:
+        - Devuelve una lista de `profundidad` movimientos `(direccion, indice)`
+        con la notación w/a/s/d de la interfaz.
+        - Si el tablero tiene una sola fila o una sola columna, sólo hay una
+        línea para mover y cualquier secuencia más larga que esa línea se
+        repetiría o se cancelaría: se devuelven a lo sumo `largo - 1`
+        repeticiones de un mismo movimiento, donde `largo` es el largo de la
+        línea.
+    """
+    posibles = []
+    if n_columnas > 1:
+        posibles += [(direccion, fila) for fila in range(n_filas) for direccion in "ad"]
+    if n_filas > 1:
+        posibles += [
+            (direccion, columna) for columna in range(n_columnas) for direccion in "ws"
+        ]
+
+    if len(posibles) == 2:
+        movimiento = posibles[generador.randrange(2)]
+        largo = max(n_filas, n_columnas)
+        return [movimiento] * min(profundidad, largo - 1)
+
+    movimientos = []
+    repeticiones = 0
+    while len(movimientos) < profundidad:
+        movimiento = posibles[generador.randrange(len(posibles))]
+        if movimientos:
+            direccion, indice = movimientos[-1]
+            if movimiento == (sixteen.INVERSOS[direccion], indice):
+                continue
+            largo = n_filas if direccion in "ws" else n_columnas
+            if movimiento == movimientos[-1]:
+                if repeticiones + 1 >= largo:
+                    continue
+                repeticiones += 1
+            else:
+                repeticiones = 1
+        else:
+            repeticiones = 1
+        movimientos.append(movimiento)
+
+    return movimientos
+
+
+def _distancia_alcanza(tablero: list[list[int]], distancia_minima: int) -> bool:
+    """Indica si ordenar `tablero` requiere al menos `distancia_minima`
+    movimientos. Sólo busca soluciones más cortas que esa distancia."""
+    if distancia_minima <= 0:
+        return True
+    return sixteen.resolver(tablero, distancia_minima - 1) is None
+
+
+def generar_mezclas(
+    n_filas: int,
+    n_columnas: int,
+    cantidad: int,
+    semilla: int | None = None,
+    profundidad: int = PROFUNDIDAD_MEZCLA,
+    distancia_minima: int = 0,
+) -> Iterator[list[list[int]]]:
+    """
+    Genera `cantidad` tableros mezclados de `n_filas` por `n_columnas`.
+
+    Todas las mezclas salen de un generador de números aleatorios propio,
+    así que la misma `semilla` produce siempre la misma secuencia de
+    tableros, sin depender ni alterar el estado del módulo `random`. Cada
+    mezcla se aplica al tablero ordenado como una única permutación.
+
+    Si `distancia_minima` es mayor a cero, se descartan los tableros que se
+    puedan ordenar en menos movimientos, verificándolo con
+    `sixteen.resolver`. Esta verificación es rápida para tableros chicos y
+    distancias cortas, pero crece exponencialmente con la distancia.
+
+    PRECONDICIONES:
+        - `n_filas` o `n_columnas` es mayor a uno.
+        - `distancia_minima` es alcanzable con `profundidad` movimientos.
+
+    POSTCONDICIONES:
+        - Devuelve un iterador de tableros nuevos, cada uno como una lista de
+        listas de enteros.
+    """
+    generador = random.Random(semilla)
+    generados = 0
+    while generados < cantidad:
+        movimientos = generar_movimientos(n_filas, n_columnas, profundidad, generador)
+        tablero = sixteen.crear_tablero(n_filas, n_columnas)
+        permutaciones.aplicar_movimientos(tablero, movimientos)
+        if not _distancia_alcanza(tablero, distancia_minima):
+            continue
+        generados += 1
+        yield tablero
+
+
+def mezclar(
+    tablero: list[list[int]],
+    semilla: int | None = None,
+    profundidad: int = PROFUNDIDAD_MEZCLA,
+) -> list[tuple[str, int]]:
+    """
+    Mezcla `tablero` in-place con `profundidad` movimientos generados a
+    partir de `semilla`, y devuelve esos movimientos.
+
+    PRECONDICIONES:
+        - `tablero` tiene más de una fila o más de una columna.
+    """
+    generador = random.Random(semilla)
+    movimientos = generar_movimientos(
+        len(tablero), len(tablero[0]), profundidad, generador
+    )
+    permutaciones.aplicar_movimientos(tablero, movimientos)
+    return movimientos
@@ -0,0 +1,72 @@
+"""
+Simplificación de secuencias de movimientos del juego Sixteen
+"""
+
+# Para cada dirección, si mueve filas o columnas y cuánto desplaza la línea.
+_EFECTOS = {
+    "a": ("filas", 1),
+    "d": ("filas", -1),
+    "w": ("columnas", 1),
+    "s": ("columnas", -1),
+}
+_DIRECCIONES = {"filas": ("a", "d"), "columnas": ("w", "s")}
+
+
+def simplificar(
+    n_filas: int, n_columnas: int, movimientos: list[tuple[str, int]]
+) -> list[tuple[str, int]]:
+    """
+    Devuelve una secuencia canónica y más corta equivalente a `movimientos`
+    en un tablero de `n_filas` por `n_columnas`.
+
+    Los movimientos sobre filas distintas conmutan entre sí, igual que los
+    movimientos sobre columnas distintas. Por eso cada tramo de movimientos
+    consecutivos sobre filas (o sobre columnas) se reduce al desplazamiento
+    neto de cada línea, módulo su largo, y se escribe ordenado por índice
+    usando la dirección que requiera menos movimientos ('a' o 'w' en caso de
+    empate). Si un tramo se anula por completo, los tramos vecinos se unen y
+    se siguen simplificando. Se recorre la secuencia una sola vez.
+
+    PRECONDICIONES:
+        - Cada movimiento es una tupla `(direccion, indice)` válida para el
+        tablero, con la notación w/a/s/d de la interfaz.
+
+    POSTCONDICIONES:
+        - Aplicar el resultado deja el tablero igual que aplicar
+        `movimientos`.
+        - Dos secuencias que sólo difieren en el orden de movimientos que
+        conmutan dan el mismo resultado.
+
+    EJEMPLO:
+        >>> simplificar(3, 3, [("a", 2), ("w", 0), ("s", 0), ("a", 0), ("d", 2)])
+        [('a', 0)]
+    """
+    largos = {"filas": n_columnas, "columnas": n_filas}
+    # Cada tramo es [eje, desplazamientos por índice, líneas desplazadas].
+    tramos = []
+    for direccion, indice in movimientos:
+        eje, paso = _EFECTOS[direccion]
+        if not tramos or tramos[-1][0] != eje:
+            tramos.append([eje, {}, 0])
+        tramo = tramos[-1]
+
+        anterior = tramo[1].get(indice, 0)
+        nuevo = (anterior + paso) % largos[eje]
+        tramo[1][indice] = nuevo
+        tramo[2] += (nuevo != 0) - (anterior != 0)
+        if tramo[2] == 0:
+            tramos.pop()
+
+    resultado = []
+    for eje, desplazamientos, _ in tramos:
+        largo = largos[eje]
+        adelante, atras = _DIRECCIONES[eje]
+        for indice in sorted(desplazamientos):
+            desplazamiento = desplazamientos[indice]
+            if desplazamiento == 0:
+                continue
+            if desplazamiento <= largo - desplazamiento:
+                resultado.extend([(adelante, indice)] * desplazamiento)
+            else:
+                resultado.extend([(atras, indice)] * (largo - desplazamiento))
+    return resultado
@@ -0,0 +1,122 @@
+"""
+Dibujo del tablero de Sixteen en la terminal, redibujando sólo lo que cambia
+"""
+
+import sys
+from typing import TextIO
+
+BORRAR_PANTALLA = "\033[H\033[2J"
+BORRAR_HASTA_FIN_DE_LINEA = "\033[K"
+BORRAR_HASTA_FIN_DE_PANTALLA = "\033[J"
+LINEAS_ENCABEZADO = 2
+
+
+def _mover_cursor(linea: int, columna: int) -> str:
+    """Secuencia ANSI que lleva el cursor a `linea` y `columna` (desde 0)."""
+    return f"\033[{linea + 1};{columna + 1}H"
+
+
+def formatear_casilleros(tablero: list[list[int]], ancho: int) -> list[list[str]]:
+    """Devuelve el texto de cada casillero, centrado en `ancho` caracteres."""
+    return [[str(valor).center(ancho) for valor in fila] for fila in tablero]
+
+
+def formatear_tablero(tablero: list[list[int]], ancho: int) -> list[str]:
+    """
+    Devuelve las líneas de texto del tablero: índices de columnas arriba,
+    índices de filas a la izquierda y cada casillero centrado en `ancho`
+    caracteres.
+
+    PRECONDICIONES:
+        - `tablero` es una lista de listas de enteros de cualquier dimensión.
+
+    POSTCONDICIONES:
+        - No modifica el tablero original.
+    """
+    indice = [str(col).center(ancho) for col in range(len(tablero[0]))]
+    lineas = [
+        " " * ancho + "|" + "|".join(indice),
+        " " * ancho + "=" * len(tablero[0]) * (ancho + 1),
+    ]
+    for fil, fila in enumerate(formatear_casilleros(tablero, ancho)):
+        lineas.append(str(fil).center(ancho) + "‖" + "|".join(fila))
+    return lineas
+
+
+class Pantalla:
+    """Dibuja sucesivos estados de un tablero usando secuencias ANSI.
+
+    El primer cuadro se dibuja completo. En los siguientes sólo se
+    reescriben los casilleros que cambiaron respecto del cuadro anterior,
+    posicionando el cursor sobre cada uno, y todo el cuadro se envía con una
+    única escritura. Después de cada cuadro el cursor queda debajo del
+    tablero, para que los mensajes y pedidos de entrada se muestren ahí.
+    """
+
+    __slots__ = ("ancho", "titulo", "salida", "_anterior")
+
+    def __init__(self, ancho: int, titulo: str = "", salida: TextIO = sys.stdout):
+        """Prepara una pantalla con casilleros de `ancho` caracteres. Si se
+        indica `titulo`, se muestra en una línea encima del tablero."""
+        self.ancho = ancho
+        self.titulo = titulo
+        self.salida = salida
+        self._anterior = None
+
+    def _primera_linea(self) -> int:
+        """Línea de la pantalla donde empiezan las filas del tablero."""
+        return LINEAS_ENCABEZADO + (1 if self.titulo else 0)
+
+    def dibujar(self, tablero: list[list[int]]) -> None:
+        """Muestra `tablero`, redibujando sólo lo necesario.
+
+        POSTCONDICIONES:
+            - Si el tablero no cambió desde el cuadro anterior no se escribe
+            nada, así que los mensajes mostrados debajo siguen visibles.
+            - No modifica el tablero original.
+        """
+        casilleros = formatear_casilleros(tablero, self.ancho)
+        anterior = self._anterior
+        if (
+            anterior is None
+            or len(anterior) != len(casilleros)
+            or len(anterior[0]) != len(casilleros[0])
+        ):
+            lineas = formatear_tablero(tablero, self.ancho)
+            if self.titulo:
+                lineas.insert(0, self.titulo)
+            cuadro = BORRAR_PANTALLA + "\n".join(lineas)
+        else:
+            cuadro = self._diferencias(anterior, casilleros)
+            if not cuadro:
+                return
+
+        cuadro += _mover_cursor(self._primera_linea() + len(casilleros), 0)
+        cuadro += BORRAR_HASTA_FIN_DE_PANTALLA
+        self.salida.write(cuadro)
+        self.salida.flush()
+        self._anterior = casilleros
+
+    def _diferencias(
+        self,
+        anterior: list[list[str]],
+        casilleros: list[list[str]],
+    ) -> str:
+        """Arma las secuencias que llevan la pantalla de `anterior` a
+        `casilleros`. Si en una fila cambia el ancho de algún casillero, se
+        reescribe la fila completa."""
+        partes = []
+        for fil, (fila_anterior, fila) in enumerate(zip(anterior, casilleros)):
+            if fila_anterior == fila:
+                continue
+            linea = self._primera_linea() + fil
+            if any(len(texto) != self.ancho for texto in fila + fila_anterior):
+                partes.append(_mover_cursor(linea, 0))
+                partes.append(str(fil).center(self.ancho) + "‖" + "|".join(fila))
+                partes.append(BORRAR_HASTA_FIN_DE_LINEA)
+                continue
+            for col, (texto_anterior, texto) in enumerate(zip(fila_anterior, fila)):
+                if texto_anterior != texto:
+                    partes.append(_mover_cursor(linea, (col + 1) * (self.ancho + 1)))
+                    partes.append(texto)
+        return "".join(partes)
@@ -0,0 +1,215 @@
+"""
+Bases de patrones para acotar la distancia de un tablero de Sixteen al orden
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+
+import permutaciones
+
+MAGIA = b"SXPD"
+VERSION = 1
+TAMANIO_GRUPO = 4
+SIN_VISITAR = 255
+DIRECTORIO_PATRONES = os.path.join(os.path.expanduser("~"), ".cache", "sixteen")
+
+_ENCABEZADO = struct.Struct("<4sBBBB")
+
+_cargadas = {}
+
+
+def grupos_por_defecto(n_filas: int, n_columnas: int) -> list[tuple[int, ...]]:
+    """Reparte las fichas de un tablero en grupos consecutivos de
+    TAMANIO_GRUPO fichas (el último puede quedar más chico)."""
+    fichas = list(range(1, n_filas * n_columnas + 1))
+    return [
+        tuple(fichas[i : i + TAMANIO_GRUPO])
+        for i in range(0, len(fichas), TAMANIO_GRUPO)
+    ]
+
+
+def construir_patron(
+    n_filas: int, n_columnas: int, fichas: tuple[int, ...]
+) -> bytearray:
+    """
+    Calcula, para cada forma de ubicar las `fichas` en el tablero, la
+    cantidad mínima de movimientos necesaria para llevarlas a su lugar,
+    ignorando el resto de las fichas.
+
+    Cada ubicación se indexa como `sum(posicion[i] * casilleros ** i)`, donde
+    `posicion[i]` es el casillero (fila por fila) de `fichas[i]`. Como
+    ordenar el tablero completo también ordena esas fichas, cada valor es una
+    cota inferior admisible de la distancia del tablero al orden.
+
+    PRECONDICIONES:
+        - `fichas` son números distintos entre 1 y `n_filas * n_columnas`.
+        - Ninguna ubicación está a más de 254 movimientos.
+
+    POSTCONDICIONES:
+        - Devuelve una tabla de `casilleros ** len(fichas)` bytes. Las
+        posiciones imposibles (dos fichas en un mismo casillero) quedan con
+        SIN_VISITAR.
+    """
+    casilleros = n_filas * n_columnas
+    potencias = [casilleros**i for i in range(len(fichas))]
+
+    # `destinos[m][j]` es a qué casillero va la ficha del casillero `j` al
+    # aplicar el movimiento `m`.
+    destinos = []
+    for permutacion in permutaciones.tabla_movimientos(n_filas, n_columnas).values():
+        destino = [0] * casilleros
+        for i, origen in enumerate(permutacion):
+            destino[origen] = i
+        destinos.append(destino)
+
+    distancias = bytearray([SIN_VISITAR]) * (casilleros ** len(fichas))
+    inicial = sum((ficha - 1) * potencia for ficha, potencia in zip(fichas, potencias))
+    distancias[inicial] = 0
+    frontera = [inicial]
+    distancia = 0
+
+    while frontera:
+        distancia += 1
+        siguiente_frontera = []
+        for indice in frontera:
+            posiciones = []
+            for _ in fichas:
+                indice, posicion = divmod(indice, casilleros)
+                posiciones.append(posicion)
+            for destino in destinos:
+                vecino = 0
+                for posicion, potencia in zip(posiciones, potencias):
+                    vecino += destino[posicion] * potencia
+                if distancias[vecino] == SIN_VISITAR:
+                    distancias[vecino] = distancia
+                    siguiente_frontera.append(vecino)
+        frontera = siguiente_frontera
+
+    return distancias
+
+
+def guardar(
+    ruta: str,
+    n_filas: int,
+    n_columnas: int,
+    grupos: list[tuple[int, ...]],
+    tablas: list[bytearray],
+) -> None:
+    """
+    Guarda las tablas de `grupos` en `ruta`. El archivo se escribe primero
+    con otro nombre y después se renombra, así que otro proceso nunca ve un
+    archivo a medio escribir.
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    os.makedirs(directorio, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=directorio)
+    with os.fdopen(descriptor, "wb") as archivo:
+        archivo.write(
+            _ENCABEZADO.pack(MAGIA, VERSION, n_filas, n_columnas, len(grupos))
+        )
+        for fichas in grupos:
+            archivo.write(bytes([len(fichas)]) + bytes(fichas))
+        for tabla in tablas:
+            archivo.write(tabla)
+    os.replace(temporal, ruta)
+
+
+class BaseDePatrones:
+    """Conjunto de tablas de patrones de una forma de tablero, leídas de un
+    archivo mapeado en memoria en modo sólo lectura.
+
+    El sistema operativo trae cada página del archivo recién cuando se la
+    consulta, y todos los procesos que abren el mismo archivo comparten
+    esas páginas. Una instancia se puede usar como heurística de
+    `sixteen.resolver`.
+    """
+
+    __slots__ = ("n_filas", "n_columnas", "grupos", "_archivo", "_mapa", "_inicios")
+
+    def __init__(self, ruta: str):
+        """Abre y mapea el archivo de patrones en `ruta`.
+
+        PRECONDICIONES:
+            - `ruta` es un archivo escrito por `guardar`.
+        """
+        self._archivo = open(ruta, "rb")
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, version, n_filas, n_columnas, n_grupos = _ENCABEZADO.unpack_from(
+            self._mapa
+        )
+        if magia != MAGIA or version != VERSION:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un archivo de patrones válido")
+
+        self.n_filas = n_filas
+        self.n_columnas = n_columnas
+        self.grupos = []
+        desplazamiento = _ENCABEZADO.size
+        for _ in range(n_grupos):
+            tamanio = self._mapa[desplazamiento]
+            fichas = self._mapa[desplazamiento + 1 : desplazamiento + 1 + tamanio]
+            self.grupos.append(tuple(fichas))
+            desplazamiento += 1 + tamanio
+
+        self._inicios = []
+        casilleros = n_filas * n_columnas
+        for fichas in self.grupos:
+            self._inicios.append(desplazamiento)
+            desplazamiento += casilleros ** len(fichas)
+
+    def heuristica(self, estado: bytes) -> int:
+        """Devuelve la mayor de las cotas de todas las tablas para `estado`,
+        el tablero aplanado fila por fila."""
+        casilleros = self.n_filas * self.n_columnas
+        posiciones = [0] * (casilleros + 1)
+        for posicion, valor in enumerate(estado):
+            posiciones[valor] = posicion
+
+        maxima = 0
+        for fichas, inicio in zip(self.grupos, self._inicios):
+            indice = 0
+            potencia = 1
+            for ficha in fichas:
+                indice += posiciones[ficha] * potencia
+                potencia *= casilleros
+            distancia = self._mapa[inicio + indice]
+            if distancia > maxima:
+                maxima = distancia
+        return maxima
+
+    __call__ = heuristica
+
+    def cerrar(self) -> None:
+        """Libera el mapeo y el archivo."""
+        self._mapa.close()
+        self._archivo.close()
+
+
+def ruta_por_defecto(n_filas: int, n_columnas: int, directorio: str) -> str:
+    """Ruta del archivo de patrones de una forma de tablero en `directorio`."""
+    return os.path.join(directorio, f"patrones_{n_filas}x{n_columnas}.bin")
+
+
+def obtener(
+    n_filas: int, n_columnas: int, directorio: str = DIRECTORIO_PATRONES
+) -> BaseDePatrones:
+    """
+    Devuelve la base de patrones de un tablero de `n_filas` por `n_columnas`.
+
+    La primera vez que se pide en un proceso, se abre el archivo guardado en
+    `directorio`; si no existe, se construye (puede tardar minutos en
+    tableros grandes) y se guarda para los siguientes procesos.
+
+    PRECONDICIONES:
+        - `n_filas * n_columnas` es a lo sumo 255.
+    """
+    ruta = ruta_por_defecto(n_filas, n_columnas, directorio)
+    if ruta not in _cargadas:
+        if not os.path.exists(ruta):
+            grupos = grupos_por_defecto(n_filas, n_columnas)
+            tablas = [construir_patron(n_filas, n_columnas, f) for f in grupos]
+            guardar(ruta, n_filas, n_columnas, grupos, tablas)
+        _cargadas[ruta] = BaseDePatrones(ruta)
+    return _cargadas[ruta]
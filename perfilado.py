@@ -0,0 +1,76 @@
+"""
+Medición del tiempo de cada fase de una partida interactiva de Sixteen
+"""
+
+import cProfile
+import functools
+import time
+from collections.abc import Callable
+
+
+class Perfil:
+    """Tiempo acumulado de las fases de una partida.
+
+    Cada fase es una función envuelta con `envolver`: se cuentan sus
+    llamadas y se suma el tiempo de reloj que tardan. Si se indica una ruta,
+    además se corre `cProfile` durante toda la partida y sus datos se
+    guardan en ese archivo al cerrar, para abrirlos con `pstats` o
+    `snakeviz`.
+    """
+
+    __slots__ = ("_llamadas", "_segundos", "_maximos", "_perfilador", "_ruta")
+
+    def __init__(self, ruta: str | None = None):
+        self._llamadas = {}
+        self._segundos = {}
+        self._maximos = {}
+        self._ruta = ruta
+        self._perfilador = None
+        if ruta is not None:
+            self._perfilador = cProfile.Profile()
+            self._perfilador.enable()
+
+    def envolver(self, fase: str, funcion: Callable) -> Callable:
+        """Devuelve una versión de `funcion` que suma sus llamadas y su
+        duración a la fase `fase`."""
+        self._llamadas.setdefault(fase, 0)
+        self._segundos.setdefault(fase, 0.0)
+        self._maximos.setdefault(fase, 0.0)
+        reloj = time.perf_counter
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                duracion = reloj() - inicio
+                self._llamadas[fase] += 1
+                self._segundos[fase] += duracion
+                if duracion > self._maximos[fase]:
+                    self._maximos[fase] = duracion
+
+        return envoltura
+
+    def resumen(self) -> list[str]:
+        """Devuelve las líneas de una tabla con las llamadas, el tiempo
+        total, el promedio y el máximo de cada fase, en milisegundos."""
+        lineas = [
+            f"{'Fase':<24}{'Llamadas':>10}{'Total ms':>12}{'Media ms':>12}"
+            f"{'Máx ms':>12}"
+        ]
+        for fase, llamadas in self._llamadas.items():
+            total = self._segundos[fase] * 1000
+            media = total / llamadas if llamadas else 0.0
+            maximo = self._maximos[fase] * 1000
+            lineas.append(
+                f"{fase:<24}{llamadas:>10}{total:>12.3f}{media:>12.3f}{maximo:>12.3f}"
+            )
+        return lineas
+
+    def cerrar(self) -> None:
+        """Detiene `cProfile`, si se estaba usando, y guarda sus datos."""
+        if self._perfilador is not None:
+            self._perfilador.disable()
+            self._perfilador.dump_stats(self._ruta)
+            self._perfilador = None
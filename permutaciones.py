@@ -0,0 +1,114 @@
+"""
+Tablas de permutaciones precalculadas para los movimientos del juego Sixteen
+"""
+
+from functools import lru_cache
+
+Permutacion = tuple[int, ...]
+
+
+@lru_cache(maxsize=None)
+def tabla_movimientos(
+    n_filas: int, n_columnas: int
+) -> dict[tuple[str, int], Permutacion]:
+    """Devuelve, para cada movimiento posible de un tablero de `n_filas` por
+    `n_columnas`, la permutación que lo representa sobre el tablero aplanado
+    fila por fila.
+
+    Los movimientos se indican como `(direccion, indice)` con la notación
+    w/a/s/d de la interfaz. La permutación `p` cumple que, luego del
+    movimiento, el casillero `i` tiene el valor que antes estaba en `p[i]`.
+    El resultado se calcula una sola vez por forma de tablero.
+
+    PRECONDICIONES:
+        - `n_filas` y `n_columnas` son enteros positivos.
+
+    POSTCONDICIONES:
+        - El diccionario devuelto es compartido entre llamadas y no debe
+        modificarse.
+    """
+    identidad = list(range(n_filas * n_columnas))
+    tabla = {}
+    for fila in range(n_filas):
+        base = fila * n_columnas
+        izquierda = identidad[:]
+        derecha = identidad[:]
+        for j in range(n_columnas):
+            izquierda[base + j] = base + (j + 1) % n_columnas
+            derecha[base + j] = base + (j - 1) % n_columnas
+        tabla[("a", fila)] = tuple(izquierda)
+        tabla[("d", fila)] = tuple(derecha)
+    for columna in range(n_columnas):
+        arriba = identidad[:]
+        abajo = identidad[:]
+        for i in range(n_filas):
+            casillero = i * n_columnas + columna
+            arriba[casillero] = ((i + 1) % n_filas) * n_columnas + columna
+            abajo[casillero] = ((i - 1) % n_filas) * n_columnas + columna
+        tabla[("w", columna)] = tuple(arriba)
+        tabla[("s", columna)] = tuple(abajo)
+    return tabla
+
+
+def componer(
+    n_filas: int, n_columnas: int, movimientos: list[tuple[str, int]]
+) -> Permutacion:
+    """Reduce una secuencia de movimientos a una única permutación equivalente
+    a aplicarlos en orden. Cada movimiento cuesta lo que mide su fila o
+    columna, no el tablero entero.
+
+    PRECONDICIONES:
+        - Cada movimiento de `movimientos` es válido para un tablero de
+        `n_filas` por `n_columnas`.
+
+    EJEMPLO:
+        >>> componer(2, 2, [("a", 0), ("a", 0)])
+        (0, 1, 2, 3)
+    """
+    resultado = list(range(n_filas * n_columnas))
+    for direccion, indice in movimientos:
+        # Cada movimiento sólo rota los casilleros de su fila o columna, así
+        # que se actualizan esos y no la permutación entera.
+        if direccion in "ad":
+            linea = slice(indice * n_columnas, (indice + 1) * n_columnas)
+        else:
+            linea = slice(indice, None, n_columnas)
+        valores = resultado[linea]
+        if direccion in "aw":
+            resultado[linea] = valores[1:] + valores[:1]
+        else:
+            resultado[linea] = valores[-1:] + valores[:-1]
+    return tuple(resultado)
+
+
+def aplicar_permutacion(tablero: list[list[int]], permutacion: Permutacion) -> None:
+    """Aplica `permutacion` sobre `tablero` en una sola pasada.
+
+    PRECONDICIONES:
+        - `permutacion` fue calculada para las dimensiones de `tablero`.
+
+    POSTCONDICIONES:
+        - El tablero se modifica in-place.
+    """
+    n_columnas = len(tablero[0])
+    valores = [valor for fila in tablero for valor in fila]
+    valores = [valores[k] for k in permutacion]
+    for i, fila in enumerate(tablero):
+        fila[:] = valores[i * n_columnas : (i + 1) * n_columnas]
+
+
+def aplicar_movimientos(
+    tablero: list[list[int]], movimientos: list[tuple[str, int]]
+) -> None:
+    """Aplica una secuencia de movimientos sobre `tablero` recorriéndolo una
+    única vez, sin importar el largo de la secuencia.
+
+    PRECONDICIONES:
+        - Cada movimiento de `movimientos` es válido para `tablero`.
+
+    POSTCONDICIONES:
+        - El tablero queda igual que si se hubiese aplicado cada rotación de
+        `sixteen` en orden, y se modifica in-place.
+    """
+    permutacion = componer(len(tablero), len(tablero[0]), movimientos)
+    aplicar_permutacion(tablero, permutacion)
@@ -0,0 +1,181 @@
+"""
+Sugerencias del próximo movimiento para el juego Sixteen
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+
+import espacio_estados
+import patrones
+import permutaciones
+import sixteen
+
+MAX_CASILLEROS_TABLA = 9
+MAX_CASILLEROS_PATRONES = 16
+MAX_CASILLEROS_RESOLVER = 255
+TIEMPO_PISTA = 0.04
+MAX_PISTAS_RECORDADAS = 100_000
+
+
+def _heuristica(
+    n_filas: int, n_columnas: int, directorio: str
+) -> Callable[[bytes], int] | None:
+    """Base de patrones para guiar la búsqueda de la pista, o `None` si el
+    tablero tiene más de MAX_CASILLEROS_PATRONES casilleros y construirla
+    tardaría demasiado, o si es tan chico que `sixteen.resolver` no usa
+    heurísticas. Se construye con la primera pista de cada forma y
+    queda guardada en disco, como la tabla de distancias."""
+    casilleros = n_filas * n_columnas
+    if not sixteen.MAX_CASILLEROS_BFS < casilleros <= MAX_CASILLEROS_PATRONES:
+        return None
+    return patrones.obtener(n_filas, n_columnas, directorio)
+
+
+def _inverso(movimiento: tuple[str, int] | None) -> tuple[str, int] | None:
+    """Movimiento que deshace `movimiento`."""
+    if movimiento is None:
+        return None
+    direccion, indice = movimiento
+    return sixteen.INVERSOS[direccion], indice
+
+
+@lru_cache(maxsize=MAX_PISTAS_RECORDADAS)
+def _pista_exacta(
+    n_filas: int,
+    n_columnas: int,
+    estado: tuple[int, ...],
+    anterior: tuple[str, int] | None,
+    directorio: str,
+) -> tuple[str, int] | None:
+    """Devuelve el primer movimiento de un camino más corto al orden para un
+    tablero aplanado, o lanza `TimeoutError` si no se encuentra en
+    TIEMPO_PISTA segundos. Como `lru_cache` no memoriza excepciones, sólo
+    quedan memorizadas las pistas exactas."""
+    evitar = _inverso(anterior)
+    distancias = None
+    if n_filas * n_columnas <= MAX_CASILLEROS_TABLA:
+        try:
+            distancias = espacio_estados.obtener(n_filas, n_columnas, directorio)
+        except ImportError:
+            # Construir la tabla requiere numpy; sin él se usa el resolvedor.
+            pass
+    if distancias is not None:
+        tabla = permutaciones.tabla_movimientos(n_filas, n_columnas)
+        actual = distancias[espacio_estados.rango(estado)]
+        if actual == 0:
+            return None
+        mejores = [
+            movimiento
+            for movimiento, permutacion in tabla.items()
+            if distancias[espacio_estados.rango([estado[k] for k in permutacion])]
+            == actual - 1
+        ]
+        return next((m for m in mejores if m != evitar), mejores[0])
+
+    tablero = [
+        list(estado[i : i + n_columnas]) for i in range(0, len(estado), n_columnas)
+    ]
+    solucion = sixteen.resolver(
+        tablero,
+        heuristica=_heuristica(n_filas, n_columnas, directorio),
+        tiempo_limite=TIEMPO_PISTA,
+    )
+    return solucion[0] if solucion else None
+
+
+def _cambio_desordenados(antes: list[int], despues: list[int], esperados) -> int:
+    """Cuántos casilleros desordenados más (o menos, si es negativo) tiene
+    una línea del tablero al pasar de `antes` a `despues`."""
+    return sum(v != e for v, e in zip(despues, esperados)) - sum(
+        v != e for v, e in zip(antes, esperados)
+    )
+
+
+def _aproximar(
+    tablero: list[list[int]],
+    evitar: tuple[str, int] | None,
+    heuristica: Callable[[bytes], int] | None,
+) -> tuple[str, int]:
+    """Devuelve el movimiento, distinto de `evitar`, que deja el tablero con
+    la menor cota de `heuristica` y, a igual cota, con menos casilleros
+    desordenados. Cada movimiento sólo cambia su fila o su columna, así que
+    los desordenados se cuentan comparando esa línea antes y después de
+    rotarla."""
+    n_filas = len(tablero)
+    n_columnas = len(tablero[0])
+    candidatos = []
+    for fila in range(n_filas):
+        valores = tablero[fila]
+        esperados = range(fila * n_columnas + 1, (fila + 1) * n_columnas + 1)
+        candidatos.append(("a", fila, esperados, valores, valores[1:] + valores[:1]))
+        candidatos.append(("d", fila, esperados, valores, valores[-1:] + valores[:-1]))
+    for columna in range(n_columnas):
+        valores = [tablero[fila][columna] for fila in range(n_filas)]
+        esperados = range(columna + 1, n_filas * n_columnas + 1, n_columnas)
+        candidatos.append(("w", columna, esperados, valores, valores[1:] + valores[:1]))
+        candidatos.append(
+            ("s", columna, esperados, valores, valores[-1:] + valores[:-1])
+        )
+
+    mejor = None
+    for direccion, indice, esperados, antes, despues in candidatos:
+        if (direccion, indice) == evitar:
+            continue
+        cota = 0
+        if heuristica is not None:
+            vecino = [fila[:] for fila in tablero]
+            sixteen.mover(vecino, direccion, indice)
+            cota = heuristica(bytes(valor for fila in vecino for valor in fila))
+        clave = (cota, _cambio_desordenados(antes, despues, esperados))
+        if mejor is None or clave < mejor[0]:
+            mejor = (clave, (direccion, indice))
+    return mejor[1]
+
+
+def sugerir(
+    tablero: list[list[int]],
+    anterior: tuple[str, int] | None = None,
+    directorio: str = patrones.DIRECTORIO_PATRONES,
+) -> tuple[str, int] | None:
+    """
+    Sugiere el próximo movimiento para ordenar `tablero`.
+
+    En tableros de hasta MAX_CASILLEROS_TABLA casilleros la sugerencia sale
+    de la tabla de distancias de `espacio_estados`, que se construye con la
+    primera pista y queda guardada en disco para las partidas siguientes
+    (si falta numpy para construirla, se usa el resolvedor). En los más
+    grandes, hasta MAX_CASILLEROS_RESOLVER casilleros, se busca una solución
+    óptima durante a lo sumo TIEMPO_PISTA segundos, guiada por una base de
+    patrones si el tablero tiene hasta MAX_CASILLEROS_PATRONES casilleros.
+    Si no alcanza el tiempo, o si el tablero es más grande, se sugiere el
+    movimiento que más acerca el tablero al orden según esa base (o según
+    la cantidad de casilleros desordenados), sin deshacer `anterior`. Esa
+    aproximación no garantiza ordenar el tablero y no se memoriza.
+
+    PRECONDICIONES:
+        - `tablero` tiene los números del 1 al `n_filas * n_columnas`, sin
+        repetir, y se puede ordenar.
+        - `anterior`, si se indica, es el último movimiento del jugador.
+        - `directorio` es donde se guardan las tablas entre procesos.
+
+    POSTCONDICIONES:
+        - Devuelve un movimiento `(direccion, indice)` con la notación de la
+        interfaz, o `None` si el tablero ya está ordenado.
+        - Sólo se sugiere el inverso de `anterior` si deshacerlo es el
+        primer paso de un camino más corto al orden, y en la tabla de
+        distancias sólo si no hay otro.
+        - No modifica el tablero original.
+    """
+    n_filas = len(tablero)
+    n_columnas = len(tablero[0])
+    if n_filas * n_columnas <= MAX_CASILLEROS_RESOLVER:
+        estado = tuple(valor for fila in tablero for valor in fila)
+        try:
+            return _pista_exacta(n_filas, n_columnas, estado, anterior, directorio)
+        except TimeoutError:
+            pass
+    elif sixteen.esta_ordenado(tablero):
+        return None
+    return _aproximar(
+        tablero, _inverso(anterior), _heuristica(n_filas, n_columnas, directorio)
+    )
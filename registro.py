@@ -0,0 +1,191 @@
+"""
+Registro binario compacto de partidas del juego Sixteen
+"""
+
+import mmap
+import random
+import struct
+from collections.abc import Iterator
+
+import sixteen
+
+MAGIA = b"SXLG"
+VERSION = 1
+MAX_INDICE = 63
+MIN_SEMILLA = -(2**63)
+MAX_SEMILLA = 2**63 - 1
+INTERVALO_INSTANTANEAS = 1024
+
+# Magia, versión, filas, columnas, si hay semilla y la semilla.
+_ENCABEZADO = struct.Struct("<4sBHHBq")
+_CODIGOS = {"w": 0, "a": 1, "s": 2, "d": 3}
+_DIRECCIONES = "wasd"
+
+
+def codificar_movimiento(direccion: str, indice: int) -> int:
+    """Empaqueta un movimiento en un byte: la dirección en los dos bits
+    altos y el índice en los seis bajos.
+
+    PRECONDICIONES:
+        - `direccion` es 'w', 'a', 's' o 'd'.
+
+    POSTCONDICIONES:
+        - Lanza `ValueError` si `indice` no está entre 0 y MAX_INDICE.
+    """
+    if not 0 <= indice <= MAX_INDICE:
+        raise ValueError(f"El índice {indice} no entra en un registro binario")
+    return _CODIGOS[direccion] << 6 | indice
+
+
+def decodificar_movimiento(byte: int) -> tuple[str, int]:
+    """Inversa de `codificar_movimiento`."""
+    return _DIRECCIONES[byte >> 6], byte & MAX_INDICE
+
+
+def tablero_inicial(
+    n_filas: int, n_columnas: int, semilla: int | None
+) -> list[list[int]]:
+    """Tablero con el que empieza una partida registrada: el ordenado,
+    mezclado con `sixteen.mezclar_tablero` a partir de `semilla` si la hay."""
+    tablero = sixteen.crear_tablero(n_filas, n_columnas)
+    if semilla is not None:
+        sixteen.mezclar_tablero(tablero, random.Random(semilla))
+    return tablero
+
+
+class EscritorRegistro:
+    """Escribe una partida en un archivo binario: un encabezado fijo con la
+    forma del tablero y la semilla de la mezcla, y después un byte por
+    movimiento. Se puede usar con `with`."""
+
+    __slots__ = ("_archivo",)
+
+    def __init__(self, ruta: str, n_filas: int, n_columnas: int, semilla: int | None):
+        """Crea el archivo en `ruta` y escribe el encabezado.
+
+        POSTCONDICIONES:
+            - Lanza `ValueError`, sin crear el archivo, si `semilla` no está
+            entre MIN_SEMILLA y MAX_SEMILLA.
+        """
+        if semilla is not None and not MIN_SEMILLA <= semilla <= MAX_SEMILLA:
+            raise ValueError(f"La semilla {semilla} no entra en un registro binario")
+        self._archivo = open(ruta, "wb")
+        self._archivo.write(
+            _ENCABEZADO.pack(
+                MAGIA,
+                VERSION,
+                n_filas,
+                n_columnas,
+                semilla is not None,
+                semilla or 0,
+            )
+        )
+
+    def registrar(self, direccion: str, indice: int) -> None:
+        """Agrega un movimiento al final del registro."""
+        self._archivo.write(bytes([codificar_movimiento(direccion, indice)]))
+
+    def cerrar(self) -> None:
+        """Vuelca lo pendiente y cierra el archivo."""
+        self._archivo.close()
+
+    def __enter__(self) -> "EscritorRegistro":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+
+class LectorRegistro:
+    """Lee un registro escrito por `EscritorRegistro` mapeándolo en memoria.
+
+    Los movimientos se decodifican recién cuando se piden. Para obtener el
+    tablero luego de cualquier movimiento sin reproducir toda la partida, se
+    guarda una instantánea cada INTERVALO_INSTANTANEAS movimientos a medida
+    que se van necesitando, y se reproduce sólo desde la más cercana.
+    """
+
+    __slots__ = (
+        "n_filas",
+        "n_columnas",
+        "semilla",
+        "_archivo",
+        "_mapa",
+        "_instantaneas",
+    )
+
+    def __init__(self, ruta: str):
+        """Abre y mapea el registro en `ruta`.
+
+        POSTCONDICIONES:
+            - Lanza `ValueError` si el archivo no es un registro válido.
+        """
+        self._archivo = open(ruta, "rb")
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, version, n_filas, n_columnas, hay_semilla, semilla = (
+            _ENCABEZADO.unpack_from(self._mapa)
+        )
+        if magia != MAGIA or version != VERSION:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un registro de partida válido")
+
+        self.n_filas = n_filas
+        self.n_columnas = n_columnas
+        self.semilla = semilla if hay_semilla else None
+        self._instantaneas = [tablero_inicial(n_filas, n_columnas, self.semilla)]
+
+    def __len__(self) -> int:
+        """Cantidad de movimientos registrados."""
+        return len(self._mapa) - _ENCABEZADO.size
+
+    def movimiento(self, numero: int) -> tuple[str, int]:
+        """Devuelve el movimiento número `numero`, contando desde 0."""
+        return decodificar_movimiento(self._mapa[_ENCABEZADO.size + numero])
+
+    def movimientos(self, desde: int = 0) -> Iterator[tuple[str, int]]:
+        """Recorre los movimientos a partir del número `desde`, leyendo el
+        archivo de a tramos de INTERVALO_INSTANTANEAS movimientos."""
+        for inicio in range(desde, len(self), INTERVALO_INSTANTANEAS):
+            yield from self._tramo(inicio, INTERVALO_INSTANTANEAS)
+
+    def tablero_en(self, numero: int) -> list[list[int]]:
+        """
+        Devuelve el tablero luego de aplicar los primeros `numero`
+        movimientos.
+
+        PRECONDICIONES:
+            - `numero` está entre 0 y `len(self)`.
+
+        POSTCONDICIONES:
+            - Devuelve un tablero nuevo; no modifica las instantáneas.
+        """
+        objetivo = numero // INTERVALO_INSTANTANEAS
+        while len(self._instantaneas) <= objetivo:
+            tablero = [fila[:] for fila in self._instantaneas[-1]]
+            inicio = (len(self._instantaneas) - 1) * INTERVALO_INSTANTANEAS
+            for direccion, indice in self._tramo(inicio, INTERVALO_INSTANTANEAS):
+                sixteen.mover(tablero, direccion, indice)
+            self._instantaneas.append(tablero)
+
+        tablero = [fila[:] for fila in self._instantaneas[objetivo]]
+        inicio = objetivo * INTERVALO_INSTANTANEAS
+        for direccion, indice in self._tramo(inicio, numero - inicio):
+            sixteen.mover(tablero, direccion, indice)
+        return tablero
+
+    def _tramo(self, inicio: int, cantidad: int) -> Iterator[tuple[str, int]]:
+        """Recorre `cantidad` movimientos a partir del número `inicio`."""
+        desde = _ENCABEZADO.size + inicio
+        for byte in self._mapa[desde : desde + cantidad]:
+            yield decodificar_movimiento(byte)
+
+    def cerrar(self) -> None:
+        """Libera el mapeo y el archivo."""
+        self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self) -> "LectorRegistro":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
@@ -0,0 +1,131 @@
+"""
+Resolución en paralelo de lotes de tableros del juego Sixteen
+"""
+
+import argparse
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import mezcla
+import sixteen
+from tablero_compacto import TableroCompacto
+
+RESUELTO = "resuelto"
+SIN_SOLUCION = "sin_solucion"
+TIEMPO_AGOTADO = "tiempo_agotado"
+
+PENDIENTES_POR_PROCESO = 4
+
+
+def _resolver_compacto(
+    indice: int,
+    n_filas: int,
+    n_columnas: int,
+    casilleros: bytes,
+    profundidad_maxima: int | None,
+    tiempo_limite: float | None,
+) -> tuple[int, list[tuple[str, int]] | None, str]:
+    """Tarea que corre en cada proceso: decodifica el tablero compacto y lo
+    resuelve con `sixteen.resolver`."""
+    tablero = TableroCompacto(n_filas, n_columnas, casilleros).a_lista()
+    try:
+        solucion = sixteen.resolver(
+            tablero, profundidad_maxima, tiempo_limite=tiempo_limite
+        )
+    except TimeoutError:
+        return indice, None, TIEMPO_AGOTADO
+    if solucion is None:
+        return indice, None, SIN_SOLUCION
+    return indice, solucion, RESUELTO
+
+
+def resolver_lote(
+    tableros: Iterable[list[list[int]]],
+    profundidad_maxima: int | None = None,
+    tiempo_limite: float | None = None,
+    procesos: int | None = None,
+) -> Iterator[tuple[int, list[tuple[str, int]] | None, str]]:
+    """
+    Resuelve muchos tableros repartiéndolos entre `procesos` procesos, y
+    devuelve cada resultado apenas está listo.
+
+    A cada proceso se le manda el tablero como un `TableroCompacto` (una
+    tira de bytes) en lugar de la lista de listas. Para no cargar todo el
+    lote en memoria, sólo se mantienen PENDIENTES_POR_PROCESO tareas en
+    vuelo por proceso; los tableros se van leyendo de `tableros` a medida
+    que se liberan lugares.
+
+    PRECONDICIONES:
+        - `tableros` es un iterable de tableros de a lo sumo 255 casilleros.
+        - `tiempo_limite`, si se indica, son los segundos que puede tardar
+        cada tablero por separado.
+
+    POSTCONDICIONES:
+        - Devuelve un iterador de tuplas `(indice, solucion, estado)`, donde
+        `indice` es la posición del tablero en `tableros` y `estado` es
+        RESUELTO, SIN_SOLUCION (no hay solución de largo a lo sumo
+        `profundidad_maxima`) o TIEMPO_AGOTADO. Si el estado no es RESUELTO,
+        `solucion` es `None`. Los resultados llegan en orden de finalización.
+    """
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        pendientes = set()
+        for indice, tablero in enumerate(tableros):
+            compacto = TableroCompacto.desde_lista(tablero)
+            pendientes.add(
+                ejecutor.submit(
+                    _resolver_compacto,
+                    indice,
+                    compacto.n_filas,
+                    compacto.n_columnas,
+                    compacto.casilleros,
+                    profundidad_maxima,
+                    tiempo_limite,
+                )
+            )
+            if len(pendientes) >= procesos * PENDIENTES_POR_PROCESO:
+                listas, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in listas:
+                    yield futuro.result()
+
+        while pendientes:
+            listas, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in listas:
+                yield futuro.result()
+
+
+def main() -> None:
+    """Resuelve un lote de mezclas generadas con `mezcla.generar_mezclas` y
+    muestra cuántos tableros se resolvieron por segundo."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--filas", type=int, default=3)
+    parser.add_argument("--columnas", type=int, default=3)
+    parser.add_argument("--cantidad", type=int, default=1000)
+    parser.add_argument("--profundidad", type=int, default=mezcla.PROFUNDIDAD_MEZCLA)
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--tiempo-limite", type=float, default=None)
+    parser.add_argument("--procesos", type=int, default=None)
+    args = parser.parse_args()
+
+    tableros = mezcla.generar_mezclas(
+        args.filas, args.columnas, args.cantidad, args.semilla, args.profundidad
+    )
+    estados = {RESUELTO: 0, SIN_SOLUCION: 0, TIEMPO_AGOTADO: 0}
+    inicio = time.perf_counter()
+    for _, _, estado in resolver_lote(
+        tableros, tiempo_limite=args.tiempo_limite, procesos=args.procesos
+    ):
+        estados[estado] += 1
+    duracion = time.perf_counter() - inicio
+
+    for estado, cantidad in estados.items():
+        print(f"{estado}: {cantidad}")
+    print(f"{args.cantidad / duracion:.1f} tableros por segundo")
+
+
+if __name__ == "__main__":
+    main()
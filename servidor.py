@@ -0,0 +1,248 @@
+"""
+Servidor asincrónico de partidas de Sixteen y cliente de carga para probarlo
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+import main
+import mezcla
+import sixteen
+
+HOST = "127.0.0.1"
+PUERTO = 8016
+MAX_LADO = 100
+COLA_CONEXIONES = 4096
+MAX_LINEA = 2**16
+
+
+def _respuesta(datos: dict) -> bytes:
+    """Codifica una respuesta como una línea de JSON."""
+    return (json.dumps(datos, separators=(",", ":")) + "\n").encode()
+
+
+def _diferencia(tablero: list[list[int]], direccion: str, indice: int) -> dict:
+    """Describe la única línea que cambió luego de un movimiento."""
+    if direccion in ("a", "d"):
+        return {"fila": indice, "valores": tablero[indice]}
+    return {"columna": indice, "valores": [fila[indice] for fila in tablero]}
+
+
+class Sesion:
+    """Estado de la partida de una conexión."""
+
+    __slots__ = ("tablero", "desordenados")
+
+    def __init__(self, n_filas: int, n_columnas: int, semilla: int | None):
+        self.tablero = sixteen.crear_tablero(n_filas, n_columnas)
+        sixteen.mezclar_tablero(self.tablero, random.Random(semilla))
+        self.desordenados = sixteen.contar_desordenados(self.tablero)
+
+    def procesar(self, linea: str) -> dict:
+        """Aplica un movimiento en la sintaxis de `main.pedir_movimiento` y
+        devuelve la respuesta para el cliente."""
+        movimiento = main.interpretar_movimiento(linea)
+        if isinstance(movimiento, str):
+            return {"error": movimiento}
+
+        direccion, n = movimiento
+        desordenados = sixteen.mover_contando(
+            self.tablero, direccion, n, self.desordenados
+        )
+        if desordenados is None:
+            return {"error": "Indice invalido"}
+        self.desordenados = desordenados
+        respuesta = _diferencia(self.tablero, direccion, n)
+        respuesta["ordenado"] = desordenados == 0
+        return respuesta
+
+
+def _es_entero(texto: str) -> bool:
+    """Indica si `texto` es un entero en decimal, con a lo sumo un '-'
+    adelante, que `int` puede leer."""
+    digitos = texto[1:] if texto.startswith("-") else texto
+    return digitos.isascii() and digitos.isdigit()
+
+
+def _nueva_sesion(partes: list[str]) -> Sesion | str:
+    """Interpreta 'nuevo FILAS COLUMNAS [SEMILLA]'. Devuelve la sesión o el
+    mensaje de error."""
+    if len(partes) not in (3, 4) or not all(_es_entero(p) for p in partes[1:]):
+        return "Se esperaba: nuevo FILAS COLUMNAS [SEMILLA]"
+    n_filas, n_columnas = int(partes[1]), int(partes[2])
+    if not (1 <= n_filas <= MAX_LADO and 1 <= n_columnas <= MAX_LADO):
+        return f"Las dimensiones deben estar entre 1 y {MAX_LADO}"
+    semilla = int(partes[3]) if len(partes) == 4 else None
+    return Sesion(n_filas, n_columnas, semilla)
+
+
+async def atender(lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+    """
+    Atiende una conexión. El protocolo es de una línea por pedido y una
+    línea de JSON por respuesta:
+
+    - 'nuevo FILAS COLUMNAS [SEMILLA]' empieza una partida mezclada y
+    responde con el tablero completo.
+    - 'n,direccion', como en `main.pedir_movimiento`, aplica un movimiento y
+    responde sólo con la fila o columna que cambió y si el tablero quedó
+    ordenado.
+    - 'q' cierra la conexión.
+
+    Una línea de más de MAX_LINEA bytes se responde con un error y cierra
+    la conexión.
+    """
+    sesion = None
+    try:
+        while True:
+            try:
+                linea = await lector.readline()
+            except ValueError:
+                escritor.write(
+                    _respuesta({"error": f"Línea de más de {MAX_LINEA} bytes"})
+                )
+                await escritor.drain()
+                break
+            if not linea:
+                break
+            pedido = linea.decode(errors="replace").strip()
+            if pedido == "q":
+                break
+            partes = pedido.split()
+            if partes and partes[0] == "nuevo":
+                nueva = _nueva_sesion(partes)
+                if isinstance(nueva, str):
+                    respuesta = {"error": nueva}
+                else:
+                    sesion = nueva
+                    respuesta = {
+                        "tablero": sesion.tablero,
+                        "ordenado": sesion.desordenados == 0,
+                    }
+            elif sesion is None:
+                respuesta = {"error": "No hay partida, envíe 'nuevo FILAS COLUMNAS'"}
+            else:
+                respuesta = sesion.procesar(pedido)
+            escritor.write(_respuesta(respuesta))
+            await escritor.drain()
+    except ConnectionError:
+        pass
+    finally:
+        escritor.close()
+
+
+async def servir(host: str, puerto: int, socket: str | None) -> None:
+    """Atiende conexiones TCP en `host`:`puerto`, o en el socket Unix
+    `socket` si se indica, hasta que se interrumpa el proceso."""
+    if socket is not None:
+        servidor = await asyncio.start_unix_server(
+            atender, path=socket, backlog=COLA_CONEXIONES, limit=MAX_LINEA
+        )
+    else:
+        servidor = await asyncio.start_server(
+            atender, host, puerto, backlog=COLA_CONEXIONES, limit=MAX_LINEA
+        )
+    async with servidor:
+        await servidor.serve_forever()
+
+
+async def _jugar_sesion(
+    conectar, n_filas: int, n_columnas: int, movimientos: int, semilla: int
+) -> list[float]:
+    """Juega una sesión de carga y devuelve la latencia de cada movimiento,
+    en segundos."""
+    lector, escritor = await conectar()
+    escritor.write(f"nuevo {n_filas} {n_columnas} {semilla}\n".encode())
+    await escritor.drain()
+    await lector.readline()
+
+    latencias = []
+    generador = random.Random(semilla)
+    for direccion, indice in mezcla.generar_movimientos(
+        n_filas, n_columnas, movimientos, generador
+    ):
+        inicio = time.perf_counter()
+        escritor.write(f"{indice},{direccion}\n".encode())
+        await escritor.drain()
+        await lector.readline()
+        latencias.append(time.perf_counter() - inicio)
+
+    escritor.write(b"q\n")
+    await escritor.drain()
+    escritor.close()
+    return latencias
+
+
+async def cargar(
+    host: str,
+    puerto: int,
+    socket: str | None,
+    sesiones: int,
+    movimientos: int,
+    n_filas: int,
+    n_columnas: int,
+) -> None:
+    """Abre `sesiones` conexiones simultáneas contra el servidor, envía
+    `movimientos` movimientos al azar en cada una y muestra el rendimiento
+    obtenido y la latencia por movimiento."""
+    if socket is not None:
+
+        def conectar():
+            return asyncio.open_unix_connection(socket)
+
+    else:
+
+        def conectar():
+            return asyncio.open_connection(host, puerto)
+
+    inicio = time.perf_counter()
+    resultados = await asyncio.gather(
+        *(
+            _jugar_sesion(conectar, n_filas, n_columnas, movimientos, semilla)
+            for semilla in range(sesiones)
+        )
+    )
+    duracion = time.perf_counter() - inicio
+
+    latencias = sorted(latencia for sesion in resultados for latencia in sesion)
+    print(f"Sesiones: {sesiones}")
+    print(f"Movimientos por segundo: {len(latencias) / duracion:.0f}")
+    if latencias:
+        percentil_99 = latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))]
+        print(f"Latencia mediana: {statistics.median(latencias) * 1000:.2f} ms")
+        print(f"Latencia percentil 99: {percentil_99 * 1000:.2f} ms")
+
+
+def leer_argumentos() -> argparse.Namespace:
+    """Interpreta las opciones de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Servidor de partidas de Sixteen")
+    parser.add_argument("modo", choices=("servir", "cargar"))
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--puerto", type=int, default=PUERTO)
+    parser.add_argument("--socket", help="ruta de un socket Unix en lugar de TCP")
+    parser.add_argument("--sesiones", type=int, default=1000)
+    parser.add_argument("--movimientos", type=int, default=50)
+    parser.add_argument("--filas", type=int, default=4)
+    parser.add_argument("--columnas", type=int, default=4)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    argumentos = leer_argumentos()
+    if argumentos.modo == "servir":
+        asyncio.run(servir(argumentos.host, argumentos.puerto, argumentos.socket))
+    else:
+        asyncio.run(
+            cargar(
+                argumentos.host,
+                argumentos.puerto,
+                argumentos.socket,
+                argumentos.sesiones,
+                argumentos.movimientos,
+                argumentos.filas,
+                argumentos.columnas,
+            )
+        )
@@ -2,9 +2,22 @@
 Logica del juego Sixteen
 """
 
-import random
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+# `random`, `permutaciones` y `transposicion` se importan recién en las
+# funciones que los usan, para que un proceso que sólo juega o reproduce una
+# partida no pague su carga al arrancar.
+if TYPE_CHECKING:
+    import random
+
+    import transposicion
 
 ITERACIONES_RANDOM = 1
+MAX_CASILLEROS_BFS = 9
+
+INVERSOS = {"w": "s", "s": "w", "a": "d", "d": "a"}
 
 
 def crear_tablero(n_filas: int, n_columnas: int) -> list[list[int]]:
@@ -17,8 +30,7 @@ def crear_tablero(n_filas: int, n_columnas: int) -> list[list[int]]:
     los números, hasta llegar al número `n_filas * n_columnas`.
 
     PRECONDICIONES:
-        - `n_filas` y `n_columnas` son enteros positivos mayor a uno y menores
-        a diez.
+        - `n_filas` y `n_columnas` son enteros positivos mayor a uno.
 
     POSTCONDICIONES:
         - la función devuelve un nuevo tablero ordenado de enteros que se puede
@@ -64,7 +76,7 @@ def rotar_izquierda(tablero: list[list[int]], fila: int) -> bool:
         rotación modificando el tablero y devuelve `True`.
         Caso contrario, no modifica el tablero y devuelve `False`."""
 
-    if fila >= 0 and fila < 10:
+    if fila >= 0 and fila < len(tablero):
         aux = tablero[fila].pop(0)
 
         tablero[fila].append(aux)
@@ -92,7 +104,7 @@ def rotar_derecha(tablero: list[list[int]], fila: int) -> bool:
         rotación modificando el tablero y devuelve `True`.
         Caso contrario, no modifica el tablero y devuelve `False`."""
 
-    if fila >= 0 and fila < 10:
+    if fila >= 0 and fila < len(tablero):
         aux = tablero[fila].pop(-1)
 
         tablero[fila].insert(0, aux)
@@ -120,7 +132,7 @@ def rotar_arriba(tablero: list[list[int]], columna: int) -> bool:
         rotación modificando el tablero y devuelve `True`.
         Caso contrario, no modifica el tablero y devuelve `False`."""
 
-    if columna >= 0 and columna < 10:
+    if columna >= 0 and columna < len(tablero[0]):
 
         aux = tablero[0][columna]
 
@@ -152,7 +164,7 @@ def rotar_abajo(tablero: list[list[int]], columna: int) -> bool:
         rotación modificando el tablero y devuelve `True`.
         Caso contrario, no modifica el tablero y devuelve `False`."""
 
-    if columna >= 0 and columna < 10:
+    if columna >= 0 and columna < len(tablero[0]):
 
         aux = tablero[-1][columna]
 
@@ -177,23 +189,122 @@ def esta_ordenado(tablero: list[list[int]]) -> bool:
         - `tablero` es una lista de lista de enteros de cualquier dimensión.
         - Los elementos de `tablero` no tienen números repetidos.
     """
-    # filas_ordenadas = 0
+    esperado = 1
+    for fila in tablero:
+        for valor in fila:
+            if valor != esperado:
+                return False
+            esperado += 1
+
+    return True
+
+
+def contar_desordenados(tablero: list[list[int]]) -> int:
+    """
+    Devuelve la cantidad de casilleros del tablero que no tienen el valor que
+    les corresponde en el tablero ordenado. El tablero está ordenado si y sólo
+    si el resultado es cero.
+
+    PRECONDICIONES:
+        - `tablero` es una lista de lista de enteros de cualquier dimensión.
+    """
+    desordenados = 0
+    esperado = 1
+    for fila in tablero:
+        for valor in fila:
+            if valor != esperado:
+                desordenados += 1
+            esperado += 1
+
+    return desordenados
+
+
+def _desordenados_en_linea(
+    tablero: list[list[int]], direccion: str, indice: int
+) -> int:
+    """Cuenta los casilleros desordenados de la fila (direcciones 'a' y 'd')
+    o de la columna (direcciones 'w' y 's') indicada por `indice`."""
+    n_columnas = len(tablero[0])
+    desordenados = 0
+    if direccion in "ad":
+        esperado = indice * n_columnas + 1
+        for valor in tablero[indice]:
+            if valor != esperado:
+                desordenados += 1
+            esperado += 1
+    else:
+        esperado = indice + 1
+        for fila in tablero:
+            if fila[indice] != esperado:
+                desordenados += 1
+            esperado += n_columnas
+
+    return desordenados
+
+
+def mover(tablero: list[list[int]], direccion: str, indice: int) -> bool:
+    """
+    Aplica la rotación indicada por `direccion`, con la notación de la
+    interfaz: 'w' (`rotar_arriba`), 'a' (`rotar_izquierda`), 's'
+    (`rotar_abajo`) o 'd' (`rotar_derecha`).
+
+    POSTCONDICIONES:
+        - Devuelve lo mismo que la rotación correspondiente, o `False` sin
+        modificar el tablero si la dirección es desconocida.
+    """
+    if direccion == "w":
+        return rotar_arriba(tablero, indice)
+    if direccion == "a":
+        return rotar_izquierda(tablero, indice)
+    if direccion == "s":
+        return rotar_abajo(tablero, indice)
+    if direccion == "d":
+        return rotar_derecha(tablero, indice)
+    return False
+
+
+def es_movimiento_valido(tablero: list[list[int]], direccion: str, indice: int) -> bool:
+    """
+    Indica si `direccion` es una de 'w', 'a', 's' o 'd' y si `indice` es un
+    índice válido de fila (para 'a' y 'd') o de columna (para 'w' y 's').
+    """
+    if direccion in ("a", "d"):
+        return 0 <= indice < len(tablero)
+    if direccion in ("w", "s"):
+        return 0 <= indice < len(tablero[0])
+    return False
+
+
+def mover_contando(
+    tablero: list[list[int]], direccion: str, indice: int, desordenados: int
+) -> int | None:
+    """
+    Igual que `mover`, pero además actualiza la cuenta de casilleros
+    desordenados mirando sólo la fila o columna rotada.
 
-    # for fila in range(len(tablero) - 1):
-    #     if tablero[fila] == sorted(tablero[fila]):
-    #         filas_ordenadas += 1
-    #         if filas_ordenadas == len(tablero):
-    #             return True
-    #     return False
-    cant_filas = len(tablero)
-    cant_columnas = len(tablero[0])
+    PRECONDICIONES:
+        - `desordenados` es el valor de `contar_desordenados(tablero)` antes
+        del movimiento.
 
-    tablero_ordenado = crear_tablero(cant_filas, cant_columnas)
+    POSTCONDICIONES:
+        - Si el movimiento es válido, lo aplica y devuelve la nueva cantidad
+        de casilleros desordenados. Caso contrario, no modifica el tablero y
+        devuelve `None`.
 
-    return tablero == tablero_ordenado
+    EJEMPLO:
+        >>> tablero = crear_tablero(3, 3)
+        >>> mover_contando(tablero, "a", 1, 0)
+        3
+    """
+    if not es_movimiento_valido(tablero, direccion, indice):
+        return None
+
+    antes = _desordenados_en_linea(tablero, direccion, indice)
+    mover(tablero, direccion, indice)
+    return desordenados - antes + _desordenados_en_linea(tablero, direccion, indice)
 
 
-def mezclar_tablero(tablero: list[list[int]]):
+def mezclar_tablero(tablero: list[list[int]], generador: "random.Random | None" = None):
     """
     Realiza ITERACIONES_RANDOM movimientos aleatorios al juego, siendo un
     movimiento cualquiera de las cuatro rotaciones sobre cualquier índice
@@ -201,14 +312,277 @@ def mezclar_tablero(tablero: list[list[int]]):
 
     PRECONDICIONES:
         - `tablero` es una lista de lista de enteros de cualquier dimensión.
+        - `generador` es `None`, para usar el módulo `random`, o una instancia
+        de `random.Random`; pasar una con semilla fija hace la mezcla
+        reproducible.
     """
+    if generador is None:
+        import random
+
+        generador = random
 
     for i in range(ITERACIONES_RANDOM):
-        fila_random = random.randint(0, len(tablero) - 1)
-        columna_random = random.randint(0, len(tablero[0]) - 1)
+        fila_random = generador.randint(0, len(tablero) - 1)
+        columna_random = generador.randint(0, len(tablero[0]) - 1)
 
         rotar_izquierda(tablero, fila_random)
         rotar_arriba(tablero, columna_random)
         rotar_derecha(tablero, fila_random)
         rotar_abajo(tablero, columna_random)
     return tablero
+
+
+def _resolver_bfs_bidireccional(
+    estado: bytes,
+    objetivo: bytes,
+    movimientos: list,
+    profundidad_maxima: int | None,
+    vencimiento: float | None,
+) -> list[tuple[str, int]] | None:
+    """Búsqueda en anchura simultánea desde `estado` y desde `objetivo`,
+    expandiendo siempre la frontera más chica. Devuelve el camino más corto
+    o `None` si no existe uno de largo a lo sumo `profundidad_maxima`."""
+    if estado == objetivo:
+        return []
+
+    # Cada estado visitado guarda (padre, movimiento, profundidad).
+    visitados_ini = {estado: (None, None, 0)}
+    visitados_fin = {objetivo: (None, None, 0)}
+    frontera_ini = [estado]
+    frontera_fin = [objetivo]
+    profundidad = 0
+
+    while frontera_ini and frontera_fin:
+        if profundidad_maxima is not None and profundidad >= profundidad_maxima:
+            return None
+        profundidad += 1
+
+        desde_inicio = len(frontera_ini) <= len(frontera_fin)
+        if desde_inicio:
+            frontera, visitados, otros = frontera_ini, visitados_ini, visitados_fin
+        else:
+            frontera, visitados, otros = frontera_fin, visitados_fin, visitados_ini
+
+        encuentro = None
+        nueva_frontera = []
+        prof_padre = visitados[frontera[0]][2]
+        for actual in frontera:
+            _verificar_vencimiento(vencimiento)
+            for movimiento, permutacion in movimientos:
+                siguiente = bytes([actual[k] for k in permutacion])
+                if siguiente in visitados:
+                    continue
+                visitados[siguiente] = (actual, movimiento, prof_padre + 1)
+                nueva_frontera.append(siguiente)
+                if siguiente in otros and (
+                    encuentro is None or otros[siguiente][2] < otros[encuentro][2]
+                ):
+                    encuentro = siguiente
+
+        if encuentro is not None:
+            return _unir_caminos(encuentro, visitados_ini, visitados_fin)
+
+        if desde_inicio:
+            frontera_ini = nueva_frontera
+        else:
+            frontera_fin = nueva_frontera
+
+    return None
+
+
+def _verificar_vencimiento(vencimiento: float | None) -> None:
+    """Lanza `TimeoutError` si ya pasó el instante `vencimiento`, medido con
+    `time.monotonic`."""
+    if vencimiento is not None and time.monotonic() > vencimiento:
+        raise TimeoutError("Se agotó el tiempo para resolver el tablero")
+
+
+def _unir_caminos(
+    encuentro: bytes, visitados_ini: dict, visitados_fin: dict
+) -> list[tuple[str, int]]:
+    """Reconstruye el camino completo a partir del estado donde se cruzaron
+    ambas búsquedas."""
+    camino = []
+    actual = encuentro
+    while visitados_ini[actual][0] is not None:
+        padre, movimiento, _ = visitados_ini[actual]
+        camino.append(movimiento)
+        actual = padre
+    camino.reverse()
+
+    actual = encuentro
+    while visitados_fin[actual][0] is not None:
+        padre, (direccion, indice), _ = visitados_fin[actual]
+        camino.append((INVERSOS[direccion], indice))
+        actual = padre
+    return camino
+
+
+def _heuristica(estado: bytes, n_filas: int, n_columnas: int) -> int:
+    """Cota inferior admisible de la cantidad de movimientos restantes.
+
+    Un movimiento desplaza una única línea un lugar, así que cada ficha se
+    acerca a lo sumo un paso a su destino, y la suma de las distancias
+    (toroidales) baja a lo sumo en el largo de la línea más larga."""
+    total = 0
+    maxima = 0
+    for posicion, valor in enumerate(estado):
+        fila, columna = divmod(posicion, n_columnas)
+        fila_obj, columna_obj = divmod(valor - 1, n_columnas)
+        df = abs(fila - fila_obj)
+        dc = abs(columna - columna_obj)
+        distancia = min(df, n_filas - df) + min(dc, n_columnas - dc)
+        total += distancia
+        if distancia > maxima:
+            maxima = distancia
+    largo = max(n_filas, n_columnas)
+    return max(maxima, -(-total // largo))
+
+
+def _es_redundante(anterior: tuple[str, int], movimiento: tuple[str, int]) -> bool:
+    """Indica si `movimiento` no hace falta probarlo luego de `anterior` en
+    una búsqueda de caminos mínimos: si lo deshace, o si ambos mueven líneas
+    distintas del mismo eje (y por lo tanto conmutan) y no están en orden
+    creciente de índice, que es el orden con el que se prueba la otra
+    variante. Es el mismo criterio que usa `movimientos.simplificar`."""
+    if movimiento == (INVERSOS[anterior[0]], anterior[1]):
+        return True
+    mismo_eje = (movimiento[0] in ("a", "d")) == (anterior[0] in ("a", "d"))
+    return mismo_eje and movimiento[1] < anterior[1]
+
+
+def _resolver_ida_estrella(
+    estado: bytes,
+    objetivo: bytes,
+    movimientos: list,
+    n_filas: int,
+    n_columnas: int,
+    profundidad_maxima: int | None,
+    heuristica: Callable[[bytes], int] | None,
+    vencimiento: float | None,
+    tabla: "transposicion.TablaTransposicion | None",
+) -> list[tuple[str, int]] | None:
+    """IDA* con la heurística de `_heuristica`, combinada con `heuristica` si
+    se indica. Devuelve un camino óptimo o `None` si no existe uno de largo a
+    lo sumo `profundidad_maxima`.
+
+    Si se indica `tabla`, guarda para cada estado la iteración y el menor
+    costo con el que se lo visitó, y no vuelve a explorar un estado al que
+    llega, en la misma iteración, con un costo igual o mayor."""
+    camino = []
+
+    def cota_inferior(actual):
+        h = _heuristica(actual, n_filas, n_columnas)
+        if heuristica is not None:
+            h = max(h, heuristica(actual))
+        return h
+
+    def buscar(actual, costo, cota, anterior):
+        _verificar_vencimiento(vencimiento)
+        h = cota_inferior(actual)
+        if costo + h > cota:
+            return costo + h
+        if actual == objetivo:
+            return -1
+        if tabla is not None:
+            visitado = tabla.obtener(actual)
+            if visitado is not None and visitado[0] == cota and visitado[1] <= costo:
+                return None
+            tabla.guardar(actual, (cota, costo))
+        minimo = None
+        for movimiento, permutacion in movimientos:
+            if anterior is not None and _es_redundante(anterior, movimiento):
+                continue
+            siguiente = bytes([actual[k] for k in permutacion])
+            camino.append(movimiento)
+            resultado = buscar(siguiente, costo + 1, cota, movimiento)
+            if resultado == -1:
+                return -1
+            camino.pop()
+            if resultado is None:
+                continue
+            if minimo is None or resultado < minimo:
+                minimo = resultado
+        return minimo
+
+    cota = cota_inferior(estado)
+    while profundidad_maxima is None or cota <= profundidad_maxima:
+        resultado = buscar(estado, 0, cota, None)
+        if resultado == -1:
+            return camino
+        if resultado is None:
+            return None
+        cota = resultado
+    return None
+
+
+def resolver(
+    tablero: list[list[int]],
+    profundidad_maxima: int | None = None,
+    heuristica: Callable[[bytes], int] | None = None,
+    tiempo_limite: float | None = None,
+    tabla: "transposicion.TablaTransposicion | None" = None,
+) -> list[tuple[str, int]] | None:
+    """
+    Busca la secuencia más corta de movimientos que lleva `tablero` al orden
+    de `crear_tablero`.
+
+    Cada movimiento es una tupla `(direccion, indice)` con la misma notación
+    que usa la interfaz: 'w' (`rotar_arriba`), 'a' (`rotar_izquierda`), 's'
+    (`rotar_abajo`) y 'd' (`rotar_derecha`). Para tableros de hasta
+    MAX_CASILLEROS_BFS casilleros se usa una búsqueda en anchura
+    bidireccional; para tableros más grandes, IDA* con una heurística
+    admisible, que se puede reforzar con `heuristica` (por ejemplo, la de
+    una base de patrones del módulo `patrones`).
+
+    PRECONDICIONES:
+        - `tablero` es una lista de lista de enteros con los números del 1 al
+        `n_filas * n_columnas`, sin repetir, y a lo sumo 255 casilleros.
+        - Si `profundidad_maxima` es `None` en un tablero grande, el tablero
+        debe poder ordenarse (por ejemplo, si salió de `mezclar_tablero`).
+        - `heuristica`, si se indica, recibe el tablero aplanado como `bytes`
+        y nunca sobreestima la cantidad de movimientos restantes.
+        - `tabla`, si se indica, es una tabla de transposición que IDA* usa
+        para no repetir estados ya explorados.
+
+    POSTCONDICIONES:
+        - Devuelve la lista de movimientos de largo mínimo que ordena el
+        tablero, o `None` si no existe una de largo a lo sumo
+        `profundidad_maxima`.
+        - Si se indica `tiempo_limite` y la búsqueda tarda más de esos
+        segundos, lanza `TimeoutError`.
+        - No modifica el tablero original.
+
+    EJEMPLO:
+        >>> tablero = crear_tablero(3, 3)
+        >>> rotar_izquierda(tablero, 1)
+        True
+        >>> resolver(tablero)
+        [('d', 1)]
+    """
+    import permutaciones
+
+    n_filas = len(tablero)
+    n_columnas = len(tablero[0])
+    estado = bytes(valor for fila in tablero for valor in fila)
+    objetivo = bytes(range(1, n_filas * n_columnas + 1))
+    movimientos = list(permutaciones.tabla_movimientos(n_filas, n_columnas).items())
+    vencimiento = None
+    if tiempo_limite is not None:
+        vencimiento = time.monotonic() + tiempo_limite
+
+    if n_filas * n_columnas <= MAX_CASILLEROS_BFS:
+        return _resolver_bfs_bidireccional(
+            estado, objetivo, movimientos, profundidad_maxima, vencimiento
+        )
+    return _resolver_ida_estrella(
+        estado,
+        objetivo,
+        movimientos,
+        n_filas,
+        n_columnas,
+        profundidad_maxima,
+        heuristica,
+        vencimiento,
+        tabla,
+    )
@@ -1,9 +1,36 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
 import pprint
+import random
+import subprocess
 import sys
+import tempfile
 import traceback
 from typing import List
 
+import diferencial
+import espacio_estados
+import historial
+import instrumentacion
+import main as main_juego
+import mezcla
+import movimientos
+import pantalla
+import patrones
+import perfilado
+import pistas
+import registro
+import resolver_paralelo
+import servidor
+import permutaciones
 import sixteen
+import tablero_compacto
+import tablero_grande
+import tablero_persistente
+import transposicion
 
 # Si las pruebas se ven mal en tu terminal, probá cambiando el valor
 # de esta constante a True para desactivar los colores ANSI.
@@ -174,6 +201,855 @@ def test_08_tablero_no_esta_ordenado():
     )
 
 
+def aplicar_movimientos(tablero: List[List[int]], movimientos):
+    """Aplica sobre `tablero` una lista de movimientos `(direccion, indice)`."""
+    rotaciones = {
+        "w": sixteen.rotar_arriba,
+        "a": sixteen.rotar_izquierda,
+        "s": sixteen.rotar_abajo,
+        "d": sixteen.rotar_derecha,
+    }
+    for direccion, indice in movimientos:
+        rotaciones[direccion](tablero, indice)
+
+
+def test_09_resolver_tablero():
+    """Verifica que `resolver` encuentre la secuencia más corta que ordena el
+    tablero, tanto en tableros chicos como grandes."""
+    tablero = sixteen.crear_tablero(3, 3)
+    assert (
+        sixteen.resolver(tablero) == []
+    ), "`resolver` no devolvió una lista vacía para un tablero ordenado"
+
+    casos = [
+        (3, 3, [("a", 1), ("w", 2), ("d", 0)]),
+        (2, 3, [("s", 0), ("a", 1), ("w", 2), ("d", 0)]),
+        (4, 4, [("a", 2), ("w", 1), ("d", 3), ("s", 0)]),
+    ]
+    for filas, columnas, movimientos_mezcla in casos:
+        tablero = sixteen.crear_tablero(filas, columnas)
+        aplicar_movimientos(tablero, movimientos_mezcla)
+        solucion = sixteen.resolver(tablero)
+        assert solucion is not None and len(solucion) <= len(
+            movimientos_mezcla
+        ), f"`resolver` devolvió {solucion} para la mezcla {movimientos_mezcla}"
+        aplicar_movimientos(tablero, solucion)
+        validar_estado(sixteen.crear_tablero(filas, columnas), tablero)
+
+
+def test_10_tablero_compacto():
+    """Verifica que `TableroCompacto` rote igual que las funciones de
+    `sixteen`, que se pueda usar como clave y que convierta de ida y vuelta."""
+    tablero = sixteen.crear_tablero(3, 4)
+    compacto = tablero_compacto.TableroCompacto.desde_lista(tablero)
+    assert compacto.esta_ordenado(), "El tablero compacto inicial no está ordenado"
+
+    movimientos = [("a", 1), ("w", 3), ("d", 2), ("s", 0), ("w", 1), ("a", 0)]
+    for direccion, indice in movimientos:
+        aplicar_movimientos(tablero, [(direccion, indice)])
+        compacto = compacto.aplicar(direccion, indice)
+        validar_estado(tablero, compacto.a_lista())
+
+    assert compacto.rotar_izquierda(3) is None, "Rotó una fila inválida"
+    assert compacto.rotar_arriba(-1) is None, "Rotó una columna inválida"
+    otro = tablero_compacto.TableroCompacto.desde_lista(tablero)
+    assert (
+        otro == compacto and len({otro, compacto}) == 1
+    ), "Dos tableros compactos iguales no se consideran el mismo"
+    assert not compacto.esta_ordenado(), "El tablero compacto mezclado está ordenado"
+
+
+def test_11_permutaciones_movimientos():
+    """Verifica que aplicar una secuencia de movimientos compuesta en una
+    única permutación equivalga a aplicar cada rotación por separado."""
+    movimientos = [("a", 0), ("w", 4), ("d", 2), ("s", 1), ("a", 1), ("w", 0)]
+    tablero = sixteen.crear_tablero(3, 5)
+    aplicar_movimientos(tablero, movimientos)
+
+    tablero_permutado = sixteen.crear_tablero(3, 5)
+    permutaciones.aplicar_movimientos(tablero_permutado, movimientos)
+    validar_estado(tablero, tablero_permutado)
+
+    identidad = permutaciones.componer(3, 5, [("w", 2)] * 3)
+    assert identidad == tuple(
+        range(15)
+    ), "Tres rotaciones de una columna de largo tres no dan la identidad"
+
+    # La composición debe coincidir con encadenar las permutaciones de la
+    # tabla de a una.
+    tabla = permutaciones.tabla_movimientos(4, 6)
+    esperada = tuple(range(24))
+    secuencia = mezcla.generar_movimientos(4, 6, 200, random.Random(11))
+    for movimiento in secuencia:
+        esperada = tuple(esperada[k] for k in tabla[movimiento])
+    assert permutaciones.componer(4, 6, secuencia) == esperada
+
+
+def test_12_lote_equivalente():
+    """Verifica que las operaciones sobre lotes de `lote` den los mismos
+    tableros que las funciones de `sixteen` aplicadas de a uno."""
+    import numpy
+
+    import lote
+
+    tableros = [sixteen.crear_tablero(3, 4) for _ in range(4)]
+    lote_tableros = lote.crear_lote(4, 3, 4)
+    validar_estado(tableros[0], lote.a_tableros(lote_tableros)[0])
+
+    for direccion, indice in [("a", 2), ("w", 3), ("d", 0), ("s", 1)]:
+        for tablero in tableros:
+            aplicar_movimientos(tablero, [(direccion, indice)])
+        rotacion = {
+            "w": lote.rotar_arriba,
+            "a": lote.rotar_izquierda,
+            "s": lote.rotar_abajo,
+            "d": lote.rotar_derecha,
+        }[direccion]
+        assert rotacion(lote_tableros, indice), "Rotación válida devolvió `False`"
+    assert not lote.rotar_izquierda(lote_tableros, 3), "Rotó una fila inválida"
+
+    movimientos = [("a", 1), ("s", 3), ("d", 2), ("w", 0)]
+    lote.aplicar_movimientos(
+        lote_tableros,
+        numpy.array([direccion for direccion, _ in movimientos]),
+        numpy.array([indice for _, indice in movimientos]),
+    )
+    for tablero, movimiento in zip(tableros, movimientos):
+        aplicar_movimientos(tablero, [movimiento])
+    for tablero, tablero_lote in zip(tableros, lote.a_tableros(lote_tableros)):
+        validar_estado(tablero, tablero_lote)
+
+    ordenados = lote.crear_lote(2, 3, 4)
+    lote.rotar_abajo(ordenados[1:], 2)
+    assert lote.esta_ordenado(ordenados).tolist() == [
+        True,
+        False,
+    ], "`esta_ordenado` del lote no coincide con el de cada tablero"
+
+
+def test_13_conteo_incremental_desordenados():
+    """Verifica que `mover_contando` mantenga la misma cuenta que
+    `contar_desordenados` recalculada desde cero en cada movimiento."""
+    tablero = sixteen.crear_tablero(4, 5)
+    desordenados = sixteen.contar_desordenados(tablero)
+    assert desordenados == 0, "Un tablero recién creado tiene desordenados"
+
+    movimientos = [("a", 3), ("w", 4), ("w", 4), ("d", 0), ("s", 2), ("s", 4)]
+    for direccion, indice in movimientos:
+        desordenados = sixteen.mover_contando(tablero, direccion, indice, desordenados)
+        assert desordenados == sixteen.contar_desordenados(tablero), (
+            f"Cuenta incremental {desordenados} distinta de la real luego de "
+            f"mover {direccion},{indice}:\n{pprint.pformat(tablero)}"
+        )
+        assert (desordenados == 0) == sixteen.esta_ordenado(tablero)
+
+    assert (
+        sixteen.mover_contando(tablero, "a", 4, desordenados) is None
+    ), "`mover_contando` aceptó una fila inválida"
+
+
+def test_14_mezclas_reproducibles():
+    """Verifica que las mezclas con la misma semilla coincidan, que no tengan
+    movimientos que se cancelen y que respeten la distancia mínima pedida."""
+    primeras = list(mezcla.generar_mezclas(3, 4, 5, semilla=7))
+    segundas = list(mezcla.generar_mezclas(3, 4, 5, semilla=7))
+    for primera, segunda in zip(primeras, segundas):
+        validar_estado(primera, segunda)
+
+    generador = random.Random(7)
+    movimientos = mezcla.generar_movimientos(2, 3, 200, generador)
+    for anterior, siguiente in zip(movimientos, movimientos[1:]):
+        assert siguiente != (
+            sixteen.INVERSOS[anterior[0]],
+            anterior[1],
+        ), f"La mezcla deshace {anterior} con {siguiente}"
+
+    for tablero in mezcla.generar_mezclas(
+        3, 3, 5, semilla=3, profundidad=10, distancia_minima=5
+    ):
+        assert (
+            len(sixteen.resolver(tablero)) >= 5
+        ), f"Tablero más cerca de lo pedido:\n{pprint.pformat(tablero)}"
+
+    # Con una sola fila o columna la mezcla se corta antes de dar una vuelta.
+    for n_filas, n_columnas in ((1, 3), (4, 1), (1, 2)):
+        movimientos = mezcla.generar_movimientos(n_filas, n_columnas, 20, generador)
+        assert len(movimientos) == max(n_filas, n_columnas) - 1, movimientos
+        assert len(set(movimientos)) == 1, f"La mezcla se cancela: {movimientos}"
+    tablero = next(mezcla.generar_mezclas(1, 3, 1, semilla=0))
+    assert not sixteen.esta_ordenado(tablero), "No se mezcló el tablero de 1x3"
+
+
+def test_15_base_de_patrones():
+    """Verifica que la base de patrones se guarde y se vuelva a abrir, que
+    nunca sobreestime la distancia al orden y que `resolver` la pueda usar."""
+    with tempfile.TemporaryDirectory() as directorio:
+        base = patrones.obtener(3, 4, directorio)
+        assert os.path.exists(
+            patrones.ruta_por_defecto(3, 4, directorio)
+        ), "La base de patrones no se guardó en disco"
+        reabierta = patrones.BaseDePatrones(patrones.ruta_por_defecto(3, 4, directorio))
+        assert reabierta.grupos == base.grupos
+
+        for tablero in mezcla.generar_mezclas(3, 4, 5, semilla=11, profundidad=7):
+            estado = bytes(valor for fila in tablero for valor in fila)
+            solucion = sixteen.resolver(tablero, heuristica=base)
+            assert reabierta.heuristica(estado) <= len(solucion), (
+                "La base de patrones sobreestima la distancia de:\n"
+                f"{pprint.pformat(tablero)}"
+            )
+            assert len(solucion) == len(
+                sixteen.resolver(tablero)
+            ), "`resolver` con patrones no encontró la solución más corta"
+        reabierta.cerrar()
+
+
+def test_16_tarea_resolver_paralelo():
+    """Verifica la tarea que corre cada proceso de `resolver_paralelo`:
+    decodificar el tablero compacto, resolverlo y respetar el tiempo límite."""
+    tablero = sixteen.crear_tablero(3, 3)
+    aplicar_movimientos(tablero, [("a", 0), ("s", 2)])
+    compacto = tablero_compacto.TableroCompacto.desde_lista(tablero)
+    indice, solucion, estado = resolver_paralelo._resolver_compacto(
+        7, 3, 3, compacto.casilleros, None, None
+    )
+    assert (indice, estado) == (7, resolver_paralelo.RESUELTO)
+    aplicar_movimientos(tablero, solucion)
+    validar_estado(sixteen.crear_tablero(3, 3), tablero)
+
+    tablero = next(mezcla.generar_mezclas(5, 5, 1, semilla=1, profundidad=40))
+    compacto = tablero_compacto.TableroCompacto.desde_lista(tablero)
+    _, solucion, estado = resolver_paralelo._resolver_compacto(
+        0, 5, 5, compacto.casilleros, None, 0.01
+    )
+    assert (solucion, estado) == (
+        None,
+        resolver_paralelo.TIEMPO_AGOTADO,
+    ), "La tarea no respetó el tiempo límite"
+
+    # El lote completo, con dos procesos: cada tablero vuelve una sola vez,
+    # resuelto, y nunca hay más de PENDIENTES_POR_PROCESO tareas en vuelo
+    # por proceso.
+    tableros = list(mezcla.generar_mezclas(3, 3, 20, semilla=5, profundidad=6))
+    leidos = []
+
+    def leer_tableros():
+        for tablero in tableros:
+            leidos.append(tablero)
+            yield tablero
+
+    indices = []
+    limite = 2 * resolver_paralelo.PENDIENTES_POR_PROCESO
+    for indice, solucion, estado in resolver_paralelo.resolver_lote(
+        leer_tableros(), procesos=2
+    ):
+        assert (
+            len(leidos) - len(indices) <= limite
+        ), f"Hubo {len(leidos) - len(indices)} tareas en vuelo"
+        assert estado == resolver_paralelo.RESUELTO
+        tablero = [fila[:] for fila in tableros[indice]]
+        aplicar_movimientos(tablero, solucion)
+        validar_estado(sixteen.crear_tablero(3, 3), tablero)
+        indices.append(indice)
+    assert sorted(indices) == list(range(20)), f"Se devolvieron {sorted(indices)}"
+
+
+def test_17_tablero_grande():
+    """Verifica que `TableroGrande` rote igual que las funciones de `sixteen`
+    en tableros de más de diez filas y columnas, validando los índices contra
+    las dimensiones reales."""
+    tablero = sixteen.crear_tablero(12, 15)
+    grande = tablero_grande.TableroGrande(12, 15)
+    movimientos = [("a", 11), ("w", 14), ("d", 3), ("s", 11), ("a", 11), ("w", 0)]
+    for direccion, indice in movimientos:
+        aplicar_movimientos(tablero, [(direccion, indice)])
+        rotacion = {
+            "w": grande.rotar_arriba,
+            "a": grande.rotar_izquierda,
+            "s": grande.rotar_abajo,
+            "d": grande.rotar_derecha,
+        }[direccion]
+        assert rotacion(indice), "Rotación válida devolvió `False`"
+        validar_estado(tablero, grande.a_lista())
+        assert grande.esta_ordenado() == sixteen.esta_ordenado(tablero)
+
+    assert not grande.rotar_izquierda(12), "Rotó una fila inválida"
+    assert not grande.rotar_arriba(15), "Rotó una columna inválida"
+    assert not sixteen.rotar_arriba(tablero, 15), "Rotó una columna inválida"
+    assert grande[11, 14] == tablero[11][14]
+
+    for direccion, indice in reversed(movimientos):
+        aplicar_movimientos(tablero, [(sixteen.INVERSOS[direccion], indice)])
+    validar_estado(sixteen.crear_tablero(12, 15), tablero)
+
+    # Rachas de rotaciones del mismo eje dejan desplazamientos pendientes
+    # que se aplican al cambiar de eje; el tablero que se ve no cambia.
+    tablero = sixteen.crear_tablero(12, 15)
+    grande = tablero_grande.TableroGrande(12, 15)
+    rotaciones = {
+        "w": grande.rotar_arriba,
+        "a": grande.rotar_izquierda,
+        "s": grande.rotar_abajo,
+        "d": grande.rotar_derecha,
+    }
+    generador = random.Random(17)
+    for _ in range(300):
+        direccion = generador.choice("wwwaaasd")
+        indice = generador.randrange(15 if direccion in "ws" else 12)
+        aplicar_movimientos(tablero, [(direccion, indice)])
+        rotaciones[direccion](indice)
+        fila, columna = generador.randrange(12), generador.randrange(15)
+        assert grande[fila, columna] == tablero[fila][columna]
+    validar_estado(tablero, grande.a_lista())
+    assert grande.esta_ordenado() == sixteen.esta_ordenado(tablero)
+
+
+def test_18_pantalla_redibuja_diferencias():
+    """Verifica que `Pantalla` dibuje el primer cuadro completo y luego sólo
+    los casilleros que cambiaron, con una única escritura por cuadro."""
+    salida = io.StringIO()
+    dibujo = pantalla.Pantalla(3, salida=salida)
+    tablero = sixteen.crear_tablero(3, 3)
+    dibujo.dibujar(tablero)
+    for linea in pantalla.formatear_tablero(tablero, 3):
+        assert linea in salida.getvalue(), f"Falta la línea {linea!r}"
+
+    inicio = len(salida.getvalue())
+    sixteen.rotar_derecha(tablero, 2)
+    dibujo.dibujar(tablero)
+    cambios = salida.getvalue()[inicio:]
+    assert (
+        cambios.count("\033[") == 3 + 2
+    ), f"Se esperaba redibujar sólo los 3 casilleros de la fila: {cambios!r}"
+    assert " 9 " in cambios and " 1 " not in cambios
+
+    inicio = len(salida.getvalue())
+    dibujo.dibujar(tablero)
+    assert salida.getvalue()[inicio:] == "", "Se redibujó un tablero sin cambios"
+
+
+def test_19_reproduccion_sin_interaccion():
+    """Verifica que el modo de reproducción de `main` lea los movimientos de
+    un archivo, saltee las líneas inválidas y cuente los aplicados."""
+    archivo = io.StringIO("0,a\n\n1,w\nesto no\n1,s\n\u00b2,a\n0,d\nq\n2,a\n")
+    tablero = sixteen.crear_tablero(3, 3)
+    with contextlib.redirect_stderr(io.StringIO()) as errores:
+        cantidad, desordenados = main_juego.reproducir(
+            tablero, main_juego.leer_movimientos(archivo)
+        )
+    assert (cantidad, desordenados) == (
+        4,
+        0,
+    ), f"Se obtuvo {cantidad} movimientos y {desordenados} desordenados"
+    assert "Línea 4" in errores.getvalue(), "No se informó la línea inválida"
+    assert "Línea 6" in errores.getvalue(), "No se informó la línea inválida"
+    validar_estado(sixteen.crear_tablero(3, 3), tablero)
+
+    # Los índices fuera del tablero se informan con su línea por la salida
+    # de errores, no en el resumen, y no cuentan como movimientos.
+    archivo = io.StringIO("9,a\n0,a\n")
+    tablero = sixteen.crear_tablero(2, 2)
+    with contextlib.redirect_stdout(io.StringIO()) as salida:
+        with contextlib.redirect_stderr(io.StringIO()) as errores:
+            cantidad, _ = main_juego.reproducir(
+                tablero, main_juego.leer_movimientos(archivo, tablero)
+            )
+    assert cantidad == 1, f"Se contaron {cantidad} movimientos en lugar de 1"
+    assert "Línea 1: Indice invalido" in errores.getvalue(), errores.getvalue()
+    assert salida.getvalue() == "", f"Se escribió en la salida: {salida.getvalue()!r}"
+
+    # Sin la cantidad de desordenados, `aplicar_movimiento` se usa como antes.
+    tablero = sixteen.crear_tablero(2, 2)
+    assert main_juego.aplicar_movimiento(tablero, "a", 0) is None
+    validar_estado([[2, 1], [3, 4]], tablero)
+
+
+def test_20_registro_binario():
+    """Verifica que un registro binario guarde un byte por movimiento y que
+    al leerlo se obtengan los mismos movimientos y tableros intermedios."""
+    generador = random.Random(4)
+    movimientos = mezcla.generar_movimientos(
+        4, 5, 3 * registro.INTERVALO_INSTANTANEAS + 10, generador
+    )
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "partida.bin")
+        with registro.EscritorRegistro(ruta, 4, 5, 99) as escritor:
+            for direccion, indice in movimientos:
+                escritor.registrar(direccion, indice)
+        assert os.path.getsize(ruta) == registro._ENCABEZADO.size + len(movimientos)
+
+        with registro.LectorRegistro(ruta) as lector:
+            assert (lector.n_filas, lector.n_columnas, lector.semilla) == (4, 5, 99)
+            assert list(lector.movimientos()) == movimientos
+            assert lector.movimiento(17) == movimientos[17]
+
+            for numero in (0, 1, 1500, len(movimientos), 700):
+                esperado = registro.tablero_inicial(4, 5, 99)
+                aplicar_movimientos(esperado, movimientos[:numero])
+                validar_estado(esperado, lector.tablero_en(numero))
+
+        # Una semilla que no entra en el encabezado se rechaza antes de
+        # crear el archivo, y `main` la rechaza al leer los argumentos.
+        ruta = os.path.join(directorio, "semilla.bin")
+        try:
+            registro.EscritorRegistro(ruta, 4, 5, 2**64)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Se aceptó una semilla de más de 64 bits")
+        assert not os.path.exists(ruta), "Se creó el registro de una semilla inválida"
+        proceso = subprocess.run(
+            [sys.executable, "main.py", "--registrar", ruta, "--semilla", str(2**64)],
+            input="",
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        assert proceso.returncode == 2 and "--semilla" in proceso.stderr, proceso
+        assert not os.path.exists(ruta), "Se creó el registro de una semilla inválida"
+
+
+def test_21_simplificar_movimientos():
+    """Verifica que `simplificar` cancele movimientos opuestos, reduzca
+    vueltas completas, ordene los que conmutan y conserve el resultado."""
+    casos = [
+        ([("a", 1), ("d", 1)], []),
+        ([("w", 2)] * 3, []),
+        ([("w", 2)] * 2, [("s", 2)]),
+        (
+            [("a", 2), ("a", 0), ("w", 1), ("w", 0)],
+            [("a", 0), ("a", 2), ("w", 0), ("w", 1)],
+        ),
+        ([("a", 0), ("w", 1), ("s", 1), ("a", 0)], [("a", 0), ("a", 0)]),
+    ]
+    for secuencia, esperada in casos:
+        simplificada = movimientos.simplificar(3, 4, secuencia)
+        assert simplificada == esperada, (
+            f"Se esperaba {esperada} al simplificar {secuencia}, se obtuvo "
+            f"{simplificada}"
+        )
+
+    secuencia = mezcla.generar_movimientos(3, 4, 300, random.Random(2))
+    simplificada = movimientos.simplificar(3, 4, secuencia)
+    tablero = sixteen.crear_tablero(3, 4)
+    aplicar_movimientos(tablero, secuencia)
+    tablero_simplificado = sixteen.crear_tablero(3, 4)
+    aplicar_movimientos(tablero_simplificado, simplificada)
+    validar_estado(tablero, tablero_simplificado)
+    assert movimientos.simplificar(3, 4, simplificada) == simplificada
+
+
+def test_22_tabla_transposicion():
+    """Verifica los contadores y el desalojo de `TablaTransposicion`, y que
+    `resolver` siga encontrando soluciones mínimas cuando la usa."""
+    tabla = transposicion.TablaTransposicion(2)
+    tabla.guardar(b"a", 1)
+    tabla.guardar(b"b", 2)
+    assert tabla.obtener(b"a") == 1
+    tabla.guardar(b"c", 3)
+    assert (
+        b"a" in tabla and b"b" not in tabla
+    ), "El reloj desalojó la entrada consultada en lugar de la otra"
+    assert tabla.obtener(b"b") is None
+    assert tabla.estadisticas() == {
+        "entradas": 2,
+        "capacidad": 2,
+        "aciertos": 1,
+        "fallos": 1,
+        "desalojos": 1,
+    }
+
+    for tablero in mezcla.generar_mezclas(3, 4, 4, semilla=5, profundidad=7):
+        chica = transposicion.TablaTransposicion(50)
+        solucion = sixteen.resolver(tablero, tabla=chica)
+        assert len(solucion) == len(
+            sixteen.resolver(tablero)
+        ), "`resolver` con tabla de transposición no encontró la solución más corta"
+        aplicar_movimientos(tablero, solucion)
+        validar_estado(sixteen.crear_tablero(3, 4), tablero)
+
+
+def test_23_sesion_servidor():
+    """Verifica que una sesión del servidor aplique movimientos con la
+    sintaxis de la interfaz y responda sólo con la línea que cambió."""
+    sesion = servidor.Sesion(3, 3, None)
+    sesion.tablero = sixteen.crear_tablero(3, 3)
+    sesion.desordenados = 0
+
+    assert sesion.procesar("1,a") == {
+        "fila": 1,
+        "valores": [5, 6, 4],
+        "ordenado": False,
+    }
+    assert sesion.procesar("2,w") == {
+        "columna": 2,
+        "valores": [4, 9, 3],
+        "ordenado": False,
+    }
+    assert "error" in sesion.procesar("7,w"), "Se aceptó una columna inválida"
+    assert "error" in sesion.procesar("1;a"), "Se aceptó un movimiento mal escrito"
+    sesion.procesar("2,s")
+    assert sesion.procesar("1,d")["ordenado"], "No se detectó el tablero ordenado"
+
+    async def conversar(*pedidos):
+        atendiendo = await asyncio.start_server(
+            servidor.atender, "127.0.0.1", 0, limit=servidor.MAX_LINEA
+        )
+        async with atendiendo:
+            puerto = atendiendo.sockets[0].getsockname()[1]
+            lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+            for pedido in pedidos:
+                escritor.write(pedido)
+            await escritor.drain()
+            respuestas = (await lector.read()).splitlines()
+            escritor.close()
+            return [json.loads(respuesta) for respuesta in respuestas]
+
+    # Bytes que no son UTF-8 y líneas demasiado largas responden un error
+    # en lugar de cortar la conexión sin respuesta.
+    respuestas = asyncio.run(conversar(b"\xff\xfe\n", b"q\n"))
+    assert len(respuestas) == 1 and "error" in respuestas[0], respuestas
+    respuestas = asyncio.run(
+        conversar(b"x" * (servidor.MAX_LINEA + 1) + b"\n", b"nuevo 2 2\n")
+    )
+    assert len(respuestas) == 1 and "error" in respuestas[0], respuestas
+
+    # Pedidos que parecen números pero `int` no acepta también responden
+    # con un error.
+    respuestas = asyncio.run(
+        conversar(
+            b"nuevo 2 2 --1\n",
+            b"nuevo 2 2 -1\n",
+            "\u00b2,w\n".encode(),
+            b"1,\n",
+            b"q\n",
+        )
+    )
+    assert ["error" in respuesta for respuesta in respuestas] == [
+        True,
+        False,
+        True,
+        True,
+    ], respuestas
+
+
+def test_24_pistas():
+    """Verifica que seguir las pistas ordene el tablero con la menor
+    cantidad de movimientos posible."""
+    with tempfile.TemporaryDirectory() as directorio:
+        tablero = sixteen.crear_tablero(2, 3)
+        assert (
+            pistas.sugerir(tablero, directorio=directorio) is None
+        ), "Se sugirió mover un tablero ordenado"
+
+        mezcla.mezclar(tablero, 3, 10)
+        inicial = espacio_estados.distancia(tablero)
+        pasos = 0
+        while (
+            movimiento := pistas.sugerir(tablero, directorio=directorio)
+        ) is not None:
+            sixteen.mover(tablero, *movimiento)
+            pasos += 1
+        assert sixteen.esta_ordenado(tablero), "Las pistas no ordenaron el tablero"
+        assert pasos == inicial, f"Se usaron {pasos} pistas en lugar de {inicial}"
+
+        tablero = sixteen.crear_tablero(4, 4)
+        sixteen.rotar_izquierda(tablero, 2)
+        assert pistas.sugerir(tablero, directorio=directorio) == ("d", 2)
+
+        # Con más de 255 casilleros no se usa el resolvedor, sólo la
+        # aproximación que deja menos casilleros desordenados.
+        tablero = sixteen.crear_tablero(16, 16)
+        assert (
+            pistas.sugerir(tablero, directorio=directorio) is None
+        ), "Se sugirió mover un tablero ordenado"
+        sixteen.rotar_abajo(tablero, 7)
+        assert pistas.sugerir(tablero, directorio=directorio) == ("w", 7)
+
+        # En una mezcla larga de 4x4 la búsqueda óptima no termina a tiempo,
+        # y la pista aproximada nunca deshace el movimiento anterior.
+        (tablero,) = mezcla.generar_mezclas(4, 4, 1, semilla=3, profundidad=30)
+        anterior = None
+        for _ in range(10):
+            movimiento = pistas.sugerir(tablero, anterior, directorio)
+            if anterior is not None:
+                direccion, indice = anterior
+                assert movimiento != (
+                    sixteen.INVERSOS[direccion],
+                    indice,
+                ), f"La pista {movimiento} deshace el movimiento {anterior}"
+            sixteen.mover(tablero, *movimiento)
+            anterior = movimiento
+
+    # Sin numpy no se puede construir la tabla de distancias y la pista
+    # sale del resolvedor.
+    with tempfile.TemporaryDirectory() as directorio:
+        codigo = (
+            "import sys; sys.modules['numpy'] = None; import pistas, sixteen; "
+            "t = sixteen.crear_tablero(3, 3); sixteen.rotar_arriba(t, 1); "
+            f"print(pistas.sugerir(t, directorio={directorio!r}))"
+        )
+        proceso = subprocess.run(
+            [sys.executable, "-c", codigo],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        assert proceso.stdout.strip() == "('s', 1)", proceso.stdout
+        assert not os.listdir(directorio), "Se guardó una tabla sin numpy"
+
+
+def test_25_espacio_de_estados():
+    """Verifica el rango de las permutaciones y la distribución de
+    distancias de todos los tableros de 2x2 y 3x3."""
+    for numero in range(24):
+        assert espacio_estados.rango(espacio_estados.desrango(numero, 4)) == numero
+    assert espacio_estados.rango([1, 2, 3, 4]) == 0
+    assert espacio_estados.rango([4, 3, 2, 1]) == 23
+
+    tabla = espacio_estados.distancias(2, 2)
+    assert espacio_estados.histograma(tabla) == [1, 4, 10, 8, 1]
+
+    # En 3x3 cada rotación es un ciclo de tres casilleros, una permutación
+    # par, así que sólo se alcanza la mitad de los tableros.
+    tabla = espacio_estados.distancias(3, 3)
+    cuentas = espacio_estados.histograma(tabla)
+    assert sum(cuentas) == 181440
+    assert espacio_estados.numero_de_dios(tabla) == 8
+
+    tablero = sixteen.crear_tablero(3, 3)
+    sixteen.rotar_izquierda(tablero, 0)
+    sixteen.rotar_abajo(tablero, 2)
+    assert espacio_estados.distancia(tablero) == 2
+
+    with tempfile.TemporaryDirectory() as directorio:
+        guardada = espacio_estados.obtener(3, 3, directorio)
+        ruta = espacio_estados.ruta_por_defecto(3, 3, directorio)
+        assert os.path.exists(ruta), "La tabla de distancias no se guardó en disco"
+        assert espacio_estados.cargar(ruta, 3, 3) == tabla == guardada
+        assert espacio_estados.cargar(ruta, 2, 2) is None
+
+
+def test_26_instrumentacion():
+    """Verifica que la instrumentación cuente las llamadas sólo mientras
+    está activa y que al desactivarla se restauren las funciones."""
+    original = sixteen.rotar_izquierda
+    instrumentacion.reiniciar()
+    instrumentacion.activar()
+    try:
+        tablero = sixteen.crear_tablero(3, 3)
+        sixteen.mover(tablero, "a", 1)
+        sixteen.rotar_arriba(tablero, 0)
+        sixteen.esta_ordenado(tablero)
+    finally:
+        instrumentacion.desactivar()
+    sixteen.rotar_izquierda(tablero, 0)
+
+    assert sixteen.rotar_izquierda is original, "No se restauró la función"
+    datos = instrumentacion.instantanea()
+    assert datos["rotar_izquierda"]["llamadas"] == 1
+    assert datos["rotar_arriba"]["llamadas"] == 1
+    assert datos["esta_ordenado"]["llamadas"] == 1
+    assert datos["rotar_abajo"]["llamadas"] == 0
+    assert datos["rotar_izquierda"]["cubetas"][-1] == (float("inf"), 1)
+
+    texto = instrumentacion.texto_prometheus()
+    assert 'sixteen_operacion_segundos_count{operacion="esta_ordenado"} 1' in texto
+
+
+def test_27_tablero_persistente():
+    """Verifica que `TableroPersistente` rote igual que las funciones de
+    `sixteen`, sin modificar las versiones anteriores y compartiendo lo que
+    no cambió."""
+    generador = random.Random(20)
+    for n_filas, n_columnas in ((1, 1), (2, 3), (4, 4), (5, 9), (7, 2)):
+        tablero = sixteen.crear_tablero(n_filas, n_columnas)
+        persistente = tablero_persistente.TableroPersistente.ordenado(
+            n_filas, n_columnas
+        )
+        versiones = [(persistente, [fila[:] for fila in tablero])]
+        for _ in range(60):
+            direccion = generador.choice("wasd")
+            indice = generador.randrange(max(n_filas, n_columnas) + 1)
+            valido = sixteen.es_movimiento_valido(tablero, direccion, indice)
+            sixteen.mover(tablero, direccion, indice)
+            nuevo = persistente.aplicar(direccion, indice)
+            assert (nuevo is not None) == valido, "No coincide la validación"
+            if nuevo is not None:
+                persistente = nuevo
+            validar_estado(tablero, persistente.a_lista())
+            assert persistente.esta_ordenado() == sixteen.esta_ordenado(tablero)
+            versiones.append((persistente, [fila[:] for fila in tablero]))
+
+        for version, esperado in versiones:
+            validar_estado(esperado, version.a_lista())
+
+    original = tablero_persistente.TableroPersistente.ordenado(4, 9)
+    rotado = original.rotar_izquierda(2)
+    assert all(rotado._filas[f] is original._filas[f] for f in (0, 1, 3))
+    assert rotado._filas[2].segmentos is original._filas[2].segmentos
+    rotado = original.rotar_arriba(4)
+    assert rotado[0, 4] == original[1, 4]
+    assert rotado._filas[0].segmentos[0] is original._filas[0].segmentos[0]
+    assert rotado._filas[0].segmentos[2] is original._filas[0].segmentos[2]
+    assert rotado.rotar_abajo(4) == original
+
+
+def test_28_historial_deshacer_rehacer():
+    """Verifica que el historial deshaga y rehaga movimientos, que un
+    movimiento nuevo descarte lo que quedaba para rehacer y que se pueda
+    saltar a cualquier punto de una partida larga."""
+    tablero = sixteen.crear_tablero(3, 4)
+    inicial = [fila[:] for fila in tablero]
+    pasos = historial.Historial(tablero)
+    assert pasos.deshacer() is None, "Se deshizo un historial vacío"
+
+    for direccion, indice in (("a", 1), ("w", 3)):
+        sixteen.mover(tablero, direccion, indice)
+        pasos.registrar(tablero, direccion, indice)
+    assert pasos.deshacer() == ("s", 3)
+    assert pasos.rehacer() == ("w", 3)
+    assert pasos.rehacer() is None, "Se rehizo sin haber deshecho"
+    pasos.deshacer()
+    sixteen.mover(tablero, "s", 3)
+    sixteen.mover(tablero, "d", 2)
+    pasos.registrar(tablero, "d", 2)
+    assert pasos.rehacer() is None, "No se descartó lo que quedaba para rehacer"
+    assert len(pasos) == 2
+    assert pasos.ultimo == ("d", 2)
+    pasos.deshacer()
+    assert pasos.ultimo == ("a", 1)
+    pasos.rehacer()
+
+    generador = random.Random(21)
+    tableros = [[fila[:] for fila in tablero]]
+    for _ in range(3 * historial.INTERVALO_INSTANTANEAS):
+        direccion = generador.choice("wasd")
+        indice = generador.randrange(3)
+        sixteen.mover(tablero, direccion, indice)
+        pasos.registrar(tablero, direccion, indice)
+        tableros.append([fila[:] for fila in tablero])
+
+    for posicion in (700, 2, 300, len(pasos)):
+        pasos.ir_a(tablero, posicion)
+        validar_estado(tableros[posicion - 2], tablero)
+    pasos.ir_a(tablero, 0)
+    validar_estado(inicial, tablero)
+
+
+def test_29_arranque_sin_modulos_opcionales():
+    """Verifica que importar `main` no cargue los módulos que sólo se usan
+    en algunas corridas."""
+    opcionales = ("random", "numpy", "pistas", "registro", "historial")
+    proceso = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, main; print([m for m in {opcionales!r} if m in sys.modules])",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    assert proceso.stdout.strip() == "[]", f"Se cargaron {proceso.stdout.strip()}"
+
+
+def test_30_pruebas_diferenciales():
+    """Verifica que las implementaciones alternativas coincidan con `sixteen`
+    y que una implementación con un error se reduzca a un contraejemplo
+    mínimo."""
+    resultados = diferencial.comparar(
+        diferencial.candidatos(), casos=10, largo=100, max_lado=6, semilla=23
+    )
+    for nombre, resultado in resultados.items():
+        assert resultado["contraejemplo"] is None, f"{nombre} difiere de sixteen"
+        assert resultado["movimientos"] == 1000
+
+    def mover_con_error(tablero, direccion, indice):
+        # Rota a la izquierda en lugar de a la derecha.
+        if direccion == "d":
+            direccion = "a"
+        return tablero, sixteen.mover(tablero, direccion, indice)
+
+    con_error = diferencial.Candidato(
+        "con_error",
+        sixteen.crear_tablero,
+        mover_con_error,
+        lambda tablero: tablero,
+        sixteen.esta_ordenado,
+    )
+    resultados = diferencial.comparar([con_error], casos=5, semilla=23)
+    n_filas, n_columnas, movimientos = resultados["con_error"]["contraejemplo"]
+    assert movimientos == [("d", 0)], f"No se redujo: {movimientos}"
+    assert (n_filas, n_columnas) == (1, 3), "No se achicó el tablero"
+
+
+def test_31_perfil_por_fase():
+    """Verifica que el perfil cuente las llamadas de cada fase sin cambiar
+    lo que devuelven las funciones envueltas, y que guarde los datos de
+    cProfile."""
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "partida.prof")
+        perfil = perfilado.Perfil(ruta)
+        aplicar = perfil.envolver("aplicar_movimiento", main_juego.aplicar_movimiento)
+        verificar = perfil.envolver("esta_ordenado", sixteen.esta_ordenado)
+
+        tablero = sixteen.crear_tablero(3, 3)
+        assert aplicar(tablero, "a", 1, 0) == 3
+        assert aplicar(tablero, "d", 1, 3) == 0
+        assert verificar(tablero)
+        perfil.cerrar()
+        assert os.path.getsize(ruta) > 0, "No se guardaron los datos de cProfile"
+
+    encabezado, *filas = perfil.resumen()
+    assert "Llamadas" in encabezado
+    assert filas[0].split()[:2] == ["aplicar_movimiento", "2"]
+    assert filas[1].split()[:2] == ["esta_ordenado", "1"]
+
+    # La espera de la entrada y su interpretación son fases separadas.
+    perfil = perfilado.Perfil()
+    entradas = iter(["1;a", "1,a"])
+    esperar = perfil.envolver("esperar_entrada", lambda mensaje: next(entradas))
+    interpretar = perfil.envolver(
+        "interpretar_movimiento", main_juego.interpretar_movimiento
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        movimiento = main_juego.pedir_movimiento("> ", esperar, interpretar)
+    assert movimiento == ("a", 1)
+    _, *filas = perfil.resumen()
+    assert [fila.split()[:2] for fila in filas] == [
+        ["esperar_entrada", "2"],
+        ["interpretar_movimiento", "2"],
+    ]
+
+
+def test_32_memoria_compartida():
+    """Verifica que las operaciones de `lote` modifiquen directamente los
+    tableros de la memoria compartida y que otros procesos los vean."""
+    import lote
+    import memoria_compartida
+
+    tableros = [sixteen.crear_tablero(3, 4) for _ in range(6)]
+    for tablero in tableros[:4]:
+        sixteen.rotar_abajo(tablero, 2)
+
+    with memoria_compartida.AlmacenCompartido.crear(6, 3, 4, tableros) as almacen:
+        vista = almacen.lote(0, 2)
+        assert lote.rotar_arriba(vista, 2), "Rotación válida devolvió `False`"
+        validar_estado(sixteen.crear_tablero(3, 4), almacen.a_lista(1))
+
+        otro = memoria_compartida.AlmacenCompartido.conectar(almacen.nombre, 6, 3, 4)
+        validar_estado(sixteen.crear_tablero(3, 4), otro.a_lista(0))
+        lote.rotar_izquierda(otro.lote(5), 0)
+        otro.cerrar()
+        assert not lote.esta_ordenado(almacen.lote(5))[0]
+
+        del vista
+        assert memoria_compartida.contar_ordenados(almacen, procesos=2) == 3
+
+
 # Sólo se van a correr aquellos tests que estén mencionados dentro de la
 # siguiente constante
 TESTS = (
@@ -185,6 +1061,30 @@ TESTS = (
     test_06_rotar_arriba_tablero_cuadrado,
     test_07_tablero_esta_ordenado,
     test_08_tablero_no_esta_ordenado,
+    test_09_resolver_tablero,
+    test_10_tablero_compacto,
+    test_11_permutaciones_movimientos,
+    test_12_lote_equivalente,
+    test_13_conteo_incremental_desordenados,
+    test_14_mezclas_reproducibles,
+    test_15_base_de_patrones,
+    test_16_tarea_resolver_paralelo,
+    test_17_tablero_grande,
+    test_18_pantalla_redibuja_diferencias,
+    test_19_reproduccion_sin_interaccion,
+    test_20_registro_binario,
+    test_21_simplificar_movimientos,
+    test_22_tabla_transposicion,
+    test_23_sesion_servidor,
+    test_24_pistas,
+    test_25_espacio_de_estados,
+    test_26_instrumentacion,
+    test_27_tablero_persistente,
+    test_28_historial_deshacer_rehacer,
+    test_29_arranque_sin_modulos_opcionales,
+    test_30_pruebas_diferenciales,
+    test_31_perfil_por_fase,
+    test_32_memoria_compartida,
 )
 
 # El código que viene abajo tiene algunas *magias* para simplificar la corrida
@@ -0,0 +1,153 @@
+"""
+Representación compacta e inmutable de tableros del juego Sixteen
+"""
+
+from array import array
+
+MAX_CASILLEROS_BYTE = 255
+
+
+class TableroCompacto:
+    """Tablero de Sixteen guardado como una tira de bytes, fila por fila.
+
+    A diferencia de la lista de listas que usa el módulo `sixteen`, un
+    `TableroCompacto` es inmutable y se puede usar como clave de un
+    diccionario o elemento de un conjunto: cada rotación devuelve un tablero
+    nuevo. Los tableros de hasta MAX_CASILLEROS_BYTE casilleros usan un byte
+    por casillero; los más grandes, dos.
+    """
+
+    __slots__ = ("n_filas", "n_columnas", "casilleros", "_hash")
+
+    def __init__(self, n_filas: int, n_columnas: int, casilleros: bytes):
+        """Construye un tablero a partir de sus casilleros ya codificados.
+
+        PRECONDICIONES:
+            - `casilleros` tiene los `n_filas * n_columnas` valores del
+            tablero, fila por fila, con el ancho que indica `_tipo`.
+        """
+        self.n_filas = n_filas
+        self.n_columnas = n_columnas
+        self.casilleros = casilleros
+        self._hash = hash((n_filas, n_columnas, casilleros))
+
+    @staticmethod
+    def _tipo(n_filas: int, n_columnas: int) -> str:
+        """Código de `array` usado para un tablero de las dimensiones dadas."""
+        return "B" if n_filas * n_columnas <= MAX_CASILLEROS_BYTE else "H"
+
+    @classmethod
+    def ordenado(cls, n_filas: int, n_columnas: int) -> "TableroCompacto":
+        """Equivalente compacto de `sixteen.crear_tablero`."""
+        valores = array(
+            cls._tipo(n_filas, n_columnas), range(1, n_filas * n_columnas + 1)
+        )
+        return cls(n_filas, n_columnas, valores.tobytes())
+
+    @classmethod
+    def desde_lista(cls, tablero: list[list[int]]) -> "TableroCompacto":
+        """Convierte un tablero del módulo `sixteen` a su forma compacta.
+
+        PRECONDICIONES:
+            - `tablero` es una lista de lista de enteros positivos, todas las
+            filas del mismo largo.
+
+        POSTCONDICIONES:
+            - No modifica el tablero original.
+        """
+        n_filas = len(tablero)
+        n_columnas = len(tablero[0])
+        valores = array(cls._tipo(n_filas, n_columnas))
+        for fila in tablero:
+            valores.extend(fila)
+        return cls(n_filas, n_columnas, valores.tobytes())
+
+    def a_lista(self) -> list[list[int]]:
+        """Devuelve el tablero como una nueva lista de listas de enteros."""
+        valores = self._valores().tolist()
+        return [
+            valores[i : i + self.n_columnas]
+            for i in range(0, len(valores), self.n_columnas)
+        ]
+
+    def _valores(self) -> array:
+        """Copia mutable de los casilleros."""
+        valores = array(self._tipo(self.n_filas, self.n_columnas))
+        valores.frombytes(self.casilleros)
+        return valores
+
+    def _con_valores(self, valores: array) -> "TableroCompacto":
+        return TableroCompacto(self.n_filas, self.n_columnas, valores.tobytes())
+
+    def rotar_izquierda(self, fila: int) -> "TableroCompacto | None":
+        """Equivalente a `sixteen.rotar_izquierda`. Devuelve el tablero
+        rotado, o `None` si `fila` no es un índice de filas válido."""
+        if not 0 <= fila < self.n_filas:
+            return None
+        valores = self._valores()
+        inicio = fila * self.n_columnas
+        linea = valores[inicio : inicio + self.n_columnas]
+        valores[inicio : inicio + self.n_columnas] = linea[1:] + linea[:1]
+        return self._con_valores(valores)
+
+    def rotar_derecha(self, fila: int) -> "TableroCompacto | None":
+        """Equivalente a `sixteen.rotar_derecha`. Devuelve el tablero
+        rotado, o `None` si `fila` no es un índice de filas válido."""
+        if not 0 <= fila < self.n_filas:
+            return None
+        valores = self._valores()
+        inicio = fila * self.n_columnas
+        linea = valores[inicio : inicio + self.n_columnas]
+        valores[inicio : inicio + self.n_columnas] = linea[-1:] + linea[:-1]
+        return self._con_valores(valores)
+
+    def rotar_arriba(self, columna: int) -> "TableroCompacto | None":
+        """Equivalente a `sixteen.rotar_arriba`. Devuelve el tablero
+        rotado, o `None` si `columna` no es un índice de columnas válido."""
+        if not 0 <= columna < self.n_columnas:
+            return None
+        valores = self._valores()
+        linea = valores[columna :: self.n_columnas]
+        valores[columna :: self.n_columnas] = linea[1:] + linea[:1]
+        return self._con_valores(valores)
+
+    def rotar_abajo(self, columna: int) -> "TableroCompacto | None":
+        """Equivalente a `sixteen.rotar_abajo`. Devuelve el tablero
+        rotado, o `None` si `columna` no es un índice de columnas válido."""
+        if not 0 <= columna < self.n_columnas:
+            return None
+        valores = self._valores()
+        linea = valores[columna :: self.n_columnas]
+        valores[columna :: self.n_columnas] = linea[-1:] + linea[:-1]
+        return self._con_valores(valores)
+
+    def aplicar(self, direccion: str, indice: int) -> "TableroCompacto | None":
+        """Aplica un movimiento en la notación w/a/s/d de la interfaz."""
+        if direccion == "w":
+            return self.rotar_arriba(indice)
+        if direccion == "a":
+            return self.rotar_izquierda(indice)
+        if direccion == "s":
+            return self.rotar_abajo(indice)
+        if direccion == "d":
+            return self.rotar_derecha(indice)
+        return None
+
+    def esta_ordenado(self) -> bool:
+        """Equivalente a `sixteen.esta_ordenado`."""
+        return self == TableroCompacto.ordenado(self.n_filas, self.n_columnas)
+
+    def __eq__(self, otro: object) -> bool:
+        if not isinstance(otro, TableroCompacto):
+            return NotImplemented
+        return (
+            self.n_filas == otro.n_filas
+            and self.n_columnas == otro.n_columnas
+            and self.casilleros == otro.casilleros
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"TableroCompacto({self.a_lista()!r})"
@@ -0,0 +1,128 @@
+"""
+Tablero del juego Sixteen para dimensiones grandes, con rotaciones diferidas
+"""
+
+
+class TableroGrande:
+    """Tablero de Sixteen pensado para cientos de filas y columnas.
+
+    Los casilleros se guardan en una única lista, fila por fila, junto con
+    desplazamientos pendientes por fila o por columna (nunca de los dos
+    ejes a la vez, porque las rotaciones de filas y de columnas no
+    conmutan). Rotar una línea del mismo eje que los desplazamientos
+    pendientes sólo actualiza el suyo, en O(1). Rotar una línea del otro eje
+    primero aplica los pendientes: cada línea desplazada se reacomoda con
+    una única asignación de rebanada, sin recorrerla casillero por casillero
+    en Python, y las que no se movieron no se tocan. Así una racha de
+    rotaciones del mismo eje cuesta O(1) por rotación, y el cambio de eje
+    cuesta lo que miden las líneas que se rotaron desde el cambio anterior.
+    """
+
+    __slots__ = (
+        "n_filas",
+        "n_columnas",
+        "_valores",
+        "_eje",
+        "_desplazamientos",
+        "_pendientes",
+    )
+
+    def __init__(self, n_filas: int, n_columnas: int):
+        """Crea un tablero ordenado, igual al de `sixteen.crear_tablero`.
+
+        PRECONDICIONES:
+            - `n_filas` y `n_columnas` son enteros positivos.
+        """
+        self.n_filas = n_filas
+        self.n_columnas = n_columnas
+        self._valores = list(range(1, n_filas * n_columnas + 1))
+        # `_eje` es "filas" o "columnas" según a qué líneas correspondan los
+        # `_desplazamientos`; `_pendientes` son las líneas con uno distinto
+        # de cero.
+        self._eje = "filas"
+        self._desplazamientos = [0] * n_filas
+        self._pendientes = set()
+
+    @classmethod
+    def desde_lista(cls, tablero: list[list[int]]) -> "TableroGrande":
+        """Crea un `TableroGrande` con el contenido de un tablero del módulo
+        `sixteen`, sin modificar el original."""
+        nuevo = cls(len(tablero), len(tablero[0]))
+        nuevo._valores = [valor for fila in tablero for valor in fila]
+        return nuevo
+
+    def _linea(self, indice: int) -> slice:
+        """Rebanada de `_valores` con la fila o columna `indice` del eje de
+        los desplazamientos pendientes."""
+        if self._eje == "filas":
+            inicio = indice * self.n_columnas
+            return slice(inicio, inicio + self.n_columnas)
+        return slice(indice, None, self.n_columnas)
+
+    def _aplicar_pendientes(self) -> None:
+        """Reacomoda en `_valores` las líneas con desplazamientos pendientes
+        y los deja en cero. No cambia el tablero que se ve."""
+        for indice in self._pendientes:
+            linea = self._linea(indice)
+            valores = self._valores[linea]
+            desplazamiento = self._desplazamientos[indice]
+            self._valores[linea] = valores[desplazamiento:] + valores[:desplazamiento]
+            self._desplazamientos[indice] = 0
+        self._pendientes.clear()
+
+    def _rotar(self, eje: str, indice: int, paso: int) -> bool:
+        """Rota la línea `indice` de `eje` un lugar hacia el inicio
+        (`paso=1`: izquierda o arriba) o hacia el final (`paso=-1`)."""
+        largo = self.n_columnas if eje == "filas" else self.n_filas
+        cantidad = self.n_filas if eje == "filas" else self.n_columnas
+        if not 0 <= indice < cantidad:
+            return False
+        if self._eje != eje:
+            self._aplicar_pendientes()
+            self._eje = eje
+            self._desplazamientos = [0] * cantidad
+        desplazamiento = (self._desplazamientos[indice] + paso) % largo
+        self._desplazamientos[indice] = desplazamiento
+        if desplazamiento:
+            self._pendientes.add(indice)
+        else:
+            self._pendientes.discard(indice)
+        return True
+
+    def __getitem__(self, posicion: tuple[int, int]) -> int:
+        """Devuelve el valor del casillero `tablero[fila, columna]`."""
+        fila, columna = posicion
+        if self._eje == "filas":
+            columna = (columna + self._desplazamientos[fila]) % self.n_columnas
+        else:
+            fila = (fila + self._desplazamientos[columna]) % self.n_filas
+        return self._valores[fila * self.n_columnas + columna]
+
+    def a_lista(self) -> list[list[int]]:
+        """Devuelve el tablero como una nueva lista de listas de enteros."""
+        self._aplicar_pendientes()
+        return [
+            self._valores[inicio : inicio + self.n_columnas]
+            for inicio in range(0, len(self._valores), self.n_columnas)
+        ]
+
+    def rotar_izquierda(self, fila: int) -> bool:
+        """Equivalente a `sixteen.rotar_izquierda`."""
+        return self._rotar("filas", fila, 1)
+
+    def rotar_derecha(self, fila: int) -> bool:
+        """Equivalente a `sixteen.rotar_derecha`."""
+        return self._rotar("filas", fila, -1)
+
+    def rotar_arriba(self, columna: int) -> bool:
+        """Equivalente a `sixteen.rotar_arriba`."""
+        return self._rotar("columnas", columna, 1)
+
+    def rotar_abajo(self, columna: int) -> bool:
+        """Equivalente a `sixteen.rotar_abajo`."""
+        return self._rotar("columnas", columna, -1)
+
+    def esta_ordenado(self) -> bool:
+        """Equivalente a `sixteen.esta_ordenado`."""
+        self._aplicar_pendientes()
+        return self._valores == list(range(1, len(self._valores) + 1))
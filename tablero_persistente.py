@@ -0,0 +1,190 @@
+"""
+Tablero inmutable del juego Sixteen que comparte estructura entre versiones
+"""
+
+from math import isqrt
+
+
+class _Fila:
+    """Fila inmutable: sus valores, partidos en segmentos de igual ancho, y
+    cuántos lugares está rotada hacia la izquierda."""
+
+    __slots__ = ("segmentos", "desplazamiento")
+
+    def __init__(self, segmentos: tuple[tuple[int, ...], ...], desplazamiento: int):
+        self.segmentos = segmentos
+        self.desplazamiento = desplazamiento
+
+
+class TableroPersistente:
+    """Tablero de Sixteen inmutable, pensado para búsquedas que ramifican.
+
+    Cada rotación devuelve un tablero nuevo y deja intacto el original, pero
+    sin copiarlo: el tablero nuevo comparte con el anterior todo lo que no
+    cambió. Rotar una fila crea sólo esa fila, que reutiliza los segmentos
+    de la anterior y cambia su desplazamiento. Rotar una columna crea, en
+    cada fila, el único segmento que contiene a la columna; los segmentos
+    miden alrededor de la raíz cuadrada de `n_columnas`, así que el costo es
+    O(n_filas * sqrt(n_columnas)) en lugar de O(n_filas * n_columnas).
+    """
+
+    __slots__ = ("n_filas", "n_columnas", "_ancho", "_filas", "_hash")
+
+    def __init__(self, n_filas: int, n_columnas: int, filas: tuple[_Fila, ...]):
+        """Construye un tablero a partir de sus filas ya armadas. Para crear
+        tableros usar `ordenado` o `desde_lista`."""
+        self.n_filas = n_filas
+        self.n_columnas = n_columnas
+        self._ancho = max(1, isqrt(n_columnas))
+        self._filas = filas
+        self._hash = None
+
+    @classmethod
+    def ordenado(cls, n_filas: int, n_columnas: int) -> "TableroPersistente":
+        """Equivalente persistente de `sixteen.crear_tablero`."""
+        return cls.desde_lista(
+            [
+                list(range(fila * n_columnas + 1, (fila + 1) * n_columnas + 1))
+                for fila in range(n_filas)
+            ]
+        )
+
+    @classmethod
+    def desde_lista(cls, tablero: list[list[int]]) -> "TableroPersistente":
+        """Crea un `TableroPersistente` con el contenido de un tablero del
+        módulo `sixteen`, sin modificar el original.
+
+        PRECONDICIONES:
+            - `tablero` es una lista no vacía de filas no vacías, todas del
+            mismo largo.
+        """
+        n_columnas = len(tablero[0])
+        ancho = max(1, isqrt(n_columnas))
+        filas = tuple(
+            _Fila(
+                tuple(tuple(fila[i : i + ancho]) for i in range(0, n_columnas, ancho)),
+                0,
+            )
+            for fila in tablero
+        )
+        return cls(len(tablero), n_columnas, filas)
+
+    def _fila(self, fila: int) -> list[int]:
+        """Valores visibles de la fila, de izquierda a derecha."""
+        datos = self._filas[fila]
+        valores = [valor for segmento in datos.segmentos for valor in segmento]
+        desplazamiento = datos.desplazamiento
+        return valores[desplazamiento:] + valores[:desplazamiento]
+
+    def _ubicacion(self, fila: int, columna: int) -> tuple[int, int]:
+        """Segmento y posición dentro del segmento del casillero que se ve
+        en `(fila, columna)`."""
+        fisica = (columna + self._filas[fila].desplazamiento) % self.n_columnas
+        return divmod(fisica, self._ancho)
+
+    def __getitem__(self, posicion: tuple[int, int]) -> int:
+        """Devuelve el valor del casillero `tablero[fila, columna]`."""
+        fila, columna = posicion
+        segmento, indice = self._ubicacion(fila, columna)
+        return self._filas[fila].segmentos[segmento][indice]
+
+    def a_lista(self) -> list[list[int]]:
+        """Devuelve el tablero como una nueva lista de listas de enteros."""
+        return [self._fila(fila) for fila in range(self.n_filas)]
+
+    def _con_fila(self, fila: int, nueva: _Fila) -> "TableroPersistente":
+        """Tablero igual a este salvo por la fila `fila`."""
+        filas = self._filas[:fila] + (nueva,) + self._filas[fila + 1 :]
+        return TableroPersistente(self.n_filas, self.n_columnas, filas)
+
+    def _rotar_fila(self, fila: int, paso: int) -> "TableroPersistente | None":
+        """Rota la fila un lugar hacia la izquierda (`paso=1`) o hacia la
+        derecha (`paso=-1`), compartiendo sus segmentos."""
+        if not 0 <= fila < self.n_filas:
+            return None
+        datos = self._filas[fila]
+        desplazamiento = (datos.desplazamiento + paso) % self.n_columnas
+        return self._con_fila(fila, _Fila(datos.segmentos, desplazamiento))
+
+    def rotar_izquierda(self, fila: int) -> "TableroPersistente | None":
+        """Equivalente a `sixteen.rotar_izquierda`. Devuelve el tablero
+        rotado, o `None` si `fila` no es un índice de filas válido."""
+        return self._rotar_fila(fila, 1)
+
+    def rotar_derecha(self, fila: int) -> "TableroPersistente | None":
+        """Equivalente a `sixteen.rotar_derecha`. Devuelve el tablero
+        rotado, o `None` si `fila` no es un índice de filas válido."""
+        return self._rotar_fila(fila, -1)
+
+    def _rotar_columna(self, columna: int, paso: int) -> "TableroPersistente | None":
+        """Rota la columna un lugar hacia arriba (`paso=1`) o hacia abajo
+        (`paso=-1`), rehaciendo sólo un segmento por fila."""
+        if not 0 <= columna < self.n_columnas:
+            return None
+        ubicaciones = [self._ubicacion(fila, columna) for fila in range(self.n_filas)]
+        valores = [
+            self._filas[fila].segmentos[segmento][indice]
+            for fila, (segmento, indice) in enumerate(ubicaciones)
+        ]
+
+        filas = []
+        for fila, (segmento, indice) in enumerate(ubicaciones):
+            datos = self._filas[fila]
+            viejo = datos.segmentos[segmento]
+            nuevo = (
+                viejo[:indice]
+                + (valores[(fila + paso) % self.n_filas],)
+                + viejo[indice + 1 :]
+            )
+            segmentos = (
+                datos.segmentos[:segmento] + (nuevo,) + datos.segmentos[segmento + 1 :]
+            )
+            filas.append(_Fila(segmentos, datos.desplazamiento))
+        return TableroPersistente(self.n_filas, self.n_columnas, tuple(filas))
+
+    def rotar_arriba(self, columna: int) -> "TableroPersistente | None":
+        """Equivalente a `sixteen.rotar_arriba`. Devuelve el tablero rotado,
+        o `None` si `columna` no es un índice de columnas válido."""
+        return self._rotar_columna(columna, 1)
+
+    def rotar_abajo(self, columna: int) -> "TableroPersistente | None":
+        """Equivalente a `sixteen.rotar_abajo`. Devuelve el tablero rotado,
+        o `None` si `columna` no es un índice de columnas válido."""
+        return self._rotar_columna(columna, -1)
+
+    def aplicar(self, direccion: str, indice: int) -> "TableroPersistente | None":
+        """Aplica un movimiento en la notación w/a/s/d de la interfaz."""
+        if direccion == "w":
+            return self.rotar_arriba(indice)
+        if direccion == "a":
+            return self.rotar_izquierda(indice)
+        if direccion == "s":
+            return self.rotar_abajo(indice)
+        if direccion == "d":
+            return self.rotar_derecha(indice)
+        return None
+
+    def esta_ordenado(self) -> bool:
+        """Equivalente a `sixteen.esta_ordenado`."""
+        for fila in range(self.n_filas):
+            inicio = fila * self.n_columnas + 1
+            if self._fila(fila) != list(range(inicio, inicio + self.n_columnas)):
+                return False
+        return True
+
+    def __eq__(self, otro: object) -> bool:
+        if not isinstance(otro, TableroPersistente):
+            return NotImplemented
+        return (
+            self.n_filas == otro.n_filas
+            and self.n_columnas == otro.n_columnas
+            and self.a_lista() == otro.a_lista()
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(tuple(fila) for fila in self.a_lista()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"TableroPersistente.desde_lista({self.a_lista()!r})"
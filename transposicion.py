@@ -0,0 +1,120 @@
+"""
+Tabla de transposición de tamaño acotado para búsquedas sobre tableros
+"""
+
+from typing import Any
+
+# Memoria aproximada que ocupa cada entrada además de su clave: la entrada
+# del diccionario, las referencias en las listas y el valor guardado.
+BYTES_POR_ENTRADA = 200
+
+
+class TablaTransposicion:
+    """Diccionario de capacidad fija para recordar estados ya visitados.
+
+    Cuando la tabla está llena, la entrada a desalojar se elige con el
+    algoritmo del reloj: una manecilla recorre las entradas en orden
+    circular, perdonando una vez a las que se consultaron desde la última
+    pasada. Así se aproxima a desalojar la menos usada recientemente sin el
+    costo de mantener un orden exacto. Las claves pueden ser cualquier valor
+    hasheable; con los `bytes` de `TableroCompacto` (o los estados de
+    `sixteen.resolver`) cada entrada ocupa muy poco.
+    """
+
+    __slots__ = (
+        "capacidad",
+        "aciertos",
+        "fallos",
+        "desalojos",
+        "_posiciones",
+        "_claves",
+        "_valores",
+        "_usadas",
+        "_manecilla",
+    )
+
+    def __init__(self, capacidad: int):
+        """Crea una tabla vacía con lugar para `capacidad` entradas.
+
+        PRECONDICIONES:
+            - `capacidad` es un entero positivo.
+        """
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self._posiciones = {}
+        self._claves = []
+        self._valores = []
+        self._usadas = bytearray(capacidad)
+        self._manecilla = 0
+
+    @classmethod
+    def desde_presupuesto(
+        cls, presupuesto_bytes: int, bytes_por_clave: int
+    ) -> "TablaTransposicion":
+        """Crea una tabla cuya capacidad entra aproximadamente en
+        `presupuesto_bytes` bytes, con claves de `bytes_por_clave` bytes."""
+        return cls(max(1, presupuesto_bytes // (bytes_por_clave + BYTES_POR_ENTRADA)))
+
+    def obtener(self, clave: Any, defecto: Any = None) -> Any:
+        """Devuelve el valor guardado para `clave`, o `defecto` si no está.
+        Cuenta la consulta como acierto o como fallo."""
+        posicion = self._posiciones.get(clave)
+        if posicion is None:
+            self.fallos += 1
+            return defecto
+        self.aciertos += 1
+        self._usadas[posicion] = 1
+        return self._valores[posicion]
+
+    def guardar(self, clave: Any, valor: Any) -> None:
+        """Guarda `valor` para `clave`, desalojando otra entrada si la tabla
+        está llena."""
+        posicion = self._posiciones.get(clave)
+        if posicion is not None:
+            self._valores[posicion] = valor
+            self._usadas[posicion] = 1
+            return
+
+        if len(self._claves) < self.capacidad:
+            self._posiciones[clave] = len(self._claves)
+            self._claves.append(clave)
+            self._valores.append(valor)
+            return
+
+        while self._usadas[self._manecilla]:
+            self._usadas[self._manecilla] = 0
+            self._manecilla = (self._manecilla + 1) % self.capacidad
+        posicion = self._manecilla
+        del self._posiciones[self._claves[posicion]]
+        self.desalojos += 1
+
+        self._posiciones[clave] = posicion
+        self._claves[posicion] = clave
+        self._valores[posicion] = valor
+        self._manecilla = (posicion + 1) % self.capacidad
+
+    def __contains__(self, clave: Any) -> bool:
+        return clave in self._posiciones
+
+    def __len__(self) -> int:
+        return len(self._claves)
+
+    def limpiar(self) -> None:
+        """Vacía la tabla sin reiniciar los contadores."""
+        self._posiciones.clear()
+        self._claves.clear()
+        self._valores.clear()
+        self._usadas = bytearray(self.capacidad)
+        self._manecilla = 0
+
+    def estadisticas(self) -> dict[str, int]:
+        """Devuelve los contadores de aciertos, fallos y desalojos."""
+        return {
+            "entradas": len(self._claves),
+            "capacidad": self.capacidad,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+        }